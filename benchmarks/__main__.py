@@ -0,0 +1,133 @@
+"""Runs the benchmark suite or compares two benchmark results files.
+
+Usage::
+
+    python -m benchmarks run --output results.json
+    python -m benchmarks run --filter parser --repeat 3
+    python -m benchmarks compare baseline.json results.json --threshold 0.1
+
+compare exits with status 1 if the throughput of any benchmark dropped by more than
+the threshold, or if a benchmark in the baseline is missing from the current results
+(e.g. it was renamed, removed, or filtered out), so it can fail a CI job.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from benchmarks import corpus
+from benchmarks.runner import DEFAULT_MIN_TIME
+from benchmarks.runner import DEFAULT_REPEAT
+from benchmarks.runner import DEFAULT_THRESHOLD
+from benchmarks.runner import BenchmarkResult
+from benchmarks.runner import compare_results
+from benchmarks.runner import find_missing_results
+from benchmarks.runner import load_results
+from benchmarks.runner import run_benchmarks
+from benchmarks.runner import save_results
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """Run the command line interface.
+
+    :param arguments: The command line arguments, defaults to sys.argv.
+    :return: The exit status.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("-o", "--output", help="write the results to a JSON file")
+    run_parser.add_argument(
+        "-k",
+        "--filter",
+        help="only run benchmarks whose name or group matches this regular expression",
+    )
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run_parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    run_parser.add_argument("--seed", type=int, default=corpus.DEFAULT_SEED)
+
+    compare_parser = commands.add_parser(
+        "compare",
+        help="compare two results files and fail if throughput dropped",
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="the largest allowed drop in throughput, as a fraction (default: 0.1)",
+    )
+
+    options = parser.parse_args(arguments)
+
+    if options.command == "run":
+        return _run(options)
+
+    return _compare(options)
+
+
+def _run(options: argparse.Namespace) -> int:
+    # Imported here so that compare doesn't need to build the benchmark inputs.
+    from benchmarks.suite import get_benchmarks  # noqa: PLC0415
+
+    results: list[BenchmarkResult] = run_benchmarks(
+        get_benchmarks(options.seed),
+        pattern=options.filter,
+        repeat=options.repeat,
+        min_time=options.min_time,
+        progress=_print_result,
+    )
+
+    if options.output:
+        save_results(results, options.output)
+
+    return 0
+
+
+def _compare(options: argparse.Namespace) -> int:
+    baseline: dict[str, float] = load_results(options.baseline)
+    current: dict[str, float] = load_results(options.current)
+    comparisons = compare_results(baseline, current, options.threshold)
+    missing: list[str] = find_missing_results(baseline, current)
+    regressions: int = 0
+
+    for comparison in comparisons:
+        status: str = "REGRESSION" if comparison.is_regression else "ok"
+        regressions += comparison.is_regression
+        print(  # noqa: T201
+            f"{comparison.name:<40} {comparison.baseline:>14,.0f} "
+            f"{comparison.current:>14,.0f} {comparison.change:>+8.1%}  {status}",
+        )
+
+    for name in missing:
+        print(  # noqa: T201
+            f"{name:<40} {baseline[name]:>14,.0f} {'-':>14} {'-':>8}  MISSING",
+        )
+
+    if missing:
+        print(  # noqa: T201
+            f"{len(missing)} benchmark(s) are missing from {options.current}.",
+            file=sys.stderr,
+        )
+
+    if regressions:
+        print(  # noqa: T201
+            f"{regressions} benchmark(s) dropped by more than {options.threshold:.0%}.",
+            file=sys.stderr,
+        )
+
+    return 1 if regressions or missing else 0
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    print(  # noqa: T201
+        f"{result.name:<40} {result.operations_per_second:>14,.0f} ops/s "
+        f"(best {result.best * 1e6:,.1f} us, median {result.median * 1e6:,.1f} us)",
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
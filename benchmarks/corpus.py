@@ -0,0 +1,252 @@
+"""Generates a synthetic corpus of texts that contain scripture references.
+
+The references are built from the books of the Bible (by title and abbreviation) and
+the book groups, with valid chapter and verse numbers, so the texts exercise the same
+code paths as real documents (sermons, commentaries, study notes) without needing any
+copyrighted text. Every generator takes a random.Random, so the same seed always
+generates the same corpus.
+"""
+
+from __future__ import annotations
+
+import random
+from functools import cache
+
+import pythonbible as bible
+from tests.conftest import build_bible
+
+DEFAULT_SEED = 20250101
+
+FILLER_WORDS: tuple[str, ...] = (
+    "the",
+    "and",
+    "of",
+    "to",
+    "that",
+    "in",
+    "he",
+    "shall",
+    "unto",
+    "for",
+    "i",
+    "his",
+    "a",
+    "lord",
+    "they",
+    "be",
+    "is",
+    "him",
+    "not",
+    "them",
+    "it",
+    "with",
+    "all",
+    "thou",
+    "thy",
+    "was",
+    "god",
+    "which",
+    "my",
+    "me",
+    "said",
+    "but",
+    "ye",
+    "their",
+    "have",
+    "will",
+    "thee",
+    "from",
+    "as",
+    "are",
+    "when",
+    "this",
+    "out",
+    "were",
+    "upon",
+    "man",
+    "by",
+    "you",
+    "israel",
+    "king",
+    "son",
+    "up",
+    "there",
+    "hath",
+    "then",
+    "people",
+    "came",
+    "had",
+    "house",
+    "on",
+    "into",
+    "her",
+    "come",
+    "one",
+    "we",
+    "children",
+    "before",
+    "your",
+)
+
+
+@cache
+def get_book_names(book: bible.Book) -> tuple[str, ...]:
+    """Return the ways the given book can be written in a reference.
+
+    :param book: A book of the Bible.
+    :return: The title of the book and its abbreviations (with and without a
+             period), with the number of a numbered book (e.g. "1 John").
+    """
+    prefix: str = f"{book.title.split()[0]} " if book.title[0].isdigit() else ""
+    book_names: tuple[str, ...] = (
+        book.title,
+        *(f"{prefix}{abbreviation}" for abbreviation in book.abbreviations),
+        *(f"{prefix}{abbreviation}." for abbreviation in book.abbreviations),
+    )
+
+    # Leave out any names the parser doesn't recognize as the book, so that every
+    # generated reference is found.
+    return tuple(
+        book_name for book_name in book_names if _is_book_name(book, book_name)
+    )
+
+
+def _is_book_name(book: bible.Book, book_name: str) -> bool:
+    for reference_text in (f"{book_name} 1", f"{book_name} 1:1-2"):
+        try:
+            references = bible.get_references(reference_text)
+        except ValueError:
+            return False
+
+        if [reference.book for reference in references] != [book]:
+            return False
+
+    return True
+
+
+@cache
+def get_book_group_names() -> tuple[str, ...]:
+    """Return the names of the book groups (e.g. "Gospels").
+
+    :return: The first name of each book group.
+    """
+    return tuple(
+        book_group.regular_expression.split("|")[0] for book_group in bible.BookGroup
+    )
+
+
+def generate_reference(rng: random.Random) -> str:
+    """Return the text of a random, valid scripture reference.
+
+    The reference is a whole chapter, a verse, a range of verses, a range of chapters,
+    or a list of verses, and the book is written as its title or an abbreviation.
+
+    :param rng: The random number generator.
+    :return: The text of the reference.
+    """
+    book: bible.Book = rng.choice(list(bible.Book))
+    book_name: str = rng.choice(get_book_names(book))
+    number_of_chapters: int = bible.get_number_of_chapters(book)
+    chapter: int = rng.randint(1, number_of_chapters)
+    number_of_verses: int = bible.get_number_of_verses(book, chapter)
+    verse: int = rng.randint(1, number_of_verses)
+    form: int = rng.randrange(5)
+
+    if form == 0:
+        return f"{book_name} {chapter}"
+
+    if form == 1:
+        return f"{book_name} {chapter}:{verse}"
+
+    if form == 2 and verse < number_of_verses:  # noqa: PLR2004
+        end_verse: int = rng.randint(verse + 1, number_of_verses)
+        return f"{book_name} {chapter}:{verse}-{end_verse}"
+
+    if form == 3 and chapter < number_of_chapters:  # noqa: PLR2004
+        end_chapter: int = rng.randint(chapter + 1, number_of_chapters)
+        last_verse: int = rng.randint(1, bible.get_number_of_verses(book, end_chapter))
+        return f"{book_name} {chapter}:{verse}-{end_chapter}:{last_verse}"
+
+    verses: list[int] = sorted(
+        rng.sample(range(1, number_of_verses + 1), min(3, number_of_verses)),
+    )
+    return f"{book_name} {chapter}:{', '.join(map(str, verses))}"
+
+
+def generate_references(rng: random.Random, count: int) -> list[str]:
+    """Return the texts of the given number of random scripture references.
+
+    :param rng: The random number generator.
+    :param count: The number of references.
+    :return: The texts of the references.
+    """
+    return [generate_reference(rng) for _ in range(count)]
+
+
+def generate_document(
+    rng: random.Random,
+    number_of_words: int = 1_000,
+    reference_density: float = 0.02,
+    book_group_density: float = 0.001,
+) -> str:
+    """Return a document of filler words with scripture references mixed in.
+
+    :param rng: The random number generator.
+    :param number_of_words: The number of filler words in the document.
+    :param reference_density: The chance of a reference after each word.
+    :param book_group_density: The chance of a book group name after each word.
+    :return: The text of the document.
+    """
+    words: list[str] = []
+
+    for word in rng.choices(FILLER_WORDS, k=number_of_words):
+        words.append(word)
+        chance: float = rng.random()
+
+        if chance < reference_density:
+            words.append(f"({generate_reference(rng)})")
+        elif chance < reference_density + book_group_density:
+            words.append(rng.choice(get_book_group_names()))
+
+    return " ".join(words)
+
+
+def generate_corpus(
+    seed: int = DEFAULT_SEED,
+    number_of_documents: int = 20,
+    number_of_words: int = 1_000,
+) -> list[str]:
+    """Return a list of documents with scripture references mixed in.
+
+    :param seed: The seed of the random number generator.
+    :param number_of_documents: The number of documents.
+    :param number_of_words: The number of filler words in each document.
+    :return: The texts of the documents.
+    """
+    rng = random.Random(seed)
+    return [generate_document(rng, number_of_words) for _ in range(number_of_documents)]
+
+
+def generate_bible(
+    rng: random.Random,
+    version: bible.Version = bible.Version.AMERICAN_STANDARD,
+    *,
+    is_html: bool = False,
+    words_per_verse: int = 25,
+) -> bible.Bible:
+    """Return a Bible with filler text for every verse.
+
+    :param rng: The random number generator.
+    :param version: The version of the Bible.
+    :param is_html: True to wrap each verse in a paragraph tag.
+    :param words_per_verse: The number of filler words in each verse.
+    :return: The Bible.
+    """
+    return build_bible(
+        {
+            verse_id: " ".join(rng.choices(FILLER_WORDS, k=words_per_verse))
+            for verse_id in bible.verses.get_all_verse_ids()
+        },
+        version,
+        is_html=is_html,
+    )
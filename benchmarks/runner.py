@@ -0,0 +1,290 @@
+"""Runs benchmarks and saves and compares their results.
+
+Each benchmark is timed with timeit: the number of calls per measurement is chosen so
+that a measurement takes at least a minimum time, the measurement is repeated, and
+the fastest measurement is used (the slower ones are mostly noise from the rest of
+the machine). Throughput is reported as operations per second, where an operation is
+whatever the benchmark processes (a reference, a verse id, a document, ...).
+
+Results are saved as JSON:
+
+.. code-block:: json
+
+    {
+        "format_version": 1,
+        "pythonbible": "0.15.0",
+        "python": "3.13.0",
+        "platform": "Linux-6.8.0-x86_64-with-glibc2.39",
+        "created": "2025-01-01T00:00:00+00:00",
+        "benchmarks": [
+            {
+                "name": "get_references",
+                "group": "parser",
+                "operations": 100,
+                "number": 50,
+                "times": [0.21, 0.2, 0.22],
+                "best": 0.004,
+                "median": 0.0042,
+                "operations_per_second": 25000.0
+            }
+        ]
+    }
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import re
+import statistics
+import timeit
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pythonbible as bible
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+RESULTS_FORMAT_VERSION = 1
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.2
+DEFAULT_THRESHOLD = 0.1
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A function to time and the number of operations each call performs.
+
+    :param name: the unique name of the benchmark
+    :param group: the area of the library the benchmark covers (e.g. "parser")
+    :param function: the function to time, called with no arguments
+    :param operations: the number of operations performed by each call
+    """
+
+    name: str
+    group: str
+    function: Callable[[], object]
+    operations: int = 1
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """The timings of a benchmark.
+
+    :param name: the name of the benchmark
+    :param group: the area of the library the benchmark covers
+    :param operations: the number of operations performed by each call
+    :param number: the number of calls in each measurement
+    :param times: the total time of each measurement, in seconds
+    """
+
+    name: str
+    group: str
+    operations: int
+    number: int
+    times: tuple[float, ...]
+
+    @property
+    def best(self: BenchmarkResult) -> float:
+        """Return the time of the fastest call, in seconds."""
+        return min(self.times) / self.number
+
+    @property
+    def median(self: BenchmarkResult) -> float:
+        """Return the median time of a call, in seconds."""
+        return statistics.median(self.times) / self.number
+
+    @property
+    def operations_per_second(self: BenchmarkResult) -> float:
+        """Return the throughput of the fastest measurement."""
+        return self.operations / self.best
+
+    def to_json(self: BenchmarkResult) -> dict[str, Any]:
+        """Return the result as a JSON object."""
+        return {
+            "name": self.name,
+            "group": self.group,
+            "operations": self.operations,
+            "number": self.number,
+            "times": list(self.times),
+            "best": self.best,
+            "median": self.median,
+            "operations_per_second": self.operations_per_second,
+        }
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """The change in throughput of a benchmark between two runs.
+
+    :param name: the name of the benchmark
+    :param baseline: the operations per second in the baseline run
+    :param current: the operations per second in the current run
+    :param threshold: the largest allowed drop in throughput, as a fraction
+    """
+
+    name: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def change(self: Comparison) -> float:
+        """Return the change in throughput as a fraction (e.g. -0.25 is 25% slower)."""
+        return self.current / self.baseline - 1
+
+    @property
+    def is_regression(self: Comparison) -> bool:
+        """Return True if the throughput dropped by more than the threshold."""
+        return self.change < -self.threshold
+
+
+def run_benchmark(
+    benchmark: Benchmark,
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> BenchmarkResult:
+    """Time the given benchmark.
+
+    :param benchmark: The benchmark to time.
+    :param repeat: The number of measurements.
+    :param min_time: The minimum time of each measurement, in seconds.
+    :return: The timings of the benchmark.
+    """
+    timer = timeit.Timer(benchmark.function)
+    number: int = 1
+
+    # Like Timer.autorange, but with a configurable minimum time.
+    while (elapsed := timer.timeit(number)) < min_time:
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+
+    return BenchmarkResult(
+        name=benchmark.name,
+        group=benchmark.group,
+        operations=benchmark.operations,
+        number=number,
+        times=(elapsed, *timer.repeat(repeat - 1, number)),
+    )
+
+
+def run_benchmarks(
+    benchmarks: Iterable[Benchmark],
+    pattern: str | None = None,
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = DEFAULT_MIN_TIME,
+    progress: Callable[[BenchmarkResult], None] | None = None,
+) -> list[BenchmarkResult]:
+    """Time each of the given benchmarks.
+
+    :param benchmarks: The benchmarks to time.
+    :param pattern: Only time the benchmarks whose names or groups match this regular
+                    expression, defaults to all of them.
+    :param repeat: The number of measurements of each benchmark.
+    :param min_time: The minimum time of each measurement, in seconds.
+    :param progress: Called with the result of each benchmark as it finishes.
+    :return: The timings of the benchmarks.
+    """
+    results: list[BenchmarkResult] = []
+
+    for benchmark in benchmarks:
+        if pattern and not (
+            re.search(pattern, benchmark.name) or re.search(pattern, benchmark.group)
+        ):
+            continue
+
+        result: BenchmarkResult = run_benchmark(benchmark, repeat, min_time)
+        results.append(result)
+
+        if progress is not None:
+            progress(result)
+
+    return results
+
+
+def save_results(
+    results: Iterable[BenchmarkResult],
+    path: str | os.PathLike[str],
+) -> Path:
+    """Write the given results, along with the versions used, to a JSON file.
+
+    :param results: The timings of the benchmarks.
+    :param path: The path of the JSON file.
+    :return: The path of the JSON file.
+    """
+    results_path = Path(path)
+    results_path.write_text(
+        json.dumps(
+            {
+                "format_version": RESULTS_FORMAT_VERSION,
+                "pythonbible": bible.__version__,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "created": datetime.now(timezone.utc).isoformat(),
+                "benchmarks": [result.to_json() for result in results],
+            },
+            indent=4,
+        ),
+        encoding="utf-8",
+    )
+    return results_path
+
+
+def load_results(path: str | os.PathLike[str]) -> dict[str, float]:
+    """Return the operations per second of each benchmark in a JSON results file.
+
+    :param path: The path of the JSON file.
+    :return: The operations per second by benchmark name.
+    :raises ValueError: if the file was written by an incompatible version
+    """
+    results: dict[str, Any] = json.loads(Path(path).read_text(encoding="utf-8"))
+
+    if results.get("format_version") != RESULTS_FORMAT_VERSION:
+        error_message = f"{path} is not a compatible benchmark results file."
+        raise ValueError(error_message)
+
+    return {
+        result["name"]: result["operations_per_second"]
+        for result in results["benchmarks"]
+    }
+
+
+def compare_results(
+    baseline: dict[str, float],
+    current: dict[str, float],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Comparison]:
+    """Compare the throughput of the benchmarks that are in both runs.
+
+    Benchmarks that are only in the current run are new and are not compared; use
+    find_missing_results to find the benchmarks that are only in the baseline run.
+
+    :param baseline: The operations per second by benchmark name of the baseline run.
+    :param current: The operations per second by benchmark name of the current run.
+    :param threshold: The largest allowed drop in throughput, as a fraction.
+    :return: The comparison of each benchmark, in the order of the current run.
+    """
+    return [
+        Comparison(name, baseline[name], operations_per_second, threshold)
+        for name, operations_per_second in current.items()
+        if name in baseline
+    ]
+
+
+def find_missing_results(
+    baseline: dict[str, float],
+    current: dict[str, float],
+) -> list[str]:
+    """Return the benchmarks of the baseline run that are not in the current run.
+
+    :param baseline: The operations per second by benchmark name of the baseline run.
+    :param current: The operations per second by benchmark name of the current run.
+    :return: The names of the missing benchmarks, in the order of the baseline run.
+    """
+    return [name for name in baseline if name not in current]
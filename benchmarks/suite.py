@@ -0,0 +1,300 @@
+"""Defines the benchmarks of the public API and of end to end workloads.
+
+The import benchmark times importing pythonbible in a fresh interpreter. The
+microbenchmarks time each public function on inputs from the synthetic corpus.
+The end to end benchmarks time the work an application does with a whole document:
+finding its references and then converting, counting, or formatting them.
+
+The scripture text of the installed Bibles is not available in every environment, so
+the formatting benchmarks use synthetic Bibles (filler words for every verse) that are
+added with add_bible. Only run the suite in a process of its own.
+"""
+
+from __future__ import annotations
+
+import random
+import subprocess
+import sys
+from functools import partial
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pythonbible as bible
+from benchmarks import corpus
+from benchmarks.runner import Benchmark
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+NUMBER_OF_REFERENCES = 200
+NUMBER_OF_VERSE_IDS = 1_000
+NUMBER_OF_DOCUMENTS = 20
+WORDS_PER_DOCUMENT = 1_000
+BIBLE_VERSION = bible.Version.AMERICAN_STANDARD
+
+
+def get_benchmarks(seed: int = corpus.DEFAULT_SEED) -> list[Benchmark]:
+    """Return the benchmarks, with inputs generated from the given seed.
+
+    :param seed: The seed of the random number generator.
+    :return: The microbenchmarks followed by the end to end benchmarks.
+    """
+    rng = random.Random(seed)
+    _add_synthetic_bibles(rng)
+
+    reference_texts: list[str] = corpus.generate_references(rng, NUMBER_OF_REFERENCES)
+    references_text: str = "; ".join(reference_texts)
+    references: list[bible.NormalizedReference] = bible.get_references(
+        references_text,
+    )
+    verse_ids: list[int] = bible.convert_references_to_verse_ids(references)
+    sample_verse_ids: list[int] = rng.sample(
+        bible.verses.get_all_verse_ids(),
+        NUMBER_OF_VERSE_IDS,
+    )
+    sample_ordinals: list[int] = [
+        bible.get_verse_ordinal(verse_id) for verse_id in sample_verse_ids
+    ]
+    passage_verse_ids: list[int] = bible.convert_references_to_verse_ids(
+        bible.get_references("Romans 8; John 3:1-21; Psalm 119"),
+    )
+    documents: list[str] = corpus.generate_corpus(
+        seed,
+        NUMBER_OF_DOCUMENTS,
+        WORDS_PER_DOCUMENT,
+    )
+    reference_array = bible.ReferenceArray(references)
+    search_index: bible.SearchIndex = bible.build_search_index(
+        bible.get_bible(BIBLE_VERSION, "plain_text"),
+    )
+
+    return [
+        # Import
+        Benchmark("import_pythonbible", "import", _import_pythonbible, 1),
+        # Parser
+        Benchmark(
+            "get_references",
+            "parser",
+            partial(bible.get_references, references_text),
+            len(references),
+        ),
+        Benchmark(
+            "get_references_state_machine",
+            "parser",
+            partial(bible.get_references, references_text, parser="state_machine"),
+            len(references),
+        ),
+        Benchmark(
+            "get_references_book_groups",
+            "parser",
+            partial(bible.get_references, documents[0], bible.BOOK_GROUPS),
+            1,
+        ),
+        Benchmark(
+            "normalize_reference",
+            "parser",
+            _call_each(bible.normalize_reference, reference_texts),
+            len(reference_texts),
+        ),
+        # Converter
+        Benchmark(
+            "convert_references_to_verse_ids",
+            "converter",
+            partial(bible.convert_references_to_verse_ids, references),
+            len(references),
+        ),
+        Benchmark(
+            "convert_verse_ids_to_references",
+            "converter",
+            partial(bible.convert_verse_ids_to_references, verse_ids),
+            len(verse_ids),
+        ),
+        # Verses and validation
+        Benchmark(
+            "get_book_chapter_verse",
+            "verses",
+            _call_each(bible.get_book_chapter_verse, sample_verse_ids),
+            len(sample_verse_ids),
+        ),
+        Benchmark(
+            "get_verse_ordinal",
+            "verses",
+            _call_each(bible.get_verse_ordinal, sample_verse_ids),
+            len(sample_verse_ids),
+        ),
+        Benchmark(
+            "get_book_chapter_verse_by_ordinal",
+            "verses",
+            _call_each(bible.get_book_chapter_verse_by_ordinal, sample_ordinals),
+            len(sample_ordinals),
+        ),
+        Benchmark(
+            "is_valid_verse_id",
+            "validator",
+            _call_each(bible.is_valid_verse_id, sample_verse_ids),
+            len(sample_verse_ids),
+        ),
+        Benchmark(
+            "is_valid_reference",
+            "validator",
+            _call_each(bible.is_valid_reference, references),
+            len(references),
+        ),
+        # Counters
+        Benchmark(
+            "count_books",
+            "counters",
+            partial(bible.count_books, references),
+            len(references),
+        ),
+        Benchmark(
+            "count_chapters",
+            "counters",
+            partial(bible.count_chapters, references),
+            len(references),
+        ),
+        Benchmark(
+            "count_verses",
+            "counters",
+            partial(bible.count_verses, references),
+            len(references),
+        ),
+        Benchmark(
+            "count_verses_reference_array",
+            "counters",
+            partial(bible.count_verses, reference_array),
+            len(reference_array),
+        ),
+        Benchmark(
+            "verse_histogram",
+            "counters",
+            partial(bible.VerseHistogram, reference_array),
+            len(reference_array),
+        ),
+        # Formatter
+        Benchmark(
+            "format_scripture_references",
+            "formatter",
+            partial(bible.format_scripture_references, references),
+            len(references),
+        ),
+        Benchmark(
+            "format_single_reference",
+            "formatter",
+            _call_each(bible.format_single_reference, references),
+            len(references),
+        ),
+        Benchmark(
+            "format_scripture_text_html",
+            "formatter",
+            partial(bible.format_scripture_text, passage_verse_ids),
+            len(passage_verse_ids),
+        ),
+        Benchmark(
+            "format_scripture_text_plain_text",
+            "formatter",
+            partial(
+                bible.format_scripture_text,
+                passage_verse_ids,
+                format_type="plain_text",
+                include_verse_numbers=False,
+            ),
+            len(passage_verse_ids),
+        ),
+        Benchmark(
+            "get_verse_text",
+            "formatter",
+            _call_each(bible.get_verse_text, sample_verse_ids),
+            len(sample_verse_ids),
+        ),
+        # Search
+        Benchmark(
+            "search_term",
+            "search",
+            partial(search_index.search_term, "lord"),
+            1,
+        ),
+        Benchmark(
+            "search_phrase",
+            "search",
+            partial(search_index.search_phrase, "the lord"),
+            1,
+        ),
+        # End to end
+        Benchmark(
+            "scan_documents",
+            "end_to_end",
+            _call_each(bible.get_references, documents),
+            len(documents),
+        ),
+        Benchmark(
+            "scan_and_count_documents",
+            "end_to_end",
+            _call_each(_scan_and_count, documents),
+            len(documents),
+        ),
+        Benchmark(
+            "scan_and_format_documents",
+            "end_to_end",
+            _call_each(_scan_and_format, documents),
+            len(documents),
+        ),
+        Benchmark(
+            "scan_and_format_text_documents",
+            "end_to_end",
+            _call_each(_scan_and_format_text, documents),
+            len(documents),
+        ),
+    ]
+
+
+def _call_each(
+    function: Callable[[Any], object],
+    items: list[Any],
+) -> Callable[[], None]:
+    def call_each() -> None:
+        for item in items:
+            function(item)
+
+    return call_each
+
+
+def _import_pythonbible() -> None:
+    # Importing in a fresh interpreter also times the interpreter's startup, which is
+    # the same in both runs of a comparison.
+    subprocess.run(  # noqa: S603
+        [sys.executable, "-c", "import pythonbible"],
+        check=True,
+    )
+
+
+def _add_synthetic_bibles(rng: random.Random) -> None:
+    bible.add_bible(
+        BIBLE_VERSION,
+        "plain_text",
+        corpus.generate_bible(rng, BIBLE_VERSION),
+    )
+    bible.add_bible(
+        BIBLE_VERSION,
+        "html",
+        corpus.generate_bible(rng, BIBLE_VERSION, is_html=True),
+    )
+
+
+def _scan_and_count(document: str) -> int:
+    return bible.count_verses(bible.get_references(document))
+
+
+def _scan_and_format(document: str) -> str:
+    references: list[bible.NormalizedReference] = bible.get_references(document)
+    verse_ids: list[int] = bible.convert_references_to_verse_ids(references)
+    return bible.format_scripture_references(
+        bible.convert_verse_ids_to_references(verse_ids),
+    )
+
+
+def _scan_and_format_text(document: str) -> str:
+    references: list[bible.NormalizedReference] = bible.get_references(document)
+    return bible.format_scripture_text(
+        bible.convert_references_to_verse_ids(references[:5]),
+    )
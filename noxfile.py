@@ -19,3 +19,9 @@ def coverage(session: nox.Session) -> None:
     session.install("coverage[toml]", PYTEST)
     session.run(COVERAGE, "run", "-m", PYTEST)
     session.run(COVERAGE, "report", "--show-missing")
+
+
+@nox.session(python=["3.13"])
+def benchmarks(session: nox.Session) -> None:
+    session.install(".")
+    session.run("python", "-m", "benchmarks", *(session.posargs or ["run"]))
@@ -11,12 +11,28 @@ from __future__ import annotations
 __version__ = "0.15.0"
 
 from .bible import add_bible
+from .bible import configure_bible_cache
 from .bible import get_bible
+from .bible import get_bible_cache_info
+from .bible import get_search_index
 from .bible.bible import Bible
+from .bible.compiled_bible import CompiledBible
+from .bible.compiled_bible import compile_bible
+from .bible.compiled_bible import load_compiled_bible
+from .bible.errors import InvalidCompiledBibleError
+from .bible.errors import InvalidSearchIndexError
 from .bible.errors import VersionMissingVerseError
+from .bible.search_index import SearchIndex
+from .bible.search_index import build_search_index
+from .bible.search_index import load_search_index
 from .book_groups import BOOK_GROUPS
 from .book_groups import BookGroup
 from .books import Book
+from .cache import CacheInfo
+from .cache import clear_caches
+from .cache import configure_cache
+from .cache import get_cache_info
+from .cache import warm_caches
 from .converter import convert_reference_to_verse_ids
 from .converter import convert_references_to_verse_ids
 from .converter import convert_verse_ids_to_references
@@ -32,22 +48,52 @@ from .errors import MissingVerseFileError
 from .formatter import format_scripture_references
 from .formatter import format_scripture_text
 from .formatter import format_single_reference
+from .formatter import get_scripture_text_bible_type
 from .formatter import get_verse_text
+from .formatter import iter_scripture_text
+from .formatter import write_scripture_bytes
+from .formatter import write_scripture_text
+from .histogram import VerseHistogram
+from .instrumentation import StageStatistics
+from .instrumentation import disable_instrumentation
+from .instrumentation import enable_instrumentation
+from .instrumentation import get_instrumentation_statistics
+from .instrumentation import instrument
+from .instrumentation import reset_instrumentation_statistics
 from .normalized_reference import NormalizedReference
+from .parser import clear_reference_cache
+from .parser import configure_reference_cache
+from .parser import get_reference_cache_info
 from .parser import get_references
+from .parser import get_references_batch
+from .parser import iter_references_batch
 from .parser import normalize_reference
+from .reference_array import ReferenceArray
 from .validator import is_valid_book
 from .validator import is_valid_chapter
 from .validator import is_valid_reference
 from .validator import is_valid_verse
 from .validator import is_valid_verse_id
 from .verses import get_book_chapter_verse
+from .verses import get_book_chapter_verse_by_ordinal
 from .verses import get_book_number
+from .verses import get_chapter_index
+from .verses import get_chapter_index_by_ordinal
 from .verses import get_chapter_number
+from .verses import get_chapter_ordinals
 from .verses import get_number_of_chapters
 from .verses import get_number_of_verses
 from .verses import get_verse_id
+from .verses import get_verse_id_by_ordinal
 from .verses import get_verse_number
+from .verses import get_verse_ordinal
+from .versification import Versification
+from .versification import VersificationMapping
+from .versification import add_versification
+from .versification import add_versification_mapping
+from .versification import get_versification
+from .versification import get_versification_mapping
+from .versification import map_verse_ids
 from .versions import Version
 
 __all__ = [
@@ -55,52 +101,114 @@ __all__ = [
     "Bible",
     "Book",
     "BookGroup",
+    "CacheInfo",
+    "CompiledBible",
     "InvalidBibleParserError",
     "InvalidBookError",
     "InvalidChapterError",
+    "InvalidCompiledBibleError",
+    "InvalidSearchIndexError",
     "InvalidVerseError",
     "MissingBookFileError",
     "MissingVerseFileError",
     "NormalizedReference",
+    "ReferenceArray",
+    "SearchIndex",
+    "StageStatistics",
+    "VerseHistogram",
+    "Versification",
+    "VersificationMapping",
     "Version",
     "VersionMissingVerseError",
     "__version__",
     "add_bible",
+    "add_versification",
+    "add_versification_mapping",
+    "build_search_index",
+    "clear_caches",
+    "clear_reference_cache",
+    "compile_bible",
+    "configure_bible_cache",
+    "configure_cache",
+    "configure_reference_cache",
     "convert_reference_to_verse_ids",
     "convert_references_to_verse_ids",
     "convert_verse_ids_to_references",
     "count_books",
     "count_chapters",
     "count_verses",
+    "disable_instrumentation",
+    "enable_instrumentation",
     "format_scripture_references",
     "format_scripture_text",
     "format_single_reference",
     "get_bible",
+    "get_bible_cache_info",
     "get_book_chapter_verse",
+    "get_book_chapter_verse_by_ordinal",
     "get_book_number",
+    "get_cache_info",
+    "get_chapter_index",
+    "get_chapter_index_by_ordinal",
     "get_chapter_number",
+    "get_chapter_ordinals",
+    "get_instrumentation_statistics",
     "get_number_of_chapters",
     "get_number_of_verses",
+    "get_reference_cache_info",
     "get_references",
+    "get_references_batch",
+    "get_scripture_text_bible_type",
+    "get_search_index",
     "get_verse_id",
+    "get_verse_id_by_ordinal",
     "get_verse_number",
+    "get_verse_ordinal",
     "get_verse_text",
+    "get_versification",
+    "get_versification_mapping",
+    "instrument",
     "is_valid_book",
     "is_valid_chapter",
     "is_valid_reference",
     "is_valid_verse",
     "is_valid_verse_id",
+    "iter_references_batch",
+    "iter_scripture_text",
+    "load_compiled_bible",
+    "load_search_index",
+    "map_verse_ids",
     "normalize_reference",
+    "reset_instrumentation_statistics",
+    "warm_caches",
+    "write_scripture_bytes",
+    "write_scripture_text",
 ]
 # Reference the imported names so ruff/auto-fixes do not remove them as "unused".
 _ = (
     add_bible,
+    configure_bible_cache,
     get_bible,
+    get_bible_cache_info,
+    get_search_index,
     Bible,
+    CompiledBible,
+    compile_bible,
+    load_compiled_bible,
+    InvalidCompiledBibleError,
+    InvalidSearchIndexError,
     VersionMissingVerseError,
+    SearchIndex,
+    build_search_index,
+    load_search_index,
     BOOK_GROUPS,
     BookGroup,
     Book,
+    CacheInfo,
+    clear_caches,
+    configure_cache,
+    get_cache_info,
+    warm_caches,
     convert_reference_to_verse_ids,
     convert_references_to_verse_ids,
     convert_verse_ids_to_references,
@@ -116,22 +224,52 @@ _ = (
     format_scripture_references,
     format_scripture_text,
     format_single_reference,
+    get_scripture_text_bible_type,
     get_verse_text,
+    iter_scripture_text,
+    write_scripture_bytes,
+    write_scripture_text,
+    VerseHistogram,
+    StageStatistics,
+    disable_instrumentation,
+    enable_instrumentation,
+    get_instrumentation_statistics,
+    instrument,
+    reset_instrumentation_statistics,
     NormalizedReference,
+    clear_reference_cache,
+    configure_reference_cache,
+    get_reference_cache_info,
     get_references,
+    get_references_batch,
+    iter_references_batch,
     normalize_reference,
+    ReferenceArray,
     is_valid_book,
     is_valid_chapter,
     is_valid_reference,
     is_valid_verse,
     is_valid_verse_id,
     get_book_chapter_verse,
+    get_book_chapter_verse_by_ordinal,
     get_book_number,
+    get_chapter_index,
+    get_chapter_index_by_ordinal,
     get_chapter_number,
+    get_chapter_ordinals,
     get_number_of_chapters,
     get_number_of_verses,
     get_verse_id,
+    get_verse_id_by_ordinal,
     get_verse_number,
+    get_verse_ordinal,
+    Versification,
+    VersificationMapping,
+    add_versification,
+    add_versification_mapping,
+    get_versification,
+    get_versification_mapping,
+    map_verse_ids,
     Version,
     __version__,
 )
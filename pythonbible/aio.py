@@ -0,0 +1,175 @@
+"""Asynchronous variants of the blocking pythonbible functions.
+
+Loading a Bible, formatting scripture text, and parsing references do file I/O or CPU
+work, so these coroutines run them in the event loop's default executor rather than
+blocking the event loop. Concurrent requests for a Bible that is not loaded yet share
+a single load.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING
+
+from pythonbible import bible as bible_module
+from pythonbible.formatter import format_scripture_text
+from pythonbible.formatter import get_scripture_text_bible_type
+from pythonbible.formatter import get_verse_text
+from pythonbible.parser import get_references
+from pythonbible.versions import DEFAULT_VERSION
+from pythonbible.versions import Version
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+
+    from pythonbible.bible.bible import Bible
+    from pythonbible.books import Book
+    from pythonbible.normalized_reference import NormalizedReference
+
+_BibleLoadKey = tuple[asyncio.AbstractEventLoop, Version, str]
+
+_PENDING_BIBLE_LOADS: dict[_BibleLoadKey, asyncio.Future[Bible]] = {}
+
+
+async def aget_bible(version: Version, bible_type: str) -> Bible:
+    """Return the Bible for the given version and format without blocking.
+
+    A Bible that is already loaded is returned right away. Otherwise, it is loaded in
+    the event loop's default executor, and any other requests for the same Bible
+    while it is loading wait for the same load.
+
+    :param version: The version of the Bible
+    :type version: Version
+    :param bible_type: The type of the Bible
+    :type bible_type: str
+    :return: The Bible for the given version and type
+    :rtype: Bible
+    """
+    if bible_module.BIBLES.contains(version, bible_type):
+        return bible_module.get_bible(version, bible_type)
+
+    loop = asyncio.get_running_loop()
+    key: _BibleLoadKey = (loop, version, bible_type)
+    pending_load: asyncio.Future[Bible] | None = _PENDING_BIBLE_LOADS.get(key)
+
+    if pending_load is None:
+        pending_load = loop.run_in_executor(
+            None,
+            bible_module.get_bible,
+            version,
+            bible_type,
+        )
+        _PENDING_BIBLE_LOADS[key] = pending_load
+        pending_load.add_done_callback(lambda _: _PENDING_BIBLE_LOADS.pop(key, None))
+
+    # Shield the shared load so that one cancelled request doesn't cancel the others.
+    return await asyncio.shield(pending_load)
+
+
+async def aget_verse_text(verse_id: int, version: Version = DEFAULT_VERSION) -> str:
+    """Return the scripture text of the given verse id and version without blocking.
+
+    The Bible is loaded (see aget_bible) and the text is read in the event loop's
+    default executor, since the Bible may have been evicted again in the meantime.
+
+    :param verse_id: a verse id
+    :type verse_id: int
+    :param version: a version of the Bible, defaults to American Standard
+    :type version: Version
+    :return: The scripture text of the given verse id and version
+    :rtype: str
+    :raises InvalidVerseError: if the given verse id does not correspond to a valid
+                               verse
+    """
+    await aget_bible(version, "plain_text_readers")
+
+    return await asyncio.get_running_loop().run_in_executor(
+        None,
+        get_verse_text,
+        verse_id,
+        version,
+    )
+
+
+async def aformat_scripture_text(
+    verse_ids: list[int],
+    *,
+    version: Version = DEFAULT_VERSION,
+    format_type: str = "html",
+    include_verse_numbers: bool = True,
+    one_verse_per_paragraph: bool = False,
+    full_title: bool = False,
+) -> str:
+    """Return the formatted scripture text for the given verse IDs without blocking.
+
+    The Bible is loaded (see aget_bible) and the text is formatted in the event loop's
+    default executor. The keyword arguments are the same as format_scripture_text.
+
+    :param verse_ids: A list of integer verse ids
+    :type verse_ids: list[int]
+    :param version: a version of the Bible, defaults to American Standard
+    :type version: Version
+    :param format_type: "html" for HTML text, or anything else for plain text,
+                        defaults to "html"
+    :type format_type: str
+    :param include_verse_numbers: whether to include the verse numbers, defaults to
+                                  True
+    :type include_verse_numbers: bool
+    :param one_verse_per_paragraph: whether to put each verse in its own paragraph,
+                                    defaults to False
+    :type one_verse_per_paragraph: bool
+    :param full_title: whether to use the long titles of the books, defaults to False
+    :type full_title: bool
+    :return: The formatted scripture text for the verse ids
+    :rtype: str
+    """
+    await aget_bible(
+        version,
+        get_scripture_text_bible_type(
+            format_type=format_type,
+            include_verse_numbers=include_verse_numbers,
+        ),
+    )
+
+    return await asyncio.get_running_loop().run_in_executor(
+        None,
+        partial(
+            format_scripture_text,
+            verse_ids,
+            version=version,
+            format_type=format_type,
+            include_verse_numbers=include_verse_numbers,
+            one_verse_per_paragraph=one_verse_per_paragraph,
+            full_title=full_title,
+        ),
+    )
+
+
+async def aget_references(
+    text: str,
+    book_groups: Mapping[str, Iterable[Book]] | None = None,
+    *,
+    parser: str | None = None,
+) -> list[NormalizedReference]:
+    """Search the text for scripture references without blocking.
+
+    The text is searched in the event loop's default executor.
+
+    :param text: String that may contain zero or more scripture references
+    :type text: str
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
+                        related regular expression
+    :type book_groups: Mapping[str, Iterable[Book]] or None
+    :param parser: The parser to use ("regular_expression" or "state_machine"),
+                   defaults to DEFAULT_PARSER
+    :type parser: str or None
+    :return: The list of found scripture references
+    :rtype: list[NormalizedReference]
+    :raises InvalidBibleParserError: if the parser is not one of PARSERS
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None,
+        partial(get_references, text, book_groups, parser=parser),
+    )
@@ -1,26 +1,63 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from pythonbible.bible.bible import Bible
+from pythonbible.bible.bible_cache import BibleCache
+from pythonbible.bible.compiled_bible import COMPILED_BIBLE_FILE_EXTENSION
+from pythonbible.bible.compiled_bible import load_compiled_bible
+from pythonbible.bible.search_index import SEARCH_INDEX_FILE_EXTENSION
+from pythonbible.bible.search_index import build_search_index
+from pythonbible.bible.search_index import load_search_index
 from pythonbible.books import Book
 from pythonbible.versions import Version
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from pythonbible.bible.bible import Bible
+    from pythonbible.bible.bible_cache import BibleCacheInfo
+    from pythonbible.bible.search_index import SearchIndex
     from pythonbible.versions import Version
 
 
 CURRENT_FOLDER = Path(__file__).parent
 
-BIBLES: dict[Version, dict[str, Bible]] = {}
+DEFAULT_MAX_LOADED_BIBLES = 8
+
+BIBLES: BibleCache = BibleCache(max_entries=DEFAULT_MAX_LOADED_BIBLES)
+
+
+class _PlaceholderBible(Bible):
+    """Stands in for a Bible whose scripture files are not installed."""
+
+    def get_scripture(
+        self: _PlaceholderBible,
+        start_verse_id: int,  # noqa: ARG002
+        end_verse_id: int | None = None,  # noqa: ARG002
+    ) -> str:
+        return ""
+
+    def iter_scripture_bytes(
+        self: _PlaceholderBible,
+        start_verse_id: int,  # noqa: ARG002
+        end_verse_id: int | None = None,  # noqa: ARG002
+    ) -> Iterator[bytes | memoryview]:
+        return iter(())
 
 
 def get_bible(version: Version, bible_type: str) -> Bible:
     """Return the Bible for the given version and format.
 
+    Bibles that have been added with add_bible or loaded before are returned from the
+    Bible cache. Otherwise, the compiled Bible file for the version and type is loaded
+    (memory-mapped) if it is installed and added to the cache, where it is kept until
+    it is evicted as one of the least recently used (see configure_bible_cache). If
+    there is no such file, an empty placeholder Bible is returned.
+
     :param version: The version of the Bible
     :type version: Version
     :param bible_type: The type of the Bible
@@ -28,7 +65,19 @@ def get_bible(version: Version, bible_type: str) -> Bible:
     :return: The Bible for the given version and type
     :rtype: Bible
     """
-    return Bible(
+    version_bible: Bible | None = BIBLES.lookup(version, bible_type)
+
+    if version_bible is not None:
+        return version_bible
+
+    compiled_bible_path: Path = get_compiled_bible_path(version, bible_type)
+
+    if _do_version_files_exist(version) and compiled_bible_path.is_file():
+        version_bible = load_compiled_bible(compiled_bible_path)
+        BIBLES.add(version, bible_type, version_bible)
+        return version_bible
+
+    return _PlaceholderBible(
         version=Version.AMERICAN_STANDARD,
         scripture_content="",
         verse_start_indices={0: 0},
@@ -45,7 +94,8 @@ def add_bible(version: Version, bible_type: str, version_bible: Bible) -> None:
 
     This should allow a user to BYOB (bring your own Bible) to the library, which can
     be useful if a user has licensed a copyrighted Bible (which is not included in the
-    pythonbible library) for use within their application.
+    pythonbible library) for use within their application. Added Bibles are never
+    evicted from the Bible cache.
 
     :param version: The version of the Bible
     :type version: Version
@@ -54,8 +104,101 @@ def add_bible(version: Version, bible_type: str, version_bible: Bible) -> None:
     :param version_bible: The Bible to add
     :type version_bible: Bible
     """
-    return
+    BIBLES.add(version, bible_type, version_bible, pinned=True)
+
+
+def configure_bible_cache(
+    max_entries: int | None = DEFAULT_MAX_LOADED_BIBLES,
+    max_memory_size: int | None = None,
+) -> None:
+    """Set the limits of the cache of loaded Bibles.
+
+    When either limit is exceeded, the least recently used Bibles that were loaded
+    from installed files are evicted. They are loaded again the next time they are
+    needed. Bibles added with add_bible are never evicted and don't count toward
+    either limit.
+
+    :param max_entries: The maximum number of loaded Bibles, or None for no limit
+    :type max_entries: int | None
+    :param max_memory_size: The maximum estimated memory size of the loaded Bibles in
+                            bytes, or None for no limit
+    :type max_memory_size: int | None
+    """
+    BIBLES.configure(max_entries, max_memory_size)
+
+
+def get_bible_cache_info() -> BibleCacheInfo:
+    """Return the hits, misses, evictions, and size of the cache of loaded Bibles.
+
+    :return: The statistics of the Bible cache
+    :rtype: BibleCacheInfo
+    """
+    return BIBLES.cache_info()
+
+
+def get_compiled_bible_path(version: Version, bible_type: str) -> Path:
+    """Return the path where the compiled Bible file for the version and type lives.
+
+    :param version: The version of the Bible
+    :type version: Version
+    :param bible_type: The type of the Bible
+    :type bible_type: str
+    :return: The path of the compiled Bible file
+    :rtype: Path
+    """
+    return (
+        CURRENT_FOLDER
+        / version.value.lower()
+        / f"{bible_type}{COMPILED_BIBLE_FILE_EXTENSION}"
+    )
+
+
+def get_search_index_path(version: Version, bible_type: str) -> Path:
+    """Return the path where the search index file for the version and type lives.
+
+    The search index file is installed next to the compiled Bible file.
+
+    :param version: The version of the Bible
+    :type version: Version
+    :param bible_type: The type of the Bible
+    :type bible_type: str
+    :return: The path of the search index file
+    :rtype: Path
+    """
+    return get_compiled_bible_path(version, bible_type).with_suffix(
+        SEARCH_INDEX_FILE_EXTENSION,
+    )
+
+
+def get_search_index(version: Version, bible_type: str = "plain_text") -> SearchIndex:
+    """Return the search index of the words in the Bible for the version and type.
+
+    An installed search index file is loaded (once per process). Otherwise, the index
+    is built from the Bible returned by get_bible, which can take a few seconds, so
+    callers that search often should keep the returned index or save it with
+    SearchIndex.save to get_search_index_path(version, bible_type).
+
+    :param version: The version of the Bible
+    :type version: Version
+    :param bible_type: The type of the Bible, defaults to "plain_text"
+    :type bible_type: str
+    :return: The search index of the Bible
+    :rtype: SearchIndex
+    :raises InvalidSearchIndexError: if the installed search index file is not
+                                     compatible
+    """
+    search_index_path: Path = get_search_index_path(version, bible_type)
+
+    if search_index_path.is_file():
+        return _load_installed_search_index(search_index_path)
+
+    return build_search_index(get_bible(version, bible_type))
+
+
+@lru_cache(maxsize=DEFAULT_MAX_LOADED_BIBLES)
+def _load_installed_search_index(search_index_path: Path) -> SearchIndex:
+    return load_search_index(search_index_path)
 
 
 def _do_version_files_exist(version: Version) -> bool:
-    return False
+    return (CURRENT_FOLDER / version.value.lower()).is_dir()
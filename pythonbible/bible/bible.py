@@ -2,17 +2,35 @@
 
 from __future__ import annotations
 
+import sys
+from functools import cached_property
 from functools import lru_cache
 from typing import TYPE_CHECKING
+from typing import Protocol
 
 from pythonbible.bible.errors import VersionMissingVerseError
 from pythonbible.errors import InvalidVerseError
 from pythonbible.validator import is_valid_verse_id
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from pythonbible.books import Book
     from pythonbible.versions import Version
 
+_ASCII_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f")
+_CONTINUATION_BYTE_MASK = 0xC0
+_CONTINUATION_BYTE = 0x80
+_HTML_PARAGRAPH_START = b"<p>"
+_HTML_PARAGRAPH_END = b"</p>"
+
+
+class SupportsWriteBytes(Protocol):
+    """A binary stream, such as a file opened in binary mode or a socket file."""
+
+    def write(self: SupportsWriteBytes, data: bytes | memoryview, /) -> object:
+        """Write the given bytes to the stream."""
+
 
 class Bible:
     """The Bible class.
@@ -67,21 +85,315 @@ class Bible:
         start_verse_id: int,
         end_verse_id: int | None = None,
     ) -> str:
-        return ""
+        """Return the scripture content for the given verse or range of verses.
+
+        :param start_verse_id: The verse id of the first verse.
+        :param end_verse_id: The verse id of the last verse, defaults to the first.
+        :return: The scripture content for the verse(s).
+        :raises InvalidVerseError: if either verse id is not a valid verse.
+        :raises VersionMissingVerseError: if the version does not include either verse.
+        """
+        if not is_valid_verse_id(start_verse_id):
+            raise InvalidVerseError(verse_id=start_verse_id)
+
+        if end_verse_id and not is_valid_verse_id(end_verse_id):
+            raise InvalidVerseError(verse_id=end_verse_id)
+
+        start_index, end_index = self._get_start_and_end_indices(
+            start_verse_id,
+            end_verse_id or start_verse_id,
+        )
+
+        return _clean(self._get_content(start_index, end_index), self.is_html)
+
+    @cached_property
+    def content_buffer(self: Bible) -> memoryview:
+        """The UTF-8 encoded scripture content.
+
+        The content is encoded the first time it is used. Offsets returned by
+        get_scripture_offsets are byte offsets into this buffer.
+        """
+        return memoryview(self.scripture_content.encode("utf-8"))
+
+    def get_scripture_offsets(
+        self: Bible,
+        start_verse_id: int,
+        end_verse_id: int | None = None,
+    ) -> tuple[int, int]:
+        """Return the byte offsets of the given verse or range of verses.
+
+        The offsets are the start and end of the raw (not yet cleaned) content of the
+        verses in content_buffer, so content_buffer[start:end] is a view of the
+        verses that does not copy the content.
+
+        :param start_verse_id: The verse id of the first verse.
+        :param end_verse_id: The verse id of the last verse, defaults to the first.
+        :return: The start and end byte offsets of the verse(s).
+        :raises InvalidVerseError: if either verse id is not a valid verse.
+        :raises VersionMissingVerseError: if the version does not include either verse.
+        """
+        if not is_valid_verse_id(start_verse_id):
+            raise InvalidVerseError(verse_id=start_verse_id)
+
+        if end_verse_id and not is_valid_verse_id(end_verse_id):
+            raise InvalidVerseError(verse_id=end_verse_id)
+
+        return self._get_start_and_end_offsets(
+            start_verse_id,
+            end_verse_id or start_verse_id,
+        )
+
+    def iter_scripture_bytes(
+        self: Bible,
+        start_verse_id: int,
+        end_verse_id: int | None = None,
+    ) -> Iterator[bytes | memoryview]:
+        """Yield the UTF-8 encoded scripture content for the given verse(s) in chunks.
+
+        The chunks joined together are the UTF-8 encoding of get_scripture for the same
+        verses. The content itself is yielded as a view of content_buffer rather than a
+        copy; only any paragraph tags needed to balance HTML content are new bytes.
+
+        :param start_verse_id: The verse id of the first verse.
+        :param end_verse_id: The verse id of the last verse, defaults to the first.
+        :return: An iterator of the chunks of the scripture content.
+        :raises InvalidVerseError: if either verse id is not a valid verse.
+        :raises VersionMissingVerseError: if the version does not include either verse.
+        """
+        start_offset, end_offset = self.get_scripture_offsets(
+            start_verse_id,
+            end_verse_id,
+        )
+
+        return _iter_clean_bytes(
+            self.content_buffer,
+            start_offset,
+            end_offset,
+            is_html=self.is_html,
+        )
+
+    def write_scripture(
+        self: Bible,
+        stream: SupportsWriteBytes,
+        start_verse_id: int,
+        end_verse_id: int | None = None,
+    ) -> int:
+        """Write the UTF-8 encoded scripture content for the given verse(s) to a stream.
+
+        The content is written straight from content_buffer without building an
+        intermediate string.
+
+        :param stream: The binary stream to write to.
+        :param start_verse_id: The verse id of the first verse.
+        :param end_verse_id: The verse id of the last verse, defaults to the first.
+        :return: The number of bytes written.
+        :raises InvalidVerseError: if either verse id is not a valid verse.
+        :raises VersionMissingVerseError: if the version does not include either verse.
+        """
+        number_of_bytes: int = 0
+
+        for chunk in self.iter_scripture_bytes(start_verse_id, end_verse_id):
+            stream.write(chunk)
+            number_of_bytes += len(chunk)
+
+        return number_of_bytes
+
+    def get_memory_size(self: Bible) -> int:
+        """Return an estimate of the memory used by the Bible, in bytes.
+
+        :return: The approximate size of the scripture content and verse indices.
+        """
+        return (
+            sys.getsizeof(self.scripture_content)
+            + sys.getsizeof(self.verse_start_indices)
+            + sys.getsizeof(self.verse_end_indices)
+        )
 
     def _get_start_and_end_indices(
         self: Bible,
         start_verse_id: int,
         end_verse_id: int,
     ) -> tuple[int, int]:
-        return 0, 0
+        start_index: int | None = self.verse_start_indices.get(start_verse_id)
+
+        if start_index is None:
+            raise VersionMissingVerseError(self.version.value, start_verse_id)
+
+        end_index: int | None = self.verse_end_indices.get(end_verse_id)
+
+        if end_index is None:
+            raise VersionMissingVerseError(self.version.value, end_verse_id)
+
+        return start_index, end_index
+
+    def _get_content(self: Bible, start_index: int, end_index: int) -> str:
+        return self.scripture_content[start_index:end_index]
+
+    def _get_start_and_end_offsets(
+        self: Bible,
+        start_verse_id: int,
+        end_verse_id: int,
+    ) -> tuple[int, int]:
+        start_index, end_index = self._get_start_and_end_indices(
+            start_verse_id,
+            end_verse_id,
+        )
+
+        return self._byte_offsets[start_index], self._byte_offsets[end_index]
+
+    @cached_property
+    def _byte_offsets(self: Bible) -> dict[int, int]:
+        return get_byte_offsets(
+            self.scripture_content,
+            {*self.verse_start_indices.values(), *self.verse_end_indices.values()},
+        )
+
+
+def get_byte_offsets(content: str, string_indices: set[int]) -> dict[int, int]:
+    """Return the UTF-8 byte offset of each of the given indices into the content.
+
+    :param content: The string content.
+    :param string_indices: The indices into the content.
+    :return: The byte offset of each index in the UTF-8 encoding of the content.
+    """
+    byte_offsets: dict[int, int] = {}
+    byte_offset: int = 0
+    previous_index: int = 0
+
+    for string_index in sorted(string_indices):
+        byte_offset += len(content[previous_index:string_index].encode("utf-8"))
+        previous_index = string_index
+        byte_offsets[string_index] = byte_offset
+
+    return byte_offsets
 
 
 @lru_cache()
 def _clean(scripture_content: str, is_html: bool) -> str:
-    return ""
+    return clean_html(scripture_content) if is_html else scripture_content.strip()
 
 
 @lru_cache()
 def clean_html(scripture_content: str) -> str:
-    return ""
+    """Return the given HTML scripture content with balanced paragraph tags.
+
+    A range of verses can start or end in the middle of a paragraph, so the content is
+    trimmed of dangling paragraph tags and wrapped in a paragraph where needed.
+
+    :param scripture_content: The HTML scripture content.
+    :return: The cleaned HTML scripture content.
+    """
+    cleaned_content: str = (
+        scripture_content.strip().removeprefix("</p>").removesuffix("<p>").strip()
+    )
+
+    if not cleaned_content:
+        return ""
+
+    if not cleaned_content.startswith("<p>"):
+        cleaned_content = f"<p>{cleaned_content}"
+
+    if not cleaned_content.endswith("</p>"):
+        cleaned_content = f"{cleaned_content}</p>"
+
+    return cleaned_content
+
+
+def _iter_clean_bytes(
+    buffer: memoryview,
+    start: int,
+    end: int,
+    *,
+    is_html: bool,
+) -> Iterator[bytes | memoryview]:
+    # The same cleaning as _clean, but done by moving the offsets of a view of the
+    # UTF-8 encoded content so that the content is not copied.
+    start, end = _strip_offsets(buffer, start, end)
+
+    if not is_html:
+        if start < end:
+            yield buffer[start:end]
+
+        return
+
+    if buffer[start : start + len(_HTML_PARAGRAPH_END)] == _HTML_PARAGRAPH_END:
+        start += len(_HTML_PARAGRAPH_END)
+
+    if (
+        end - start >= len(_HTML_PARAGRAPH_START)
+        and buffer[end - len(_HTML_PARAGRAPH_START) : end] == _HTML_PARAGRAPH_START
+    ):
+        end -= len(_HTML_PARAGRAPH_START)
+
+    start, end = _strip_offsets(buffer, start, end)
+
+    if start >= end:
+        return
+
+    if buffer[start : start + len(_HTML_PARAGRAPH_START)] != _HTML_PARAGRAPH_START:
+        yield _HTML_PARAGRAPH_START
+
+    yield buffer[start:end]
+
+    if (
+        end - start < len(_HTML_PARAGRAPH_END)
+        or buffer[end - len(_HTML_PARAGRAPH_END) : end] != _HTML_PARAGRAPH_END
+    ):
+        yield _HTML_PARAGRAPH_END
+
+
+def _strip_offsets(buffer: memoryview, start: int, end: int) -> tuple[int, int]:
+    # Move the offsets past leading and trailing whitespace, like str.strip. Non-ASCII
+    # characters are decoded one at a time to check for Unicode whitespace.
+    start = _strip_leading_offset(buffer, start, end)
+    return start, _strip_trailing_offset(buffer, start, end)
+
+
+def _strip_leading_offset(buffer: memoryview, start: int, end: int) -> int:
+    while start < end:
+        if buffer[start] in _ASCII_WHITESPACE:
+            start += 1
+            continue
+
+        if buffer[start] < _CONTINUATION_BYTE:
+            break
+
+        character_end: int = start + 1
+
+        while (
+            character_end < end
+            and buffer[character_end] & _CONTINUATION_BYTE_MASK == _CONTINUATION_BYTE
+        ):
+            character_end += 1
+
+        if not str(buffer[start:character_end], "utf-8").isspace():
+            break
+
+        start = character_end
+
+    return start
+
+
+def _strip_trailing_offset(buffer: memoryview, start: int, end: int) -> int:
+    while end > start:
+        if buffer[end - 1] in _ASCII_WHITESPACE:
+            end -= 1
+            continue
+
+        if buffer[end - 1] < _CONTINUATION_BYTE:
+            break
+
+        character_start: int = end - 1
+
+        while (
+            character_start > start
+            and buffer[character_start] & _CONTINUATION_BYTE_MASK == _CONTINUATION_BYTE
+        ):
+            character_start -= 1
+
+        if not str(buffer[character_start:end], "utf-8").isspace():
+            break
+
+        end = character_start
+
+    return end
@@ -0,0 +1,290 @@
+"""Contains the BibleCache class, the registry of loaded Bibles."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from threading import RLock
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+
+    from pythonbible.bible.bible import Bible
+    from pythonbible.versions import Version
+
+# Distinguishes pop without a default from pop with a default of None.
+_MISSING: Any = object()
+
+
+class BibleCacheInfo(NamedTuple):
+    """Statistics about a BibleCache.
+
+    entries counts every Bible in the cache, while memory_size only counts the
+    evictable Bibles (pinned Bibles don't count toward either limit).
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    max_entries: int | None
+    memory_size: int
+    max_memory_size: int | None
+
+
+class BibleCache(MutableMapping["Version", "dict[str, Bible]"]):
+    """A least recently used (LRU) cache of Bibles keyed by version and Bible type.
+
+    Once the cache holds more than max_entries evictable Bibles, or their estimated
+    memory size is more than max_memory_size bytes, the least recently used ones are
+    evicted. Evicting a Bible only drops the cache's reference to it, so callers that
+    still hold an evicted Bible can keep using it (a compiled Bible releases its
+    memory-mapped file once it is no longer referenced). Pinned Bibles
+    (such as the ones added with add_bible) can't be loaded again, so they are never
+    evicted and don't count against either limit: the limits only bound the memory of
+    the Bibles loaded from installed files.
+
+    For compatibility with the dictionary the cache replaced, it is also a mapping of
+    each version to its Bibles keyed by Bible type (e.g. cache[version] or
+    cache.get(version)). Reading it that way doesn't count as a hit or miss, and
+    Bibles set that way are pinned.
+
+    The cache is safe to use from multiple threads.
+    """
+
+    def __init__(
+        self: BibleCache,
+        max_entries: int | None = None,
+        max_memory_size: int | None = None,
+    ) -> None:
+        """Initialize an empty BibleCache.
+
+        :param max_entries: The maximum number of evictable Bibles, or None for no
+                            limit.
+        :param max_memory_size: The maximum estimated memory size of the evictable
+                                Bibles in bytes, or None for no limit.
+        """
+        self._bibles: OrderedDict[tuple[Version, str], Bible] = OrderedDict()
+        self._memory_sizes: dict[tuple[Version, str], int] = {}
+        self._pinned: set[tuple[Version, str]] = set()
+        self._lock = RLock()
+        self._max_entries = max_entries
+        self._max_memory_size = max_memory_size
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __contains__(self: BibleCache, version: object) -> bool:
+        """Return True if any Bible for the given version is in the cache."""
+        with self._lock:
+            return any(key[0] == version for key in self._bibles)
+
+    def __len__(self: BibleCache) -> int:
+        """Return the number of versions that have Bibles in the cache."""
+        with self._lock:
+            return len({version for version, _ in self._bibles})
+
+    def __iter__(self: BibleCache) -> Iterator[Version]:
+        """Return an iterator over the versions that have Bibles in the cache."""
+        with self._lock:
+            return iter(dict.fromkeys(version for version, _ in self._bibles))
+
+    def __getitem__(self: BibleCache, version: Version) -> dict[str, Bible]:
+        """Return the Bibles for the given version, keyed by Bible type.
+
+        :raises KeyError: if there are no Bibles for the version
+        """
+        with self._lock:
+            bibles: dict[str, Bible] = {
+                bible_type: bible
+                for (key_version, bible_type), bible in self._bibles.items()
+                if key_version == version
+            }
+
+        if not bibles:
+            raise KeyError(version)
+
+        return bibles
+
+    def __setitem__(
+        self: BibleCache,
+        version: Version,
+        bibles: Mapping[str, Bible],
+    ) -> None:
+        """Replace the Bibles for the given version with the given pinned Bibles."""
+        with self._lock:
+            self.pop(version, None)
+
+            for bible_type, bible in bibles.items():
+                self.add(version, bible_type, bible, pinned=True)
+
+    def __delitem__(self: BibleCache, version: Version) -> None:
+        """Remove the Bibles for the given version.
+
+        :raises KeyError: if there are no Bibles for the version
+        """
+        self.pop(version)
+
+    def contains(self: BibleCache, version: Version, bible_type: str) -> bool:
+        """Return True if the Bible for the given version and type is in the cache.
+
+        Unlike get, this does not count as a hit or miss or mark the Bible as used.
+
+        :param version: The version of the Bible.
+        :param bible_type: The type of the Bible.
+        :return: True if the Bible is in the cache; otherwise, False.
+        """
+        return (version, bible_type) in self._bibles
+
+    def lookup(self: BibleCache, version: Version, bible_type: str) -> Bible | None:
+        """Return the cached Bible for the given version and type, if there is one.
+
+        :param version: The version of the Bible.
+        :param bible_type: The type of the Bible.
+        :return: The cached Bible, or None if it is not in the cache.
+        """
+        key: tuple[Version, str] = (version, bible_type)
+
+        with self._lock:
+            bible: Bible | None = self._bibles.get(key)
+
+            if bible is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._bibles.move_to_end(key)
+            return bible
+
+    def add(
+        self: BibleCache,
+        version: Version,
+        bible_type: str,
+        bible: Bible,
+        *,
+        pinned: bool = False,
+    ) -> None:
+        """Add the given Bible to the cache, replacing any Bible with the same key.
+
+        :param version: The version of the Bible.
+        :param bible_type: The type of the Bible.
+        :param bible: The Bible to add.
+        :param pinned: Whether the Bible should be kept until it is removed with pop.
+        """
+        key: tuple[Version, str] = (version, bible_type)
+
+        with self._lock:
+            self._bibles[key] = bible
+            self._bibles.move_to_end(key)
+            self._memory_sizes.pop(key, None)
+            self._pinned.discard(key)
+
+            if pinned:
+                self._pinned.add(key)
+            else:
+                self._memory_sizes[key] = bible.get_memory_size()
+
+            self._evict(keep=key)
+
+    def pop(  # type: ignore[override]
+        self: BibleCache,
+        version: Version,
+        default: Any = _MISSING,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        """Remove all the Bibles for the given version from the cache.
+
+        :param version: The version of the Bibles to remove.
+        :param default: The value to return if there are no Bibles for the version.
+        :return: The removed Bibles keyed by Bible type, or the default.
+        :raises KeyError: if there are no Bibles for the version and no default
+        """
+        with self._lock:
+            removed: dict[str, Bible] = {
+                bible_type: self._remove((key_version, bible_type))
+                for key_version, bible_type in list(self._bibles)
+                if key_version == version
+            }
+
+        if removed:
+            return removed
+
+        if default is _MISSING:
+            raise KeyError(version)
+
+        return default
+
+    def clear(self: BibleCache) -> None:
+        """Remove all the Bibles from the cache and reset the statistics."""
+        with self._lock:
+            self._bibles.clear()
+            self._memory_sizes.clear()
+            self._pinned.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def configure(
+        self: BibleCache,
+        max_entries: int | None = None,
+        max_memory_size: int | None = None,
+    ) -> None:
+        """Set the limits of the cache, evicting Bibles if they are now exceeded.
+
+        :param max_entries: The maximum number of evictable Bibles, or None for no
+                            limit.
+        :param max_memory_size: The maximum estimated memory size of the evictable
+                                Bibles in bytes, or None for no limit.
+        """
+        with self._lock:
+            self._max_entries = max_entries
+            self._max_memory_size = max_memory_size
+            self._evict()
+
+    def cache_info(self: BibleCache) -> BibleCacheInfo:
+        """Return the statistics of the cache.
+
+        :return: The hits, misses, evictions, entries, and memory size of the cache
+                 along with its limits.
+        """
+        with self._lock:
+            return BibleCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._bibles),
+                max_entries=self._max_entries,
+                memory_size=sum(self._memory_sizes.values()),
+                max_memory_size=self._max_memory_size,
+            )
+
+    def _evict(self: BibleCache, keep: tuple[Version, str] | None = None) -> None:
+        # The Bible that was just added is never evicted, even if it is over the budget
+        # on its own, since it is about to be returned to the caller.
+        evictable_keys: list[tuple[Version, str]] = [
+            key for key in self._bibles if key not in self._pinned and key != keep
+        ]
+        number_of_entries: int = len(self._memory_sizes)
+        memory_size: int = sum(self._memory_sizes.values())
+
+        for key in evictable_keys:
+            if not self._is_over_budget(number_of_entries, memory_size):
+                break
+
+            memory_size -= self._memory_sizes[key]
+            number_of_entries -= 1
+            self._remove(key)
+            self._evictions += 1
+
+    def _is_over_budget(self: BibleCache, entries: int, memory_size: int) -> bool:
+        return (self._max_entries is not None and entries > self._max_entries) or (
+            self._max_memory_size is not None and memory_size > self._max_memory_size
+        )
+
+    def _remove(self: BibleCache, key: tuple[Version, str]) -> Bible:
+        self._memory_sizes.pop(key, None)
+        self._pinned.discard(key)
+        return self._bibles.pop(key)
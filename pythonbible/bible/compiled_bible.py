@@ -0,0 +1,362 @@
+"""Contains the CompiledBible class and the compiled Bible file format.
+
+A compiled Bible file stores the scripture content of a Bible as UTF-8 text along with
+packed arrays of the start and end byte offsets of every verse, indexed by verse
+ordinal. Loading a compiled Bible memory-maps the file rather than reading it, so
+loading is nearly instant and every process that loads the same file shares the same
+pages of memory.
+
+File layout (all integers are little-endian):
+
+* header: magic bytes, format version, number of verse ordinals, metadata length, and
+  content length
+* metadata: UTF-8 JSON with the version, titles, max verses, and whether the content
+  is HTML, padded to a multiple of four bytes
+* start offsets: one unsigned 32-bit integer per verse ordinal
+* end offsets: one unsigned 32-bit integer per verse ordinal
+* content: the UTF-8 encoded scripture content
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Final
+
+from pythonbible.bible.bible import Bible
+from pythonbible.bible.bible import get_byte_offsets
+from pythonbible.bible.errors import InvalidCompiledBibleError
+from pythonbible.bible.errors import VersionMissingVerseError
+from pythonbible.books import Book
+from pythonbible.verses import get_all_verse_ids
+from pythonbible.verses import get_verse_ordinal
+from pythonbible.versions import Version
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Sequence
+
+COMPILED_BIBLE_FILE_EXTENSION = ".pybible"
+
+_MAGIC = b"PYBIBLE\x00"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQ")
+_OFFSET_TYPE: Final = "I"
+_OFFSET_SIZE = 4
+_MISSING_OFFSET = 0xFFFFFFFF
+
+
+class CompiledBible(Bible):
+    """A Bible backed by a memory-mapped compiled Bible file.
+
+    Scripture content is decoded only for the verses that are requested. The
+    scripture_content, verse_start_indices, and verse_end_indices attributes are
+    available for compatibility, but are built from the whole file the first time
+    they are used.
+    """
+
+    def __init__(self: CompiledBible, path: str | os.PathLike[str]) -> None:
+        """Memory-map the given compiled Bible file.
+
+        :param path: The path of the compiled Bible file.
+        :raises InvalidCompiledBibleError: if the file is not a compiled Bible file
+                                           compatible with this version of the library.
+        """
+        self.path = Path(path)
+
+        with self.path.open("rb") as compiled_file:
+            # An empty file can't be memory-mapped, so check the size first.
+            if self.path.stat().st_size < _HEADER.size:
+                error_message = f"{self.path} is not a compiled Bible file."
+                raise InvalidCompiledBibleError(error_message)
+
+            self._mmap = mmap.mmap(compiled_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            metadata_start, offsets_start, content_start = self._read_header(
+                self._mmap,
+            )
+            self._load_metadata(
+                json.loads(str(self._mmap[metadata_start:offsets_start], "utf-8")),
+            )
+        except InvalidCompiledBibleError:
+            self._mmap.close()
+            raise
+        except (KeyError, TypeError, ValueError) as error:
+            self._mmap.close()
+            error_message = f"{self.path} has invalid metadata."
+            raise InvalidCompiledBibleError(error_message) from error
+
+        buffer = memoryview(self._mmap)
+        offsets_length: int = (content_start - offsets_start) // 2
+
+        self._start_offsets = _cast_offsets(
+            buffer[offsets_start : offsets_start + offsets_length],
+        )
+        self._end_offsets = _cast_offsets(
+            buffer[offsets_start + offsets_length : content_start],
+        )
+        self._content = buffer[content_start:]
+        self._buffer = buffer
+
+    @cached_property
+    def scripture_content(self: CompiledBible) -> str:  # type: ignore[override]
+        return str(self._content, "utf-8")
+
+    @cached_property
+    def verse_start_indices(self: CompiledBible) -> dict[int, int]:  # type: ignore[override]
+        return self._get_string_indices(self._start_offsets)
+
+    @cached_property
+    def verse_end_indices(self: CompiledBible) -> dict[int, int]:  # type: ignore[override]
+        return self._get_string_indices(self._end_offsets)
+
+    @property
+    def content_buffer(self: CompiledBible) -> memoryview:  # type: ignore[override]
+        """The UTF-8 encoded scripture content, a view of the memory-mapped file."""
+        return self._content
+
+    def close(self: CompiledBible) -> None:
+        """Release the memory-mapped file.
+
+        The Bible can no longer be used after it has been closed.
+        """
+        for view in (self._start_offsets, self._end_offsets, self._content):
+            if isinstance(view, memoryview):
+                view.release()
+
+        self._buffer.release()
+        self._mmap.close()
+
+    def get_memory_size(self: CompiledBible) -> int:
+        """Return an estimate of the memory used by the Bible, in bytes.
+
+        The whole memory-mapped file is counted (even though only the pages that have
+        been read are resident) along with any compatibility attributes that have been
+        built.
+
+        :return: The approximate size of the compiled Bible.
+        """
+        memory_size: int = len(self._mmap)
+
+        for attribute in (
+            "scripture_content",
+            "verse_start_indices",
+            "verse_end_indices",
+        ):
+            if attribute in self.__dict__:
+                memory_size += sys.getsizeof(self.__dict__[attribute])
+
+        return memory_size
+
+    def _get_start_and_end_indices(
+        self: CompiledBible,
+        start_verse_id: int,
+        end_verse_id: int,
+    ) -> tuple[int, int]:
+        start_index: int = self._start_offsets[get_verse_ordinal(start_verse_id)]
+
+        if start_index == _MISSING_OFFSET:
+            raise VersionMissingVerseError(self.version.value, start_verse_id)
+
+        end_index: int = self._end_offsets[get_verse_ordinal(end_verse_id)]
+
+        if end_index == _MISSING_OFFSET:
+            raise VersionMissingVerseError(self.version.value, end_verse_id)
+
+        return start_index, end_index
+
+    def _get_content(self: CompiledBible, start_index: int, end_index: int) -> str:
+        return str(self._content[start_index:end_index], "utf-8")
+
+    def _get_start_and_end_offsets(
+        self: CompiledBible,
+        start_verse_id: int,
+        end_verse_id: int,
+    ) -> tuple[int, int]:
+        # The indices of a compiled Bible are already byte offsets.
+        return self._get_start_and_end_indices(start_verse_id, end_verse_id)
+
+    def _get_string_indices(
+        self: CompiledBible,
+        byte_offsets: Sequence[int],
+    ) -> dict[int, int]:
+        # Convert the byte offsets into string indices by decoding the content between
+        # consecutive offsets (in order) and keeping a running count of characters.
+        verse_ids: tuple[int, ...] = get_all_verse_ids()
+        string_indices: dict[int, int] = {}
+        string_index: int = 0
+        previous_offset: int = 0
+
+        for ordinal in sorted(
+            range(len(byte_offsets)),
+            key=byte_offsets.__getitem__,
+        ):
+            byte_offset: int = byte_offsets[ordinal]
+
+            if byte_offset == _MISSING_OFFSET:
+                break
+
+            string_index += len(self._get_content(previous_offset, byte_offset))
+            previous_offset = byte_offset
+            string_indices[verse_ids[ordinal]] = string_index
+
+        return string_indices
+
+    def _load_metadata(self: CompiledBible, metadata: dict[str, Any]) -> None:
+        self.version = Version(metadata["version"])  # type: ignore[call-arg]
+        self.is_html = metadata["is_html"]
+        self.short_titles = _load_titles(metadata["short_titles"])
+        self.long_titles = _load_titles(metadata["long_titles"])
+        self.max_verses = {
+            Book(int(book)): {  # type: ignore[call-arg]
+                int(chapter): max_verse for chapter, max_verse in chapters.items()
+            }
+            for book, chapters in metadata["max_verses"].items()
+        }
+
+    def _read_header(self: CompiledBible, buffer: mmap.mmap) -> tuple[int, int, int]:
+        if len(buffer) < _HEADER.size:
+            error_message = f"{self.path} is not a compiled Bible file."
+            raise InvalidCompiledBibleError(error_message)
+
+        verse_ids: tuple[int, ...] = get_all_verse_ids()
+        magic, format_version, number_of_verses, metadata_length, content_length = (
+            _HEADER.unpack_from(buffer)
+        )
+
+        if magic != _MAGIC:
+            error_message = f"{self.path} is not a compiled Bible file."
+            raise InvalidCompiledBibleError(error_message)
+
+        if format_version != _FORMAT_VERSION or number_of_verses != len(verse_ids):
+            error_message = (
+                f"{self.path} was compiled by an incompatible version of pythonbible."
+            )
+            raise InvalidCompiledBibleError(error_message)
+
+        metadata_start: int = _HEADER.size
+        offsets_start: int = metadata_start + _get_padded_length(metadata_length)
+        content_start: int = offsets_start + 2 * number_of_verses * _OFFSET_SIZE
+
+        if content_start + content_length != len(buffer):
+            error_message = f"{self.path} is truncated or corrupt."
+            raise InvalidCompiledBibleError(error_message)
+
+        return metadata_start, offsets_start, content_start
+
+
+def compile_bible(bible: Bible, path: str | os.PathLike[str]) -> Path:
+    """Write the given Bible to a compiled Bible file.
+
+    Only verses with valid verse ids are included. The file is written to a temporary
+    file first and then moved into place, so processes that already have the previous
+    file memory-mapped are not affected.
+
+    :param bible: The Bible to compile.
+    :param path: The path of the compiled Bible file to write.
+    :return: The path of the compiled Bible file.
+    """
+    compiled_path = Path(path)
+    content: bytes = bible.scripture_content.encode("utf-8")
+    byte_offsets: dict[int, int] = get_byte_offsets(
+        bible.scripture_content,
+        {*bible.verse_start_indices.values(), *bible.verse_end_indices.values()},
+    )
+    start_offsets: array[int] = _build_offsets(bible.verse_start_indices, byte_offsets)
+    end_offsets: array[int] = _build_offsets(bible.verse_end_indices, byte_offsets)
+
+    metadata: bytes = json.dumps(
+        {
+            "version": bible.version.value,
+            "is_html": bible.is_html,
+            "short_titles": _dump_titles(bible.short_titles),
+            "long_titles": _dump_titles(bible.long_titles),
+            "max_verses": {
+                book.value: chapters for book, chapters in bible.max_verses.items()
+            },
+        },
+    ).encode("utf-8")
+
+    temporary_path = compiled_path.with_name(f".{compiled_path.name}.tmp")
+
+    with temporary_path.open("wb") as compiled_file:
+        compiled_file.write(
+            _HEADER.pack(
+                _MAGIC,
+                _FORMAT_VERSION,
+                len(get_all_verse_ids()),
+                len(metadata),
+                len(content),
+            ),
+        )
+        compiled_file.write(metadata.ljust(_get_padded_length(len(metadata)), b" "))
+        compiled_file.write(start_offsets.tobytes())
+        compiled_file.write(end_offsets.tobytes())
+        compiled_file.write(content)
+
+    temporary_path.replace(compiled_path)
+
+    return compiled_path
+
+
+def load_compiled_bible(path: str | os.PathLike[str]) -> CompiledBible:
+    """Load the compiled Bible file at the given path.
+
+    :param path: The path of the compiled Bible file.
+    :return: The memory-mapped Bible.
+    :raises InvalidCompiledBibleError: if the file is not a compatible compiled Bible
+                                       file.
+    """
+    return CompiledBible(path)
+
+
+def _get_padded_length(length: int) -> int:
+    return -(-length // _OFFSET_SIZE) * _OFFSET_SIZE
+
+
+def _build_offsets(
+    verse_indices: dict[int, int],
+    byte_offsets: dict[int, int],
+) -> array[int]:
+    verse_ids: tuple[int, ...] = get_all_verse_ids()
+    offsets: array[int] = array(_OFFSET_TYPE, [_MISSING_OFFSET]) * len(verse_ids)
+
+    for ordinal, verse_id in enumerate(verse_ids):
+        string_index: int | None = verse_indices.get(verse_id)
+
+        if string_index is not None:
+            offsets[ordinal] = byte_offsets[string_index]
+
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    return offsets
+
+
+def _cast_offsets(buffer: memoryview) -> Sequence[int]:
+    if sys.byteorder == "little":
+        return buffer.cast(_OFFSET_TYPE)
+
+    offsets: array[int] = array(_OFFSET_TYPE)
+    offsets.frombytes(buffer)
+    offsets.byteswap()
+    return offsets
+
+
+def _dump_titles(titles: dict[Book, str]) -> dict[int, str]:
+    return {book.value: title for book, title in titles.items()}
+
+
+def _load_titles(titles: dict[str, str]) -> dict[Book, str]:
+    return {
+        Book(int(book)): title  # type: ignore[call-arg]
+        for book, title in titles.items()
+    }
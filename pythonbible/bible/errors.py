@@ -19,3 +19,11 @@ class VersionMissingVerseError(Exception):
         book, chapter, verse = get_book_chapter_verse(verse_id)
         msg = f"{version} is missing verse {verse_id} ({book} {chapter}:{verse})."
         super().__init__(msg)
+
+
+class InvalidCompiledBibleError(Exception):
+    """Raised when a compiled Bible file is invalid or incompatible."""
+
+
+class InvalidSearchIndexError(Exception):
+    """Raised when a search index file is invalid or incompatible."""
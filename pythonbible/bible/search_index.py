@@ -0,0 +1,449 @@
+"""Contains the SearchIndex class, an inverted index of the words in a Bible.
+
+The index maps each word (casefolded) to a posting list of the verses that contain it
+and the positions of the word within each verse, so term, prefix, and phrase queries
+only read the posting lists of the words in the query rather than the scripture
+content. Posting lists are compressed: verse ordinals and positions are stored as the
+differences from the previous ordinal or position, each as a variable length integer.
+
+Search index file layout (all integers are little-endian):
+
+* header: magic bytes, format version, metadata length, vocabulary length, and
+  postings length
+* metadata: UTF-8 JSON with the version of the Bible that was indexed
+* vocabulary: the UTF-8 encoded words of the index, sorted and separated by newlines
+* posting offsets: one unsigned 32-bit integer per word (plus one for the end of the
+  last posting list)
+* postings: the compressed posting lists
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pythonbible.bible.errors import InvalidSearchIndexError
+from pythonbible.bible.errors import VersionMissingVerseError
+from pythonbible.verses import BOOK_PLACE
+from pythonbible.verses import get_all_verse_ids
+from pythonbible.versions import Version
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from pythonbible.bible.bible import Bible
+    from pythonbible.book_groups import BookGroup
+    from pythonbible.books import Book
+
+SEARCH_INDEX_FILE_EXTENSION = ".pyindex"
+
+_MAGIC = b"PYINDEX\x00"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sIQQQ")
+_OFFSET_TYPE = "I"
+_HTML_TAG_REGULAR_EXPRESSION = re.compile(r"<[^>]*>")
+_WORD_REGULAR_EXPRESSION = re.compile(r"\w+")
+
+# A posting is the ordinal of a verse and the positions of a word in that verse.
+Posting = tuple[int, list[int]]
+
+
+class SearchIndex:
+    """An inverted index of the words in a Bible.
+
+    Queries return the ids of the matching verses in canonical order, and can be
+    limited to verses in the given books and book groups.
+    """
+
+    __slots__ = (
+        "_posting_offsets",
+        "_postings",
+        "_vocabulary",
+        "_word_indices",
+        "version",
+    )
+
+    def __init__(
+        self: SearchIndex,
+        version: Version,
+        vocabulary: list[str],
+        posting_offsets: array[int],
+        postings: bytes,
+    ) -> None:
+        """Initialize a SearchIndex.
+
+        Use build_search_index or load_search_index rather than creating a
+        SearchIndex directly.
+
+        :param version: The version of the Bible that was indexed.
+        :param vocabulary: The sorted words of the index.
+        :param posting_offsets: The offset of each word's posting list in postings,
+                                plus the end of the last posting list.
+        :param postings: The compressed posting lists.
+        """
+        self.version: Version = version
+        self._vocabulary: list[str] = vocabulary
+        self._word_indices: dict[str, int] = {
+            word: word_index for word_index, word in enumerate(vocabulary)
+        }
+        self._posting_offsets: array[int] = posting_offsets
+        self._postings: bytes = postings
+
+    def __len__(self: SearchIndex) -> int:
+        """Return the number of distinct words in the index."""
+        return len(self._vocabulary)
+
+    def __contains__(self: SearchIndex, word: object) -> bool:
+        """Return True if the given word appears in the indexed Bible."""
+        return isinstance(word, str) and word.casefold() in self._word_indices
+
+    def search_term(
+        self: SearchIndex,
+        term: str,
+        *,
+        books: Iterable[Book] | None = None,
+        book_groups: Iterable[BookGroup] | None = None,
+    ) -> list[int]:
+        """Return the ids of the verses that contain the given word.
+
+        :param term: The word to search for (case insensitive).
+        :param books: Only include verses in these books.
+        :param book_groups: Only include verses in the books of these book groups.
+        :return: The ids of the matching verses in canonical order.
+        """
+        words: list[str] = tokenize(term)
+
+        if len(words) != 1 or (word_index := self._word_indices.get(words[0])) is None:
+            return []
+
+        return self._get_verse_ids(
+            (ordinal for ordinal, _ in self._iter_postings(word_index)),
+            books,
+            book_groups,
+        )
+
+    def search_prefix(
+        self: SearchIndex,
+        prefix: str,
+        *,
+        books: Iterable[Book] | None = None,
+        book_groups: Iterable[BookGroup] | None = None,
+    ) -> list[int]:
+        """Return the ids of the verses that contain a word starting with the prefix.
+
+        :param prefix: The start of the words to search for (case insensitive).
+        :param books: Only include verses in these books.
+        :param book_groups: Only include verses in the books of these book groups.
+        :return: The ids of the matching verses in canonical order.
+        """
+        prefix = prefix.casefold()
+
+        if not prefix:
+            return []
+
+        ordinals: set[int] = set()
+        word_index: int = bisect_left(self._vocabulary, prefix)
+
+        while word_index < len(self._vocabulary) and self._vocabulary[
+            word_index
+        ].startswith(prefix):
+            ordinals.update(ordinal for ordinal, _ in self._iter_postings(word_index))
+            word_index += 1
+
+        return self._get_verse_ids(sorted(ordinals), books, book_groups)
+
+    def search_phrase(
+        self: SearchIndex,
+        phrase: str,
+        *,
+        books: Iterable[Book] | None = None,
+        book_groups: Iterable[BookGroup] | None = None,
+    ) -> list[int]:
+        """Return the ids of the verses that contain the words of the phrase in order.
+
+        Punctuation and case are ignored, so "In the beginning" matches "in the
+        beginning," but a phrase does not match across the end of a verse.
+
+        :param phrase: The words to search for (case insensitive).
+        :param books: Only include verses in these books.
+        :param book_groups: Only include verses in the books of these book groups.
+        :return: The ids of the matching verses in canonical order.
+        """
+        words: list[str] = tokenize(phrase)
+        word_indices: list[int] = []
+
+        for word in words:
+            word_index: int | None = self._word_indices.get(word)
+
+            if word_index is None:
+                return []
+
+            word_indices.append(word_index)
+
+        if not word_indices:
+            return []
+
+        # The positions where the phrase could start in each verse, narrowed down by
+        # each word in turn.
+        candidates: dict[int, set[int]] = {
+            ordinal: set(positions)
+            for ordinal, positions in self._iter_postings(word_indices[0])
+        }
+
+        for offset, next_word_index in enumerate(word_indices[1:], 1):
+            next_candidates: dict[int, set[int]] = {}
+
+            for ordinal, positions in self._iter_postings(next_word_index):
+                starts: set[int] | None = candidates.get(ordinal)
+
+                if starts is None:
+                    continue
+
+                if matching_starts := starts.intersection(
+                    position - offset for position in positions
+                ):
+                    next_candidates[ordinal] = matching_starts
+
+            candidates = next_candidates
+
+            if not candidates:
+                return []
+
+        return self._get_verse_ids(sorted(candidates), books, book_groups)
+
+    def save(self: SearchIndex, path: str | os.PathLike[str]) -> Path:
+        """Write the index to a search index file.
+
+        The file is written to a temporary file first and then moved into place.
+
+        :param path: The path of the search index file to write.
+        :return: The path of the search index file.
+        """
+        index_path = Path(path)
+        metadata: bytes = json.dumps({"version": self.version.value}).encode("utf-8")
+        vocabulary: bytes = "\n".join(self._vocabulary).encode("utf-8")
+        temporary_path = index_path.with_name(f".{index_path.name}.tmp")
+
+        with temporary_path.open("wb") as index_file:
+            index_file.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    _FORMAT_VERSION,
+                    len(metadata),
+                    len(vocabulary),
+                    len(self._postings),
+                ),
+            )
+            index_file.write(metadata)
+            index_file.write(vocabulary)
+            index_file.write(_get_little_endian_bytes(self._posting_offsets))
+            index_file.write(self._postings)
+
+        temporary_path.replace(index_path)
+
+        return index_path
+
+    def _iter_postings(self: SearchIndex, word_index: int) -> Iterator[Posting]:
+        postings: bytes = self._postings
+        index: int = self._posting_offsets[word_index]
+        end_index: int = self._posting_offsets[word_index + 1]
+        ordinal: int = 0
+
+        while index < end_index:
+            ordinal_difference, index = _decode_number(postings, index)
+            number_of_positions, index = _decode_number(postings, index)
+            ordinal += ordinal_difference
+            positions: list[int] = []
+            position: int = 0
+
+            for _ in range(number_of_positions):
+                position_difference, index = _decode_number(postings, index)
+                position += position_difference
+                positions.append(position)
+
+            yield ordinal, positions
+
+    @staticmethod
+    def _get_verse_ids(
+        ordinals: Iterable[int],
+        books: Iterable[Book] | None,
+        book_groups: Iterable[BookGroup] | None,
+    ) -> list[int]:
+        verse_ids: tuple[int, ...] = get_all_verse_ids()
+
+        if books is None and book_groups is None:
+            return [verse_ids[ordinal] for ordinal in ordinals]
+
+        book_values: set[int] = {book.value for book in books or ()}
+
+        for book_group in book_groups or ():
+            book_values.update(book.value for book in book_group.books)
+
+        return [
+            verse_id
+            for verse_id in (verse_ids[ordinal] for ordinal in ordinals)
+            if verse_id // BOOK_PLACE in book_values
+        ]
+
+
+def tokenize(text: str) -> list[str]:
+    """Return the casefolded words in the given text, ignoring punctuation.
+
+    :param text: The text to split into words.
+    :return: The words in the text.
+    """
+    return _WORD_REGULAR_EXPRESSION.findall(text.casefold())
+
+
+def build_search_index(bible: Bible) -> SearchIndex:
+    """Return a search index of the words in each verse of the given Bible.
+
+    Verses that are missing from the Bible are skipped, and HTML tags are ignored.
+
+    :param bible: The Bible to index.
+    :return: The search index.
+    """
+    word_postings: dict[str, list[Posting]] = {}
+
+    for ordinal, verse_id in enumerate(get_all_verse_ids()):
+        try:
+            scripture: str = bible.get_scripture(verse_id)
+        except VersionMissingVerseError:
+            continue
+
+        if bible.is_html:
+            scripture = _HTML_TAG_REGULAR_EXPRESSION.sub(" ", scripture)
+
+        word_positions: dict[str, list[int]] = {}
+
+        for position, word in enumerate(tokenize(scripture)):
+            word_positions.setdefault(word, []).append(position)
+
+        for word, positions in word_positions.items():
+            word_postings.setdefault(word, []).append((ordinal, positions))
+
+    vocabulary: list[str] = sorted(word_postings)
+    posting_offsets: array[int] = array(_OFFSET_TYPE, [0])
+    postings = bytearray()
+
+    for word in vocabulary:
+        _encode_postings(word_postings[word], postings)
+        posting_offsets.append(len(postings))
+
+    return SearchIndex(bible.version, vocabulary, posting_offsets, bytes(postings))
+
+
+def load_search_index(path: str | os.PathLike[str]) -> SearchIndex:
+    """Load the search index file at the given path.
+
+    :param path: The path of the search index file.
+    :return: The search index.
+    :raises InvalidSearchIndexError: if the file is not a compatible search index file
+    """
+    index_path = Path(path)
+    buffer: bytes = index_path.read_bytes()
+
+    if len(buffer) < _HEADER.size:
+        error_message = f"{index_path} is not a search index file."
+        raise InvalidSearchIndexError(error_message)
+
+    magic, format_version, metadata_length, vocabulary_length, postings_length = (
+        _HEADER.unpack_from(buffer)
+    )
+
+    if magic != _MAGIC:
+        error_message = f"{index_path} is not a search index file."
+        raise InvalidSearchIndexError(error_message)
+
+    if format_version != _FORMAT_VERSION:
+        error_message = (
+            f"{index_path} was written by an incompatible version of pythonbible."
+        )
+        raise InvalidSearchIndexError(error_message)
+
+    vocabulary_start: int = _HEADER.size + metadata_length
+    offsets_start: int = vocabulary_start + vocabulary_length
+
+    try:
+        metadata = json.loads(buffer[_HEADER.size : vocabulary_start])
+        version = Version(metadata["version"])  # type: ignore[call-arg]
+        vocabulary: list[str] = (
+            buffer[vocabulary_start:offsets_start].decode("utf-8").split("\n")
+            if vocabulary_length
+            else []
+        )
+        posting_offsets: array[int] = array(_OFFSET_TYPE)
+        postings_start: int = offsets_start + (
+            (len(vocabulary) + 1) * posting_offsets.itemsize
+        )
+        posting_offsets.frombytes(buffer[offsets_start:postings_start])
+
+        if sys.byteorder != "little":
+            posting_offsets.byteswap()
+    except (KeyError, UnicodeDecodeError, ValueError) as error:
+        error_message = f"{index_path} is truncated or corrupt."
+        raise InvalidSearchIndexError(error_message) from error
+
+    if (
+        len(buffer) != postings_start + postings_length
+        or posting_offsets[-1] != postings_length
+    ):
+        error_message = f"{index_path} is truncated or corrupt."
+        raise InvalidSearchIndexError(error_message)
+
+    return SearchIndex(version, vocabulary, posting_offsets, buffer[postings_start:])
+
+
+def _get_little_endian_bytes(offsets: array[int]) -> bytes:
+    if sys.byteorder == "little":
+        return offsets.tobytes()
+
+    swapped_offsets: array[int] = array(offsets.typecode, offsets)
+    swapped_offsets.byteswap()
+    return swapped_offsets.tobytes()
+
+
+def _encode_postings(postings: list[Posting], buffer: bytearray) -> None:
+    previous_ordinal: int = 0
+
+    for ordinal, positions in postings:
+        _encode_number(ordinal - previous_ordinal, buffer)
+        _encode_number(len(positions), buffer)
+        previous_ordinal = ordinal
+        previous_position: int = 0
+
+        for position in positions:
+            _encode_number(position - previous_position, buffer)
+            previous_position = position
+
+
+def _encode_number(number: int, buffer: bytearray) -> None:
+    # Seven bits per byte, with the high bit set on every byte but the last.
+    while number >= 0x80:  # noqa: PLR2004
+        buffer.append(number & 0x7F | 0x80)
+        number >>= 7
+
+    buffer.append(number)
+
+
+def _decode_number(buffer: bytes, index: int) -> tuple[int, int]:
+    number: int = 0
+    shift: int = 0
+
+    while True:
+        byte: int = buffer[index]
+        index += 1
+        number |= (byte & 0x7F) << shift
+
+        if byte < 0x80:  # noqa: PLR2004
+            return number, index
+
+        shift += 7
@@ -0,0 +1,204 @@
+"""Contains the controls of pythonbible's internal function caches.
+
+Several functions memoize their results with functools.lru_cache, each holding up to
+128 results by default. The caches are listed in CACHES by "module.function" name,
+and can be inspected, resized, cleared, and pre-warmed from here, e.g. to bound the
+memory a long-lived service uses or to move the cost of compiling the regular
+expressions to startup.
+
+The Bible cache and the reference cache have their own controls
+(configure_bible_cache and configure_reference_cache).
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+from pythonbible.book_groups import BOOK_GROUPS
+from pythonbible.books import Book
+from pythonbible.function_util import get_function
+from pythonbible.function_util import replace_function
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+
+class CacheInfo(NamedTuple):
+    """Statistics about one of the function caches."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+    @property
+    def hit_ratio(self: CacheInfo) -> float:
+        """Return the fraction of calls that were hits (0.0 if there were none)."""
+        calls: int = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class _Cache(NamedTuple):
+    module_name: str
+    qualified_name: str
+    # The arguments to call the function with to warm the cache, if it is worth it.
+    warm_arguments: Callable[[], Iterable[tuple[Any, ...]]] | None = None
+
+
+def _get_book_arguments() -> Iterable[tuple[Any, ...]]:
+    return ((book,) for book in Book)
+
+
+def _get_chapter_arguments() -> Iterable[tuple[Any, ...]]:
+    from pythonbible.verses import get_number_of_chapters  # noqa: PLC0415
+
+    return (
+        (book, chapter)
+        for book in Book
+        for chapter in range(1, get_number_of_chapters(book) + 1)
+    )
+
+
+CACHES: dict[str, _Cache] = {
+    "verses.get_number_of_chapters": _Cache(
+        "pythonbible.verses",
+        "get_number_of_chapters",
+        _get_book_arguments,
+    ),
+    "verses.is_single_chapter_book": _Cache(
+        "pythonbible.verses",
+        "is_single_chapter_book",
+        _get_book_arguments,
+    ),
+    "verses.get_number_of_verses": _Cache(
+        "pythonbible.verses",
+        "get_number_of_verses",
+        _get_chapter_arguments,
+    ),
+    "verses.get_verse_id": _Cache("pythonbible.verses", "get_verse_id"),
+    "regular_expressions.get_book_regular_expression": _Cache(
+        "pythonbible.regular_expressions",
+        "get_book_regular_expression",
+        lambda: [()],
+    ),
+    "regular_expressions.get_scripture_reference_regular_expression": _Cache(
+        "pythonbible.regular_expressions",
+        "get_scripture_reference_regular_expression",
+        lambda: [()],
+    ),
+    "grammar._compile_reference_grammar": _Cache(
+        "pythonbible.grammar",
+        "_compile_reference_grammar",
+        lambda: [((),), (tuple(BOOK_GROUPS.items()),)],
+    ),
+    "reference_normalizer._get_book_regular_expression": _Cache(
+        "pythonbible.reference_normalizer",
+        "_get_book_regular_expression",
+        lambda: [(0,)],
+    ),
+    "bible._clean": _Cache("pythonbible.bible.bible", "_clean"),
+    "bible.clean_html": _Cache("pythonbible.bible.bible", "clean_html"),
+    "bible._load_installed_search_index": _Cache(
+        "pythonbible.bible",
+        "_load_installed_search_index",
+    ),
+    "formatter.get_verse_text": _Cache("pythonbible.formatter", "get_verse_text"),
+}
+
+
+def get_cache_info() -> dict[str, CacheInfo]:
+    """Return the hits, misses, maximum size, and current size of each cache.
+
+    :return: The statistics of each cache, by name
+    :rtype: dict[str, CacheInfo]
+    """
+    return {
+        name: CacheInfo(*_get_cached_function(name).cache_info()) for name in CACHES
+    }
+
+
+def configure_cache(name: str, maxsize: int | None) -> None:
+    """Set the maximum number of results the given cache holds.
+
+    The cache is replaced by an empty cache of the new size. Configure caches before
+    enabling instrumentation, since disabling instrumentation puts back the caches
+    that were in place when it was enabled.
+
+    :param name: The name of the cache (one of the keys of CACHES)
+    :type name: str
+    :param maxsize: The maximum number of results, 0 to disable the cache, or None for
+                    no limit
+    :type maxsize: int | None
+    :raises ValueError: if the name is not one of the caches or maxsize is negative
+    """
+    _validate_name(name)
+
+    if maxsize is not None and maxsize < 0:
+        error_message = f"The maximum size of a cache must not be negative: {maxsize}."
+        raise ValueError(error_message)
+
+    uncached_function: Callable[..., Any] = _get_cached_function(name).__wrapped__
+    replace_function(
+        CACHES[name].module_name,
+        CACHES[name].qualified_name,
+        lambda _: lru_cache(maxsize)(uncached_function),
+    )
+
+
+def clear_caches(names: Iterable[str] | None = None) -> None:
+    """Remove all the results from the given caches and reset their statistics.
+
+    :param names: The names of the caches to clear, defaults to all of them
+    :type names: Iterable[str] | None
+    :raises ValueError: if a name is not one of the caches
+    """
+    for name in CACHES if names is None else names:
+        _validate_name(name)
+        _get_cached_function(name).cache_clear()
+
+
+def warm_caches(names: Iterable[str] | None = None) -> None:
+    """Fill the given caches with the results that most calls need.
+
+    The regular expressions and reference grammars are compiled, and the numbers of
+    chapters and verses of each book are computed, up to the maximum size of each
+    cache. Caches of arbitrary inputs (e.g. verse ids) are not warmed.
+
+    :param names: The names of the caches to warm, defaults to all of them
+    :type names: Iterable[str] | None
+    :raises ValueError: if a name is not one of the caches
+    """
+    for name in CACHES if names is None else names:
+        _validate_name(name)
+        warm_arguments = CACHES[name].warm_arguments
+
+        if warm_arguments is None:
+            continue
+
+        cached_function: Any = _get_cached_function(name)
+        maxsize: int | None = cached_function.cache_info().maxsize
+
+        # Warming more results than the cache holds would only evict the first ones.
+        for arguments in islice(warm_arguments(), maxsize):
+            cached_function(*arguments)
+
+
+def _validate_name(name: str) -> None:
+    if name not in CACHES:
+        error_message = f"{name!r} is not one of the pythonbible caches."
+        raise ValueError(error_message)
+
+
+def _get_cached_function(name: str) -> Any:  # noqa: ANN401
+    _, _, function = get_function(CACHES[name].module_name, CACHES[name].qualified_name)
+
+    # Look through any wrappers (e.g. instrumentation) for the cached function.
+    while not hasattr(function, "cache_info"):
+        function = function.__wrapped__
+
+    return function
@@ -2,24 +2,38 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from pythonbible.errors import InvalidVerseError
+from pythonbible.books import Book
+from pythonbible.intervals import convert_intervals_to_references
 from pythonbible.normalized_reference import NormalizedReference
-from pythonbible.validator import is_valid_verse_id
-from pythonbible.verses import VERSE_IDS
-from pythonbible.verses import get_book_chapter_verse
+from pythonbible.verses import get_all_verse_ids
+from pythonbible.verses import get_book_number
+from pythonbible.verses import get_chapter_number
 from pythonbible.verses import get_number_of_chapters
 from pythonbible.verses import get_number_of_verses
 from pythonbible.verses import get_verse_id
+from pythonbible.verses import get_verse_number
+from pythonbible.verses import get_verse_ordinal
+from pythonbible.versification import get_versification
 
 if TYPE_CHECKING:
-    from pythonbible.books import Book
+    from collections.abc import Callable
 
+    from pythonbible.intervals import VerseInterval
+    from pythonbible.versification import Versification
+    from pythonbible.versions import Version
 
-def convert_references_to_verse_ids(references: list[NormalizedReference]) -> list[int]:
+
+def convert_references_to_verse_ids(
+    references: list[NormalizedReference],
+    version: Version | None = None,
+) -> list[int]:
     """Convert a list of NormalizedReference objects into a list of verse id integers.
 
     :param references: A list of normalized references
     :type references: list[NormalizedReference]
+    :param version: The version whose chapter and verse numbering to use, defaults to
+                    the standard versification
+    :type version: Version | None
     :return: The list of verse ids associated with the references
     :rtype: list[int]
     """
@@ -27,23 +41,31 @@ def convert_references_to_verse_ids(references: list[NormalizedReference]) -> li
 
     if references is not None:
         for reference in references:
-            verse_ids.extend(convert_reference_to_verse_ids(reference))
+            verse_ids.extend(convert_reference_to_verse_ids(reference, version))
 
     return verse_ids
 
 
-def convert_reference_to_verse_ids(reference: NormalizedReference) -> tuple[int, ...]:
+def convert_reference_to_verse_ids(
+    reference: NormalizedReference,
+    version: Version | None = None,
+) -> tuple[int, ...]:
     """Convert the given NormalizedReference object into a tuple of verse id integers.
 
     :param reference: A normalized reference
     :type reference: NormalizedReference
+    :param version: The version whose chapter and verse numbering to use, defaults to
+                    the standard versification
+    :type version: Version | None
     :return: The tuple of verse ids associated with the reference
     :rtype: tuple[int, ...]
     """
-    # TODO - require version since chapter and verse counts can differ by version
     if reference is None:
         return ()
 
+    if version is not None:
+        return _convert_reference_to_verse_ids(reference, get_versification(version))
+
     start_book: Book = reference.book
     start_chapter: int = reference.start_chapter or 1
     start_verse: int = reference.start_verse or 1
@@ -62,95 +84,103 @@ def convert_reference_to_verse_ids(reference: NormalizedReference) -> tuple[int,
         end_chapter,
         end_verse,
     )
-    return VERSE_IDS[
-        VERSE_IDS.index(start_verse_id) : VERSE_IDS.index(end_verse_id) + 1
+    return get_all_verse_ids()[
+        get_verse_ordinal(start_verse_id) : get_verse_ordinal(end_verse_id) + 1
     ]
 
 
-def convert_verse_ids_to_references(verse_ids: list[int]) -> list[NormalizedReference]:
+def convert_verse_ids_to_references(
+    verse_ids: list[int],
+    version: Version | None = None,
+) -> list[NormalizedReference]:
     """Convert a list of verse ids into a list of NormalizedReferences.
 
     :param verse_ids: A list of verse ids
     :type verse_ids: list[int]
+    :param version: The version whose chapter and verse numbering to use, defaults to
+                    the standard versification
+    :type version: Version | None
     :return: The list of normalized references associated with the verse ids
     :rtype: list[NormalizedReference]
     :raises InvalidVerseError: if one or more of the verse_ids does not correspond to
                                a valid verse
     """
-    references: list[NormalizedReference] = []
-
     if verse_ids is None or not verse_ids:
-        return references
+        return []
 
     verse_ids.sort()
+    versification: Versification | None = (
+        None if version is None else get_versification(version)
+    )
+    get_ordinal: Callable[[int], int] = (
+        get_verse_ordinal if versification is None else versification.get_verse_ordinal
+    )
 
-    # Initialize with the first verse id in the list
-    first_verse = verse_ids[0]
+    # Group the verses into ranges of consecutive ordinals; only the first and last
+    # verse of each range need their book, chapter, and verse numbers.
+    intervals: list[VerseInterval] = []
+    start_ordinal: int = get_ordinal(verse_ids[0])
+    previous_ordinal: int = start_ordinal
 
-    if not is_valid_verse_id(first_verse):
-        raise InvalidVerseError(verse_id=first_verse)
+    for verse_id in verse_ids[1:]:
+        verse_ordinal: int = get_ordinal(verse_id)
 
-    previous_verse_id: int = verse_ids[0]
+        # If it's just the next verse in the range, extend the range and continue.
+        if verse_ordinal - previous_ordinal == 1:
+            previous_ordinal = verse_ordinal
+            continue
 
-    book: Book
-    chapter: int
-    verse: int
-    book, chapter, verse = get_book_chapter_verse(previous_verse_id)
+        # At the beginning of a new range, so close the current one.
+        intervals.append((start_ordinal, previous_ordinal))
+        start_ordinal = previous_ordinal = verse_ordinal
 
-    start_book: Book = book
-    previous_book: Book = book
-    start_chapter: int = chapter
-    start_verse: int = verse
-    previous_chapter: int = chapter
-    previous_verse: int = verse
+    # The last range doesn't get closed within the loop, so close it now.
+    intervals.append((start_ordinal, previous_ordinal))
 
-    # Loop through the remaining verse ids in the list
-    for verse_id in verse_ids[1:]:
-        if not is_valid_verse_id(verse_id):
-            raise InvalidVerseError(verse_id=verse_id)
-
-        book, chapter, verse = get_book_chapter_verse(verse_id)
-
-        # If it's just the next verse in the range, updated the previous fields and
-        # continue.
-        if VERSE_IDS.index(verse_id) - VERSE_IDS.index(previous_verse_id) == 1:
-            previous_book = book
-            previous_chapter = chapter
-            previous_verse = verse
-            previous_verse_id = verse_id
-            continue
+    if versification is None:
+        return convert_intervals_to_references(intervals)
 
-        # At the beginning of a new range, so create the reference and reset all of the
-        # fields.
-        references.append(
-            NormalizedReference(
-                start_book,
-                start_chapter,
-                start_verse,
-                previous_chapter,
-                previous_verse,
-                previous_book,
-            ),
+    return [
+        _get_reference(
+            versification.get_verse_id_by_ordinal(start_ordinal),
+            versification.get_verse_id_by_ordinal(end_ordinal),
         )
+        for start_ordinal, end_ordinal in intervals
+    ]
+
 
-        start_book = book
-        previous_book = book
-        start_chapter = chapter
-        start_verse = verse
-        previous_chapter = chapter
-        previous_verse = verse
-        previous_verse_id = verse_id
-
-    # The last range reference doesn't get created within the loop, so create it now.
-    references.append(
-        NormalizedReference(
+def _convert_reference_to_verse_ids(
+    reference: NormalizedReference,
+    versification: Versification,
+) -> tuple[int, ...]:
+    start_book: Book = reference.book
+    end_book: Book = reference.end_book or start_book
+    end_chapter: int = reference.end_chapter or versification.get_number_of_chapters(
+        end_book,
+    )
+    end_verse: int = reference.end_verse or versification.get_number_of_verses(
+        end_book,
+        end_chapter,
+    )
+
+    return versification.get_verse_ids(
+        versification.get_verse_id(
             start_book,
-            start_chapter,
-            start_verse,
-            previous_chapter,
-            previous_verse,
-            previous_book,
+            reference.start_chapter or 1,
+            reference.start_verse or 1,
         ),
+        versification.get_verse_id(end_book, end_chapter, end_verse),
     )
 
-    return references
+
+def _get_reference(start_verse_id: int, end_verse_id: int) -> NormalizedReference:
+    # Builds the reference from the verse ids, since the verse tables in
+    # pythonbible.verses are for the standard versification.
+    return NormalizedReference(
+        Book(get_book_number(start_verse_id)),  # type: ignore[call-arg]
+        get_chapter_number(start_verse_id),
+        get_verse_number(start_verse_id),
+        get_chapter_number(end_verse_id),
+        get_verse_number(end_verse_id),
+        Book(get_book_number(end_verse_id)),  # type: ignore[call-arg]
+    )
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
 from functools import singledispatch
+from typing import TYPE_CHECKING
 
 from pythonbible.normalized_reference import NormalizedReference
 from pythonbible.parser import get_references
+from pythonbible.reference_array import ReferenceArray
+from pythonbible.verses import BOOK_PLACE
+from pythonbible.verses import get_all_verse_ids
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 
 @singledispatch
-def count_books(references: list[NormalizedReference]) -> int:
+def count_books(references: Iterable[NormalizedReference]) -> int:
     """Return the count of books of the Bible included in the given list of references.
 
-    :param references: A list of normalized references
-    :type references: list[NormalizedReference]
+    :param references: A list (or any other iterable) of normalized references
+    :type references: Iterable[NormalizedReference]
     :return: The count of books of the Bible included in the given list of references
     :rtype: int
     """
@@ -28,7 +35,20 @@ def _count_books_string(reference: str) -> int:  # type: ignore[misc]
     return _get_number_of_books_in_references(get_references(reference))
 
 
-def _get_number_of_books_in_references(references: list[NormalizedReference]) -> int:
+@count_books.register
+def _count_books_array(references: ReferenceArray) -> int:  # type: ignore[misc]
+    verse_ids: tuple[int, ...] = get_all_verse_ids()
+    return sum(
+        verse_ids[end_ordinal] // BOOK_PLACE
+        - verse_ids[start_ordinal] // BOOK_PLACE
+        + 1
+        for start_ordinal, end_ordinal in references.intervals()
+    )
+
+
+def _get_number_of_books_in_references(
+    references: Iterable[NormalizedReference],
+) -> int:
     return sum(_get_number_of_books_in_reference(reference) for reference in references)
 
 
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
 from functools import singledispatch
+from typing import TYPE_CHECKING
 
-from pythonbible.books import Book
 from pythonbible.normalized_reference import NormalizedReference
 from pythonbible.parser import get_references
+from pythonbible.reference_array import ReferenceArray
+from pythonbible.verses import get_chapter_index
+from pythonbible.verses import get_chapter_index_by_ordinal
 from pythonbible.verses import get_number_of_chapters
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pythonbible.books import Book
+
 
 @singledispatch
-def count_chapters(references: list[NormalizedReference]) -> int:
+def count_chapters(references: Iterable[NormalizedReference]) -> int:
     """Return the count of chapters in the given list of references.
 
-    :param references: A list of normalized references
-    :type references: list[NormalizedReference]
+    :param references: A list (or any other iterable) of normalized references
+    :type references: Iterable[NormalizedReference]
     :return: The count of chapters of books of the Bible included in the given list of
              references
     :rtype: int
@@ -31,7 +39,19 @@ def _count_chapters_string(reference: str) -> int:  # type: ignore[misc]
     return _get_number_of_chapters_in_references(get_references(reference))
 
 
-def _get_number_of_chapters_in_references(references: list[NormalizedReference]) -> int:
+@count_chapters.register
+def _count_chapters_array(references: ReferenceArray) -> int:  # type: ignore[misc]
+    return sum(
+        get_chapter_index_by_ordinal(end_ordinal)
+        - get_chapter_index_by_ordinal(start_ordinal)
+        + 1
+        for start_ordinal, end_ordinal in references.intervals()
+    )
+
+
+def _get_number_of_chapters_in_references(
+    references: Iterable[NormalizedReference],
+) -> int:
     return sum(
         _get_number_of_chapters_in_reference(reference) for reference in references
     )
@@ -39,26 +59,12 @@ def _get_number_of_chapters_in_references(references: list[NormalizedReference])
 
 def _get_number_of_chapters_in_reference(reference: NormalizedReference) -> int:
     # TODO - require a Version, since the number of chapters can vary by version
-    start_chapter = reference.start_chapter or 1
-
-    if not reference.end_book or reference.book == reference.end_book:
-        end_chapter = reference.end_chapter or get_number_of_chapters(reference.book)
-        return end_chapter - start_chapter + 1
-
-    # Start book chapters
-    number_of_chapters: int = get_number_of_chapters(reference.book) - start_chapter + 1
-
-    # Middle book(s) chapters
-    number_of_chapters += sum(
-        get_number_of_chapters(Book(book_id))  # type: ignore[call-arg,misc]
-        for book_id in range(
-            reference.book.value + 1,
-            reference.end_book.value,
-        )
+    end_book: Book = reference.end_book or reference.book
+    start_chapter: int = reference.start_chapter or 1
+    end_chapter: int = reference.end_chapter or get_number_of_chapters(end_book)
+
+    return (
+        get_chapter_index(end_book, end_chapter)
+        - get_chapter_index(reference.book, start_chapter)
+        + 1
     )
-
-    # End book chapters
-    end_chapter = reference.end_chapter or get_number_of_chapters(reference.end_book)
-    number_of_chapters += end_chapter
-
-    return number_of_chapters
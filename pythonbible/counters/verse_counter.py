@@ -1,20 +1,28 @@
 from __future__ import annotations
 
 from functools import singledispatch
+from typing import TYPE_CHECKING
 
 from pythonbible.books import Book
+from pythonbible.errors import InvalidChapterError
+from pythonbible.errors import InvalidVerseError
+from pythonbible.intervals import convert_reference_to_interval
 from pythonbible.normalized_reference import NormalizedReference
 from pythonbible.parser import get_references
+from pythonbible.reference_array import ReferenceArray
 from pythonbible.verses import get_number_of_chapters
 from pythonbible.verses import get_number_of_verses
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 @singledispatch
-def count_verses(references: list[NormalizedReference]) -> int:
+def count_verses(references: Iterable[NormalizedReference]) -> int:
     """Return the count of verses included in the given list of references.
 
-    :param references: A list of normalized references
-    :type references: list[NormalizedReference]
+    :param references: A list (or any other iterable) of normalized references
+    :type references: Iterable[NormalizedReference]
     :return: The count of verses included in the given list of references
     :rtype: int
     """
@@ -31,13 +39,33 @@ def _count_verses_string(reference: str) -> int:  # type: ignore[misc]
     return _get_number_verses_in_references(get_references(reference))
 
 
-def _get_number_verses_in_references(references: list[NormalizedReference]) -> int:
+@count_verses.register
+def _count_verses_array(references: ReferenceArray) -> int:  # type: ignore[misc]
+    return (
+        sum(references.end_ordinals) - sum(references.start_ordinals) + len(references)
+    )
+
+
+def _get_number_verses_in_references(
+    references: Iterable[NormalizedReference],
+) -> int:
     return sum(
         _get_number_of_verses_in_reference(reference) for reference in references
     )
 
 
 def _get_number_of_verses_in_reference(reference: NormalizedReference) -> int:
+    try:
+        start_ordinal, end_ordinal = convert_reference_to_interval(reference)
+    except (InvalidChapterError, InvalidVerseError):
+        # References to verses that don't exist have no interval, so they are counted
+        # chapter by chapter from the verse numbers, as they always have been.
+        return _get_number_of_verses_in_chapters(reference)
+
+    return end_ordinal - start_ordinal + 1
+
+
+def _get_number_of_verses_in_chapters(reference: NormalizedReference) -> int:
     number_of_verses: int = 0
     start_book = reference.book
     end_book = reference.end_book or start_book
@@ -3,21 +3,27 @@ from __future__ import annotations
 from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import TextIO
 
 from pythonbible.bible import get_bible
-from pythonbible.converter import convert_references_to_verse_ids
-from pythonbible.converter import convert_verse_ids_to_references
 from pythonbible.errors import MissingBookFileError
 from pythonbible.errors import MissingVerseFileError
-from pythonbible.verses import get_book_chapter_verse
+from pythonbible.intervals import sort_references
+from pythonbible.verses import get_book_chapter_verse_by_ordinal
+from pythonbible.verses import get_chapter_ordinals
 from pythonbible.verses import get_number_of_chapters
 from pythonbible.verses import get_number_of_verses
+from pythonbible.verses import get_verse_ordinal
 from pythonbible.verses import is_single_chapter_book
 from pythonbible.versions import DEFAULT_VERSION
 from pythonbible.versions import Version
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
     from pythonbible.bible.bible import Bible
+    from pythonbible.bible.bible import SupportsWriteBytes
     from pythonbible.books import Book
     from pythonbible.normalized_reference import NormalizedReference
 
@@ -41,12 +47,10 @@ def format_scripture_references(
 
     sorted_references: list[NormalizedReference] = references
 
-    # Only sort if there is more than one reference as it can take a long time if there
-    # are a lot of verses covered by the references.
+    # Only sort if there is more than one reference so that a single reference is
+    # formatted exactly as given.
     if len(references) > 1:
-        verse_ids: list[int] = convert_references_to_verse_ids(references)
-        verse_ids.sort()
-        sorted_references = convert_verse_ids_to_references(verse_ids)
+        sorted_references = sort_references(references)
 
     formatted_reference: str = ""
 
@@ -434,30 +438,148 @@ def format_scripture_text(verse_ids: list[int], **kwargs: Any) -> str:
     :return: The formatted scripture text for the verse ids
     :rtype: str
     """
-    one_verse_per_paragraph: bool = kwargs.get("one_verse_per_paragraph", False)
-    full_title: bool = kwargs.get("full_title", False)
+    verse_ids.sort()
+    return "".join(_iter_scripture_text(verse_ids, **kwargs))
+
+
+def iter_scripture_text(verse_ids: Iterable[int], **kwargs: Any) -> Iterator[str]:
+    """Yield the formatted scripture text for the given verse IDs in chunks.
+
+    Each book title, chapter heading, and paragraph is yielded as it is formatted, so
+    the chunks joined together are the same as format_scripture_text for the same
+    verse ids and keyword arguments.
+
+    :param verse_ids: The integer verse ids
+    :type verse_ids: Iterable[int]
+    :return: An iterator of the chunks of formatted scripture text
+    :rtype: Iterator[str]
+    """
+    return _iter_scripture_text(sorted(verse_ids), **kwargs)
+
+
+def write_scripture_text(
+    verse_ids: Iterable[int],
+    stream: TextIO,
+    **kwargs: Any,
+) -> int:
+    """Write the formatted scripture text for the given verse IDs to a text stream.
+
+    The text is written one book title, chapter heading, or paragraph at a time, so
+    large passages are never held in memory as one string.
+
+    :param verse_ids: The integer verse ids
+    :type verse_ids: Iterable[int]
+    :param stream: A text stream, such as a file opened in text mode
+    :type stream: TextIO
+    :return: The number of characters written
+    :rtype: int
+    """
+    number_of_characters: int = 0
+
+    for chunk in iter_scripture_text(verse_ids, **kwargs):
+        stream.write(chunk)
+        number_of_characters += len(chunk)
+
+    return number_of_characters
+
+
+def write_scripture_bytes(
+    verse_ids: Iterable[int],
+    stream: SupportsWriteBytes,
+    **kwargs: Any,
+) -> int:
+    """Write the formatted scripture text for the given verse IDs to a binary stream.
+
+    The text is the UTF-8 encoding of format_scripture_text for the same verse ids and
+    keyword arguments, but the scripture content is written straight from the Bible's
+    content buffer, so large passages are never held in memory as one string.
+
+    :param verse_ids: The integer verse ids
+    :type verse_ids: Iterable[int]
+    :param stream: A binary stream, such as a file opened in binary mode
+    :type stream: SupportsWriteBytes
+    :return: The number of bytes written
+    :rtype: int
+    """
+    bible: Bible = _get_scripture_text_bible(**kwargs)
+    number_of_bytes: int = 0
+
+    for chunk in _iter_scripture_text_chunks(sorted(verse_ids), bible, **kwargs):
+        if isinstance(chunk, str):
+            encoded_chunk: bytes = chunk.encode("utf-8")
+            stream.write(encoded_chunk)
+            number_of_bytes += len(encoded_chunk)
+            continue
+
+        number_of_bytes += bible.write_scripture(stream, *chunk)
+        stream.write(_PARAGRAPH_END)
+        number_of_bytes += len(_PARAGRAPH_END)
+
+    return number_of_bytes
+
+
+def _get_scripture_text_bible(**kwargs: Any) -> Bible:
+    return get_bible(
+        kwargs.get("version", DEFAULT_VERSION),
+        get_scripture_text_bible_type(**kwargs),
+    )
+
+
+def get_scripture_text_bible_type(**kwargs: Any) -> str:
+    """Return the type of Bible that format_scripture_text reads the text from.
+
+    The keyword arguments are the same as format_scripture_text; only format_type and
+    include_verse_numbers affect the type.
+
+    :return: The Bible type (e.g. "html" or "plain_text_readers")
+    :rtype: str
+    """
     format_type: str = kwargs.get("format_type", "html")
     include_verse_numbers: bool = kwargs.get("include_verse_numbers", True)
-    version: Version = kwargs.get("version", DEFAULT_VERSION)
-
-    is_html: bool = format_type == "html"
 
-    bible_type = "html" if is_html else "plain_text"
+    bible_type = "html" if format_type == "html" else "plain_text"
 
     if not include_verse_numbers:
         bible_type += "_readers"
 
-    bible = get_bible(version, bible_type)
+    return bible_type
 
-    verse_ids.sort()
-    text: str = ""
+
+def _iter_scripture_text(verse_ids: Iterable[int], **kwargs: Any) -> Iterator[str]:
+    bible: Bible = _get_scripture_text_bible(**kwargs)
+
+    for chunk in _iter_scripture_text_chunks(verse_ids, bible, **kwargs):
+        yield (
+            chunk
+            if isinstance(chunk, str)
+            else _format_paragraph(bible.get_scripture(*chunk))
+        )
+
+
+def _iter_scripture_text_chunks(
+    verse_ids: Iterable[int],
+    bible: Bible,
+    **kwargs: Any,
+) -> Iterator[str | tuple[int, int]]:
+    # Yields the title and chapter headings as strings and each paragraph as the
+    # (start verse id, end verse id) range of its scripture, in order. The verse ids
+    # must already be sorted.
+    one_verse_per_paragraph: bool = kwargs.get("one_verse_per_paragraph", False)
+    full_title: bool = kwargs.get("full_title", False)
+    is_html: bool = kwargs.get("format_type", "html") == "html"
+
+    is_first_book: bool = True
     current_book: Book | None = None
     current_chapter: int | None = None
     current_start_verse: int | None = None
     current_end_verse: int | None = None
+    # The first and last ordinals of the current chapter, so the book and chapter
+    # numbers are only looked up when the verses move to another chapter.
+    chapter_start_ordinal: int = 0
+    chapter_end_ordinal: int = -1
 
     for verse_id in verse_ids:
-        book, chapter_number, _ = get_book_chapter_verse(verse_id)
+        ordinal: int = get_verse_ordinal(verse_id)
 
         if (
             one_verse_per_paragraph
@@ -465,13 +587,18 @@ def format_scripture_text(verse_ids: list[int], **kwargs: Any) -> str:
             or verse_id - current_end_verse > 1
         ):
             if current_start_verse and current_end_verse:
-                verse_text = bible.get_scripture(current_start_verse, current_end_verse)
-                text += _format_paragraph(verse_text)
+                yield current_start_verse, current_end_verse
 
             current_start_verse = verse_id
 
         current_end_verse = verse_id
 
+        if chapter_start_ordinal <= ordinal <= chapter_end_ordinal:
+            continue
+
+        chapter_start_ordinal, chapter_end_ordinal = get_chapter_ordinals(ordinal)
+        book, chapter_number, _ = get_book_chapter_verse_by_ordinal(ordinal)
+
         if book != current_book:
             current_book = book
             current_chapter = chapter_number
@@ -480,17 +607,15 @@ def format_scripture_text(verse_ids: list[int], **kwargs: Any) -> str:
                 if full_title
                 else bible.short_titles.get(book, book.title)
             )
-            text += _format_title(title, is_html, not text)
-            text += _format_chapter(chapter_number, is_html)
+            yield _format_title(title, is_html, is_first_book)
+            yield _format_chapter(chapter_number, is_html)
+            is_first_book = False
         elif chapter_number != current_chapter:
             current_chapter = chapter_number
-            text += _format_chapter(chapter_number, is_html)
+            yield _format_chapter(chapter_number, is_html)
 
     if current_start_verse and current_end_verse:
-        verse_text = bible.get_scripture(current_start_verse, current_end_verse)
-        text += _format_paragraph(verse_text)
-
-    return text
+        yield current_start_verse, current_end_verse
 
 
 def _format_title(title: str, is_html: bool, is_first_book: bool) -> str:
@@ -508,6 +633,9 @@ def _format_paragraph(paragraph: str) -> str:
     return f"{paragraph}\n"
 
 
+_PARAGRAPH_END = _format_paragraph("").encode("utf-8")
+
+
 @lru_cache()
 def get_verse_text(verse_id: int, version: Version = DEFAULT_VERSION) -> str:
     """Return the scripture text of the given verse id and version of the Bible.
@@ -0,0 +1,85 @@
+"""Contains utilities for replacing pythonbible's functions while it is running.
+
+Modules import each other's functions by name (e.g. parser imports
+convert_all_roman_numerals_to_integers), so replacing a function means replacing it
+in every pythonbible module that has imported it, not just the module that defines it.
+"""
+
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+# The object an attribute was set on, the name of the attribute, and its old value.
+Patch = tuple[object, str, Any]
+
+
+def get_function(module_name: str, qualified_name: str) -> tuple[object, str, Any]:
+    """Return the current function with the given module and qualified name.
+
+    :param module_name: The name of the module that defines the function.
+    :param qualified_name: The name of the function, or of the class and method
+                           (e.g. "Bible.get_scripture").
+    :return: The module or class that has the function, the function's attribute
+             name, and the function.
+    """
+    owner: object = import_module(module_name)
+    *class_names, name = qualified_name.split(".")
+
+    for class_name in class_names:
+        owner = getattr(owner, class_name)
+
+    return owner, name, getattr(owner, name)
+
+
+def replace_function(
+    module_name: str,
+    qualified_name: str,
+    replace: Callable[[Any], Any],
+) -> list[Patch]:
+    """Replace a function everywhere pythonbible refers to it.
+
+    :param module_name: The name of the module that defines the function.
+    :param qualified_name: The name of the function, or of the class and method.
+    :param replace: Called with the current function to return its replacement.
+    :return: The patches that were made, to undo them with restore_functions.
+    """
+    owner, name, original = get_function(module_name, qualified_name)
+    replacement: Any = replace(original)
+    setattr(owner, name, replacement)
+    patches: list[Patch] = [(owner, name, original)]
+
+    # Methods are only looked up on their class.
+    if "." in qualified_name:
+        return patches
+
+    for module in list(sys.modules.values()):
+        other_module_name: str = getattr(module, "__name__", "")
+
+        if module is owner or not (
+            other_module_name == "pythonbible"
+            or other_module_name.startswith("pythonbible.")
+        ):
+            continue
+
+        for attribute, value in list(vars(module).items()):
+            if value is original:
+                setattr(module, attribute, replacement)
+                patches.append((module, attribute, original))
+
+    return patches
+
+
+def restore_functions(patches: Iterable[Patch]) -> None:
+    """Undo the given patches, in reverse order.
+
+    :param patches: The patches returned by replace_function.
+    """
+    for owner, name, original in reversed(list(patches)):
+        setattr(owner, name, original)
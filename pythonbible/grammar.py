@@ -0,0 +1,139 @@
+"""The compiled scripture reference grammar.
+
+The reference grammar is assembled from the Book regular expressions and the
+regular_expressions module, and book groups (e.g. BookGroup) add regular expressions
+for mentions of groups of books. Compiling these is by far the slowest part of
+searching a text for references, so each combination of book groups is compiled once
+into a ReferenceGrammar and reused for every search.
+
+Each grammar has a version string that changes whenever any of the regular
+expressions it was built from change, so it can be used as part of the key of any
+cache of parsed references.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from typing import Pattern
+
+from pythonbible.book_groups import BOOK_GROUPS
+from pythonbible.books import Book
+from pythonbible.regular_expressions import CROSS_BOOK
+from pythonbible.regular_expressions import get_scripture_reference_regular_expression
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+
+# Increment when the way a grammar is built changes in a way that isn't reflected in
+# the regular expressions themselves.
+GRAMMAR_FORMAT_VERSION = 1
+
+BookGroups = tuple[tuple[str, tuple[Book, ...]], ...]
+
+# A copy, so that changes to BOOK_GROUPS are compared against the original groups.
+_DEFAULT_BOOK_GROUPS: dict[str, tuple[Book, ...]] = dict(BOOK_GROUPS)
+_DEFAULT_BOOK_GROUPS_KEY: BookGroups = tuple(_DEFAULT_BOOK_GROUPS.items())
+
+
+@dataclass(frozen=True)
+class ReferenceGrammar:
+    """A compiled scripture reference grammar.
+
+    :param version: identifies the regular expressions the grammar was built from
+    :type version: str
+    :param reference_regular_expression: matches scripture references
+    :type reference_regular_expression: Pattern[str]
+    :param book_group_regular_expression: matches mentions of any of the book groups,
+                                          or None if there are no book groups
+    :type book_group_regular_expression: Pattern[str] | None
+    :param book_groups: the regular expression of each book group and its books
+    :type book_groups: tuple[tuple[Pattern[str], tuple[Book, ...]], ...]
+    """
+
+    version: str
+    reference_regular_expression: Pattern[str]
+    book_group_regular_expression: Pattern[str] | None
+    book_groups: tuple[tuple[Pattern[str], tuple[Book, ...]], ...]
+
+    def get_book_group_books(self: ReferenceGrammar, text: str) -> tuple[Book, ...]:
+        """Return the books of the first book group whose regular expression matches.
+
+        :param text: a mention of a book group found with book_group_regular_expression
+        :type text: str
+        :return: the books of the book group, or an empty tuple if none match
+        :rtype: tuple[Book, ...]
+        """
+        for regular_expression, books in self.book_groups:
+            if regular_expression.match(text):
+                return books
+
+        return ()
+
+
+def get_reference_grammar(
+    book_groups: Mapping[str, Iterable[Book]] | None = None,
+) -> ReferenceGrammar:
+    """Return the compiled reference grammar for the given book groups.
+
+    Grammars are memoized, so calling this again with equal book groups (e.g. the same
+    custom book group dictionary) returns the same grammar rather than compiling the
+    regular expressions again.
+
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) regular
+                        expression to its related books
+    :type book_groups: Mapping[str, Iterable[Book]] or None
+    :return: the compiled reference grammar
+    :rtype: ReferenceGrammar
+    """
+    if book_groups is None:
+        return _compile_reference_grammar(())
+
+    # The default book groups are the most common argument, so their key is only
+    # built once.
+    if book_groups == _DEFAULT_BOOK_GROUPS:
+        return _compile_reference_grammar(_DEFAULT_BOOK_GROUPS_KEY)
+
+    return _compile_reference_grammar(_get_book_groups_key(book_groups))
+
+
+def _get_book_groups_key(book_groups: Mapping[str, Iterable[Book]]) -> BookGroups:
+    return tuple(
+        (regular_expression, tuple(books))
+        for regular_expression, books in book_groups.items()
+    )
+
+
+@lru_cache(maxsize=32)
+def _compile_reference_grammar(book_groups: BookGroups) -> ReferenceGrammar:
+    return ReferenceGrammar(
+        version=_get_grammar_version(book_groups),
+        reference_regular_expression=get_scripture_reference_regular_expression(),
+        book_group_regular_expression=(
+            re.compile(
+                "|".join(regular_expression for regular_expression, _ in book_groups),
+                re.IGNORECASE | re.UNICODE,
+            )
+            if book_groups
+            else None
+        ),
+        book_groups=tuple(
+            (re.compile(regular_expression, re.IGNORECASE), books)
+            for regular_expression, books in book_groups
+        ),
+    )
+
+
+def _get_grammar_version(book_groups: BookGroups) -> str:
+    grammar_hash = hashlib.sha256(CROSS_BOOK.encode("utf-8"))
+
+    for regular_expression, books in book_groups:
+        grammar_hash.update(b"\0")
+        grammar_hash.update(regular_expression.encode("utf-8"))
+        grammar_hash.update(bytes(book.value for book in books))
+
+    return f"{GRAMMAR_FORMAT_VERSION}.{grammar_hash.hexdigest()[:16]}"
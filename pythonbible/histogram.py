@@ -0,0 +1,285 @@
+"""Contains the VerseHistogram class, which counts how often each verse is referenced.
+
+The histogram has one counter per verse ordinal. References are added to a
+difference array (the change in count at the first verse of each reference and just
+after its last verse), so adding a reference takes constant time no matter how many
+verses it covers. The per verse counts are the running sum of the difference array,
+which is only computed when the counts are read.
+"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from itertools import accumulate
+from typing import TYPE_CHECKING
+
+from pythonbible.book_groups import BookGroup
+from pythonbible.books import Book
+from pythonbible.errors import InvalidVerseError
+from pythonbible.normalized_reference import NormalizedReference
+from pythonbible.reference_array import ReferenceArray
+from pythonbible.verses import get_all_verse_ids
+from pythonbible.verses import get_chapter_ordinals
+from pythonbible.verses import get_number_of_chapters
+from pythonbible.verses import get_verse_id
+from pythonbible.verses import get_verse_ordinal
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from typing_extensions import Self
+
+    from pythonbible.intervals import VerseInterval
+
+# Signed, since the difference array holds negative changes.
+COUNT_TYPE_CODE = "q"
+
+
+class VerseHistogram:
+    """Counts of how many times each verse of the Bible is referenced.
+
+    Histograms built separately (e.g. by worker processes, since histograms can be
+    pickled) can be combined with merge or the + and += operators.
+    """
+
+    __slots__ = ("_counts", "_differences")
+
+    def __init__(
+        self: VerseHistogram,
+        references: NormalizedReference | Iterable[NormalizedReference] | None = None,
+    ) -> None:
+        """Initialize a VerseHistogram, counting the given references.
+
+        :param references: A reference, or the references (e.g. the result of
+                           get_references or a ReferenceArray), to count.
+        :raises InvalidChapterError: if a chapter in a reference is not valid
+        :raises InvalidVerseError: if a verse in a reference is not valid
+        """
+        # One extra entry so that references to the last verse have somewhere to end.
+        self._differences: array[int] = array(
+            COUNT_TYPE_CODE,
+            bytes(array(COUNT_TYPE_CODE).itemsize * (len(get_all_verse_ids()) + 1)),
+        )
+        self._counts: array[int] | None = None
+
+        if references is not None:
+            self.add(references)
+
+    def __eq__(self: VerseHistogram, other: object) -> bool:
+        """Return True if the other histogram has the same counts."""
+        if not isinstance(other, VerseHistogram):
+            return NotImplemented
+
+        return self._differences == other._differences
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __add__(self: VerseHistogram, other: VerseHistogram) -> VerseHistogram:
+        """Return a new histogram with the combined counts of both histograms."""
+        if not isinstance(other, VerseHistogram):
+            return NotImplemented
+
+        histogram = VerseHistogram()
+        histogram.merge(self)
+        histogram.merge(other)
+        return histogram
+
+    def __iadd__(self: Self, other: VerseHistogram) -> Self:
+        """Add the counts of the other histogram to this one."""
+        if not isinstance(other, VerseHistogram):
+            return NotImplemented
+
+        self.merge(other)
+        return self
+
+    @property
+    def counts(self: VerseHistogram) -> array[int]:
+        """Return the count of each verse, indexed by verse ordinal.
+
+        The returned array is shared with the histogram until the next change, so it
+        should not be modified.
+        """
+        if self._counts is None:
+            counts: array[int] = array(COUNT_TYPE_CODE, accumulate(self._differences))
+            counts.pop()
+            self._counts = counts
+
+        return self._counts
+
+    def add(
+        self: VerseHistogram,
+        references: NormalizedReference | Iterable[NormalizedReference],
+        count: int = 1,
+    ) -> None:
+        """Count the given references, adding count to each verse they include.
+
+        :param references: A reference, or the references (e.g. the result of
+                           get_references or a ReferenceArray), to count.
+        :param count: The number of times to count each reference.
+        :raises InvalidChapterError: if a chapter in a reference is not valid
+        :raises InvalidVerseError: if a verse in a reference is not valid
+        """
+        if isinstance(references, NormalizedReference):
+            self.add_interval(
+                (references.start_ordinal, references.end_ordinal),
+                count,
+            )
+        elif isinstance(references, ReferenceArray):
+            self.add_intervals(references.intervals(), count)
+        else:
+            self.add_intervals(
+                (
+                    (reference.start_ordinal, reference.end_ordinal)
+                    for reference in references
+                ),
+                count,
+            )
+
+    def add_interval(
+        self: VerseHistogram,
+        interval: VerseInterval,
+        count: int = 1,
+    ) -> None:
+        """Add count to each verse in the given verse interval.
+
+        :param interval: The first and last verse ordinals to count.
+        :param count: The number to add to each verse.
+        :raises InvalidVerseError: if the interval is not a valid verse interval
+        """
+        self.add_intervals((interval,), count)
+
+    def add_intervals(
+        self: VerseHistogram,
+        intervals: Iterable[VerseInterval],
+        count: int = 1,
+    ) -> None:
+        """Add count to each verse in each of the given verse intervals.
+
+        If an interval is not valid, the intervals before it are still counted.
+
+        :param intervals: The first and last verse ordinals of each interval to count.
+        :param count: The number to add to each verse.
+        :raises InvalidVerseError: if an interval's ordinals are not verse ordinals, or
+                                   its last ordinal is before its first
+        """
+        differences: array[int] = self._differences
+        number_of_verses: int = len(differences) - 1
+        self._counts = None
+
+        for start_ordinal, end_ordinal in intervals:
+            # Negative ordinals would otherwise index the array from the end.
+            if not 0 <= start_ordinal <= end_ordinal < number_of_verses:
+                error_message = (
+                    f"({start_ordinal}, {end_ordinal}) is not a valid verse interval."
+                )
+                raise InvalidVerseError(error_message)
+
+            differences[start_ordinal] += count
+            differences[end_ordinal + 1] -= count
+
+    def merge(self: VerseHistogram, other: VerseHistogram) -> None:
+        """Add the counts of the other histogram to this one.
+
+        :param other: The histogram to merge into this one.
+        """
+        self._differences = array(
+            COUNT_TYPE_CODE,
+            map(int.__add__, self._differences, other._differences),
+        )
+        self._counts = None
+
+    def get_count(self: VerseHistogram, verse_id: int) -> int:
+        """Return the number of times the given verse has been referenced.
+
+        :param verse_id: A verse id.
+        :return: The count of the verse.
+        :raises InvalidVerseError: if the verse id is not valid
+        """
+        return self.counts[get_verse_ordinal(verse_id)]
+
+    def most_common(
+        self: VerseHistogram,
+        k: int | None = None,
+    ) -> list[tuple[int, int]]:
+        """Return the k most referenced verses and their counts, most common first.
+
+        Verses with equal counts are in canonical order, and verses that have not been
+        referenced are not included.
+
+        :param k: The number of verses to return, or None for all referenced verses.
+        :return: The verse ids and their counts.
+        """
+        counts: array[int] = self.counts
+        ordinals: Iterable[int] = (
+            ordinal for ordinal, count in enumerate(counts) if count
+        )
+        key = counts.__getitem__
+
+        # Ties keep their canonical order, since both sorts are stable.
+        top_ordinals: list[int] = (
+            sorted(ordinals, key=key, reverse=True)
+            if k is None
+            else heapq.nlargest(k, ordinals, key=key)
+        )
+        verse_ids: tuple[int, ...] = get_all_verse_ids()
+        return [(verse_ids[ordinal], counts[ordinal]) for ordinal in top_ordinals]
+
+    def get_book_counts(self: VerseHistogram) -> dict[Book, int]:
+        """Return the total of the verse counts in each book.
+
+        :return: The total verse count of each book that has been referenced.
+        """
+        counts: array[int] = self.counts
+        book_counts: dict[Book, int] = {}
+
+        for book in Book:
+            start_ordinal: int = get_verse_ordinal(get_verse_id(book, 1, 1))
+            end_ordinal: int = get_chapter_ordinals(
+                get_verse_ordinal(get_verse_id(book, get_number_of_chapters(book), 1)),
+            )[1]
+
+            if total := sum(counts[start_ordinal : end_ordinal + 1]):
+                book_counts[book] = total
+
+        return book_counts
+
+    def get_chapter_counts(
+        self: VerseHistogram,
+        book: Book | None = None,
+    ) -> dict[tuple[Book, int], int]:
+        """Return the total of the verse counts in each chapter.
+
+        :param book: Only include the chapters of this book, or None for all books.
+        :return: The total verse count of each (book, chapter) that has been
+                 referenced.
+        """
+        counts: array[int] = self.counts
+        chapter_counts: dict[tuple[Book, int], int] = {}
+
+        for chapter_book in Book if book is None else (book,):
+            for chapter in range(1, get_number_of_chapters(chapter_book) + 1):
+                start_ordinal, end_ordinal = get_chapter_ordinals(
+                    get_verse_ordinal(get_verse_id(chapter_book, chapter, 1)),
+                )
+
+                if total := sum(counts[start_ordinal : end_ordinal + 1]):
+                    chapter_counts[chapter_book, chapter] = total
+
+        return chapter_counts
+
+    def get_book_group_counts(
+        self: VerseHistogram,
+        book_groups: Iterable[BookGroup] = BookGroup,
+    ) -> dict[BookGroup, int]:
+        """Return the total of the verse counts in each book group.
+
+        :param book_groups: The book groups to total, defaults to all of them.
+        :return: The total verse count of each book group (including those that
+                 have not been referenced).
+        """
+        book_counts: dict[Book, int] = self.get_book_counts()
+        return {
+            book_group: sum(book_counts.get(book, 0) for book in book_group.books)
+            for book_group in book_groups
+        }
@@ -0,0 +1,315 @@
+"""Contains opt-in instrumentation of the stages of parsing, converting, and formatting.
+
+Instrumentation is disabled by default and costs nothing while it is disabled: when it
+is enabled, the function behind each stage is replaced (everywhere pythonbible has
+imported it) by a wrapper that records the stage's calls, time, and allocations, and
+when it is disabled the original functions are put back.
+
+Stages can be nested (e.g. parser.normalize_reference runs inside
+parser.get_references), so each stage records both its total time and its self time,
+the time not spent in other instrumented stages. For example, the self time of
+parser.get_references is mostly the main regular expression search, since the roman
+numeral conversion, normalization, and book group matching are stages of their own.
+"""
+
+from __future__ import annotations
+
+import sys
+from contextlib import contextmanager
+from functools import wraps
+from threading import RLock
+from threading import local
+from time import perf_counter
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+from pythonbible.function_util import Patch
+from pythonbible.function_util import replace_function
+from pythonbible.function_util import restore_functions
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+# The module and qualified name of the function behind each stage.
+STAGES: dict[str, tuple[str, str]] = {
+    "parser.get_references": ("pythonbible.parser", "_get_references"),
+    "parser.convert_roman_numerals": (
+        "pythonbible.roman_numeral_util",
+        "convert_all_roman_numerals_to_integers",
+    ),
+    "parser.normalize_reference": (
+        "pythonbible.reference_normalizer",
+        "normalize_reference_text",
+    ),
+    "parser.find_book": ("pythonbible.reference_normalizer", "_find_book"),
+    "parser.process_sub_references": (
+        "pythonbible.reference_normalizer",
+        "_process_sub_references",
+    ),
+    "parser.book_groups": ("pythonbible.parser", "_get_book_group_references"),
+    "parser.scan_references": ("pythonbible.scanner", "scan_references"),
+    "converter.references_to_verse_ids": (
+        "pythonbible.converter",
+        "convert_references_to_verse_ids",
+    ),
+    "converter.verse_ids_to_references": (
+        "pythonbible.converter",
+        "convert_verse_ids_to_references",
+    ),
+    "formatter.format_scripture_references": (
+        "pythonbible.formatter",
+        "format_scripture_references",
+    ),
+    "formatter.format_single_reference": (
+        "pythonbible.formatter",
+        "format_single_reference",
+    ),
+    "formatter.format_scripture_text": (
+        "pythonbible.formatter",
+        "format_scripture_text",
+    ),
+    "formatter.get_verse_text": ("pythonbible.formatter", "get_verse_text"),
+    "bible.get_bible": ("pythonbible.bible", "get_bible"),
+    "bible.load_compiled_bible": (
+        "pythonbible.bible.compiled_bible",
+        "load_compiled_bible",
+    ),
+    "bible.get_scripture": ("pythonbible.bible.bible", "Bible.get_scripture"),
+}
+
+
+class StageStatistics(NamedTuple):
+    """Statistics about the calls of an instrumented stage.
+
+    allocated_blocks is the net change in the number of memory blocks allocated by the
+    interpreter (sys.getallocatedblocks) during the calls, including nested stages.
+    """
+
+    calls: int
+    total_time: float
+    self_time: float
+    allocated_blocks: int
+
+    @property
+    def mean_time(self: StageStatistics) -> float:
+        """Return the average time of a call, in seconds (0.0 if there were none)."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+class Instrumentation:
+    """Records the calls, time, and allocations of the instrumented stages.
+
+    Hooks are called after each call of an instrumented stage with the name of the
+    stage, its time, and its allocated blocks, e.g. to send the measurements to a
+    metrics system.
+
+    Enabling and disabling is safe to do from multiple threads, and stages are
+    recorded separately for each thread's nesting.
+    """
+
+    def __init__(self: Instrumentation) -> None:
+        """Initialize disabled Instrumentation with no statistics."""
+        self._lock = RLock()
+        self._local = local()
+        self._statistics: dict[str, list[Any]] = {}
+        self._hooks: list[Callable[[str, float, int], object]] = []
+        self._patches: list[Patch] = []
+
+    @property
+    def enabled(self: Instrumentation) -> bool:
+        """Return True if the stages are instrumented."""
+        return bool(self._patches)
+
+    def enable(self: Instrumentation, stages: Iterable[str] | None = None) -> None:
+        """Instrument the given stages, replacing any stages already instrumented.
+
+        :param stages: The names of the stages (keys of STAGES), defaults to all.
+        :raises ValueError: if a stage is not one of STAGES
+        """
+        stage_names: list[str] = list(STAGES if stages is None else stages)
+
+        for stage in stage_names:
+            if stage not in STAGES:
+                error_message = f"{stage!r} is not an instrumentation stage."
+                raise ValueError(error_message)
+
+        with self._lock:
+            self.disable()
+
+            for stage in stage_names:
+                self._instrument(stage, *STAGES[stage])
+
+    def disable(self: Instrumentation) -> None:
+        """Put back the original functions of all the instrumented stages."""
+        with self._lock:
+            restore_functions(self._patches)
+            self._patches.clear()
+
+    def add_hook(
+        self: Instrumentation,
+        hook: Callable[[str, float, int], object],
+    ) -> None:
+        """Call the given hook after each call of an instrumented stage.
+
+        :param hook: Called with the stage name, time in seconds, and allocated blocks.
+        """
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_hook(
+        self: Instrumentation,
+        hook: Callable[[str, float, int], object],
+    ) -> None:
+        """Stop calling the given hook.
+
+        :param hook: A hook that was added with add_hook.
+        :raises ValueError: if the hook was not added
+        """
+        with self._lock:
+            self._hooks.remove(hook)
+
+    def get_statistics(self: Instrumentation) -> dict[str, StageStatistics]:
+        """Return the statistics of each stage that has been called.
+
+        :return: The statistics by stage name.
+        """
+        with self._lock:
+            return {
+                stage: StageStatistics(*statistics)
+                for stage, statistics in self._statistics.items()
+            }
+
+    def reset(self: Instrumentation) -> None:
+        """Remove all the recorded statistics."""
+        with self._lock:
+            self._statistics.clear()
+
+    def _instrument(
+        self: Instrumentation,
+        stage: str,
+        module_name: str,
+        qualified_name: str,
+    ) -> None:
+        self._patches.extend(
+            replace_function(
+                module_name,
+                qualified_name,
+                lambda function: self._wrap(stage, function),
+            ),
+        )
+
+    def _wrap(
+        self: Instrumentation,
+        stage: str,
+        function: Callable[..., Any],
+    ) -> Callable[..., Any]:
+        @wraps(function)
+        def instrumented(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            # The time of the stages nested in each running stage on this thread.
+            nested_times: list[float] = self._get_nested_times()
+            nested_times.append(0.0)
+            allocated_blocks: int = sys.getallocatedblocks()
+            start: float = perf_counter()
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed: float = perf_counter() - start
+                allocated_blocks = sys.getallocatedblocks() - allocated_blocks
+                nested_time: float = nested_times.pop()
+
+                if nested_times:
+                    nested_times[-1] += elapsed
+
+                self._record(stage, elapsed, elapsed - nested_time, allocated_blocks)
+
+        return instrumented
+
+    def _get_nested_times(self: Instrumentation) -> list[float]:
+        nested_times: list[float] | None = getattr(self._local, "nested_times", None)
+
+        if nested_times is None:
+            nested_times = self._local.nested_times = []
+
+        return nested_times
+
+    def _record(
+        self: Instrumentation,
+        stage: str,
+        elapsed: float,
+        self_time: float,
+        allocated_blocks: int,
+    ) -> None:
+        with self._lock:
+            statistics: list[Any] | None = self._statistics.get(stage)
+
+            if statistics is None:
+                self._statistics[stage] = [1, elapsed, self_time, allocated_blocks]
+            else:
+                statistics[0] += 1
+                statistics[1] += elapsed
+                statistics[2] += self_time
+                statistics[3] += allocated_blocks
+
+            hooks = tuple(self._hooks)
+
+        for hook in hooks:
+            hook(stage, elapsed, allocated_blocks)
+
+
+INSTRUMENTATION = Instrumentation()
+
+
+def enable_instrumentation(stages: Iterable[str] | None = None) -> None:
+    """Start recording the calls, time, and allocations of the given stages.
+
+    :param stages: The names of the stages to instrument (see
+                   pythonbible.instrumentation.STAGES), defaults to all of them
+    :type stages: Iterable[str] | None
+    :raises ValueError: if a stage is not one of the instrumentation stages
+    """
+    INSTRUMENTATION.enable(stages)
+
+
+def disable_instrumentation() -> None:
+    """Stop recording the instrumented stages (the statistics are kept)."""
+    INSTRUMENTATION.disable()
+
+
+def get_instrumentation_statistics() -> dict[str, StageStatistics]:
+    """Return the calls, total time, self time, and allocations of each stage.
+
+    :return: The statistics of each stage that has been called, by stage name
+    :rtype: dict[str, StageStatistics]
+    """
+    return INSTRUMENTATION.get_statistics()
+
+
+def reset_instrumentation_statistics() -> None:
+    """Remove all the recorded instrumentation statistics."""
+    INSTRUMENTATION.reset()
+
+
+@contextmanager
+def instrument(stages: Iterable[str] | None = None) -> Iterator[Instrumentation]:
+    """Record the given stages for the duration of a with block.
+
+    The statistics are reset when the block starts, and are still available from
+    get_instrumentation_statistics after it ends.
+
+    :param stages: The names of the stages to instrument, defaults to all of them
+    :type stages: Iterable[str] | None
+    :return: The instrumentation, to get the statistics from
+    :rtype: Iterator[Instrumentation]
+    :raises ValueError: if a stage is not one of the instrumentation stages
+    """
+    INSTRUMENTATION.reset()
+    INSTRUMENTATION.enable(stages)
+
+    try:
+        yield INSTRUMENTATION
+    finally:
+        INSTRUMENTATION.disable()
@@ -0,0 +1,252 @@
+"""Interval representation of scripture references.
+
+A verse interval is a tuple of the first and last verse ordinals (inclusive) covered by
+a reference. Since ordinals number the verses of the Bible consecutively, references
+can be sorted, merged, intersected, and subtracted as intervals without expanding them
+into individual verse ids.
+
+Ordinals are positions in the standard versification (see pythonbible.versification
+to move verse ids between versions first).
+
+Lists of intervals returned by this module are normalized: sorted, with no overlapping
+or adjacent intervals.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import TYPE_CHECKING
+
+from pythonbible.normalized_reference import NormalizedReference
+from pythonbible.verses import get_all_verse_ids
+from pythonbible.verses import get_book_chapter_verse_by_ordinal
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+VerseInterval = tuple[int, int]
+
+
+def convert_reference_to_interval(reference: NormalizedReference) -> VerseInterval:
+    """Convert the given NormalizedReference into a verse interval.
+
+    :param reference: A normalized reference
+    :type reference: NormalizedReference
+    :return: The first and last verse ordinals included in the reference
+    :rtype: tuple[int, int]
+    :raises InvalidChapterError: if a chapter in the reference is not valid
+    :raises InvalidVerseError: if a verse in the reference is not valid
+    """
+    return reference.start_ordinal, reference.end_ordinal
+
+
+def convert_references_to_intervals(
+    references: Iterable[NormalizedReference] | None,
+) -> list[VerseInterval]:
+    """Convert the given NormalizedReferences into a normalized list of intervals.
+
+    :param references: A list of normalized references
+    :type references: Iterable[NormalizedReference]
+    :return: The sorted and merged verse intervals covered by the references
+    :rtype: list[tuple[int, int]]
+    """
+    if references is None:
+        return []
+
+    return merge_intervals(
+        convert_reference_to_interval(reference)
+        for reference in references
+        if reference is not None
+    )
+
+
+def convert_intervals_to_references(
+    intervals: Iterable[VerseInterval],
+) -> list[NormalizedReference]:
+    """Convert the given verse intervals into a list of NormalizedReferences.
+
+    Each interval becomes one reference, so the intervals should be normalized first
+    (see merge_intervals) if overlapping or adjacent intervals should be combined.
+
+    :param intervals: A list of verse intervals
+    :type intervals: Iterable[tuple[int, int]]
+    :return: The normalized references for the verse intervals
+    :rtype: list[NormalizedReference]
+    """
+    references: list[NormalizedReference] = []
+
+    for start_ordinal, end_ordinal in intervals:
+        start_book, start_chapter, start_verse = get_book_chapter_verse_by_ordinal(
+            start_ordinal,
+        )
+        end_book, end_chapter, end_verse = get_book_chapter_verse_by_ordinal(
+            end_ordinal,
+        )
+        references.append(
+            NormalizedReference(
+                start_book,
+                start_chapter,
+                start_verse,
+                end_chapter,
+                end_verse,
+                end_book,
+            ),
+        )
+
+    return references
+
+
+def sort_references(
+    references: Iterable[NormalizedReference] | None,
+) -> list[NormalizedReference]:
+    """Return the given references in canonical order, merging any that overlap.
+
+    :param references: A list of normalized references
+    :type references: Iterable[NormalizedReference]
+    :return: The sorted and merged normalized references
+    :rtype: list[NormalizedReference]
+    """
+    return convert_intervals_to_references(convert_references_to_intervals(references))
+
+
+def merge_intervals(intervals: Iterable[VerseInterval]) -> list[VerseInterval]:
+    """Return the union of the given verse intervals as a normalized list.
+
+    :param intervals: Verse intervals in any order
+    :type intervals: Iterable[tuple[int, int]]
+    :return: The sorted verse intervals with overlapping and adjacent ones merged
+    :rtype: list[tuple[int, int]]
+    """
+    merged: list[VerseInterval] = []
+
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = merged[-1][0], end
+            continue
+
+        merged.append((start, end))
+
+    return merged
+
+
+def union_intervals(*interval_lists: Iterable[VerseInterval]) -> list[VerseInterval]:
+    """Return the union of the given lists of verse intervals.
+
+    :param interval_lists: One or more lists of verse intervals
+    :type interval_lists: Iterable[tuple[int, int]]
+    :return: The normalized verse intervals covered by any of the lists
+    :rtype: list[tuple[int, int]]
+    """
+    return merge_intervals(
+        interval for intervals in interval_lists for interval in intervals
+    )
+
+
+def intersect_intervals(
+    intervals: Iterable[VerseInterval],
+    other_intervals: Iterable[VerseInterval],
+) -> list[VerseInterval]:
+    """Return the verse intervals covered by both of the given lists.
+
+    :param intervals: A list of verse intervals
+    :type intervals: Iterable[tuple[int, int]]
+    :param other_intervals: Another list of verse intervals
+    :type other_intervals: Iterable[tuple[int, int]]
+    :return: The normalized verse intervals covered by both lists
+    :rtype: list[tuple[int, int]]
+    """
+    first: list[VerseInterval] = merge_intervals(intervals)
+    second: list[VerseInterval] = merge_intervals(other_intervals)
+    intersection: list[VerseInterval] = []
+    first_index: int = 0
+    second_index: int = 0
+
+    while first_index < len(first) and second_index < len(second):
+        start: int = max(first[first_index][0], second[second_index][0])
+        end: int = min(first[first_index][1], second[second_index][1])
+
+        if start <= end:
+            intersection.append((start, end))
+
+        # Move past whichever interval ends first.
+        if first[first_index][1] < second[second_index][1]:
+            first_index += 1
+        else:
+            second_index += 1
+
+    return intersection
+
+
+def subtract_intervals(
+    intervals: Iterable[VerseInterval],
+    other_intervals: Iterable[VerseInterval],
+) -> list[VerseInterval]:
+    """Return the verse intervals covered by the first list but not the second.
+
+    :param intervals: A list of verse intervals
+    :type intervals: Iterable[tuple[int, int]]
+    :param other_intervals: The list of verse intervals to remove
+    :type other_intervals: Iterable[tuple[int, int]]
+    :return: The normalized verse intervals of the difference
+    :rtype: list[tuple[int, int]]
+    """
+    removed: list[VerseInterval] = merge_intervals(other_intervals)
+    difference: list[VerseInterval] = []
+    removed_index: int = 0
+
+    for start, end in merge_intervals(intervals):
+        current_start: int = start
+
+        # Skip the removed intervals that end before this interval starts.
+        while removed_index < len(removed) and removed[removed_index][1] < start:
+            removed_index += 1
+
+        index: int = removed_index
+
+        while index < len(removed) and removed[index][0] <= end:
+            if removed[index][0] > current_start:
+                difference.append((current_start, removed[index][0] - 1))
+
+            current_start = max(current_start, removed[index][1] + 1)
+            index += 1
+
+        if current_start <= end:
+            difference.append((current_start, end))
+
+    return difference
+
+
+def do_intervals_contain(
+    intervals: list[VerseInterval],
+    interval: VerseInterval,
+) -> bool:
+    """Check to see if the given verse interval is fully covered by the intervals.
+
+    :param intervals: A normalized list of verse intervals
+    :type intervals: list[tuple[int, int]]
+    :param interval: The verse interval to look for
+    :type interval: tuple[int, int]
+    :return: True if every verse in the interval is covered; otherwise, False
+    :rtype: bool
+    """
+    last_ordinal: int = len(get_all_verse_ids()) - 1
+    index: int = bisect_right(intervals, (interval[0], last_ordinal)) - 1
+
+    if index < 0:
+        return False
+
+    start, end = intervals[index]
+
+    return start <= interval[0] and interval[1] <= end
+
+
+def get_number_of_verses_in_intervals(intervals: Iterable[VerseInterval]) -> int:
+    """Return the number of verses covered by the given verse intervals.
+
+    :param intervals: A list of verse intervals
+    :type intervals: Iterable[tuple[int, int]]
+    :return: The total length of the intervals
+    :rtype: int
+    """
+    return sum(end - start + 1 for start, end in intervals)
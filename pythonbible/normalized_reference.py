@@ -1,18 +1,39 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import total_ordering
 from typing import TYPE_CHECKING
 
+from pythonbible.errors import InvalidChapterError
+from pythonbible.errors import InvalidVerseError
+from pythonbible.verses import get_number_of_chapters
+from pythonbible.verses import get_number_of_verses
+from pythonbible.verses import get_verse_id
+from pythonbible.verses import get_verse_ordinal
+
 if TYPE_CHECKING:
     from pythonbible.books import Book
 
 
-@dataclass
-class NormalizedReference:
+class _CachedOrdinals:
+    # The slot of the ordinals cache, kept out of the dataclass fields so that fields,
+    # asdict, astuple, and pickling only see the reference itself.
+    __slots__ = ("_ordinals",)
+
+    _ordinals: tuple[int, int]
+
+
+@total_ordering
+@dataclass(frozen=True, slots=True)
+class NormalizedReference(_CachedOrdinals):
     """NormalizedReference is a dataclass that represents a single scripture reference.
 
     The scripture reference contains one or more consecutive verses.
 
+    Normalized references are immutable and hashable, so they can be used in sets and
+    as dictionary keys. They are ordered canonically by their first and then their
+    last verse.
+
     :param book: the first book of the Bible in the reference
     :type book: Book
     :param start_chapter: the number of the first chapter in the reference
@@ -34,3 +55,74 @@ class NormalizedReference:
     end_chapter: int | None = None
     end_verse: int | None = None
     end_book: Book | None = None
+
+    @property
+    def start_ordinal(self: NormalizedReference) -> int:
+        """Return the ordinal of the first verse in the reference.
+
+        :raises InvalidVerseError: if the first verse is not valid
+        """
+        return self._get_ordinals()[0]
+
+    @property
+    def end_ordinal(self: NormalizedReference) -> int:
+        """Return the ordinal of the last verse in the reference.
+
+        :raises InvalidChapterError: if the last chapter is not valid
+        :raises InvalidVerseError: if the last verse is not valid
+        """
+        return self._get_ordinals()[1]
+
+    def __lt__(self: NormalizedReference, other: object) -> bool:
+        """Return True if this reference comes before the other canonically.
+
+        If either reference has a chapter or verse that is not valid, the references
+        are compared by their fields instead.
+        """
+        if not isinstance(other, NormalizedReference):
+            return NotImplemented
+
+        try:
+            return self._get_sort_key() < other._get_sort_key()
+        except (InvalidChapterError, InvalidVerseError):
+            return self._get_field_key() < other._get_field_key()
+
+    def _get_ordinals(self: NormalizedReference) -> tuple[int, int]:
+        # Computed the first time they are needed, since most references never are
+        # sorted or converted into verse intervals.
+        try:
+            return self._ordinals
+        except AttributeError:
+            pass
+
+        end_book: Book = self.end_book or self.book
+        end_chapter: int = self.end_chapter or get_number_of_chapters(end_book)
+        end_verse: int = self.end_verse or get_number_of_verses(end_book, end_chapter)
+        ordinals: tuple[int, int] = (
+            get_verse_ordinal(
+                get_verse_id(self.book, self.start_chapter or 1, self.start_verse or 1),
+            ),
+            get_verse_ordinal(get_verse_id(end_book, end_chapter, end_verse)),
+        )
+        object.__setattr__(self, "_ordinals", ordinals)
+        return ordinals
+
+    def _get_sort_key(self: NormalizedReference) -> tuple[int, ...]:
+        # References that cover the same verses are ordered by their fields, so that
+        # the ordering agrees with equality.
+        return (*self._get_ordinals(), *self._get_field_key())
+
+    def _get_field_key(self: NormalizedReference) -> tuple[int, ...]:
+        return (
+            self.book.value,
+            *(
+                -1 if number is None else number
+                for number in (
+                    self.start_chapter,
+                    self.start_verse,
+                    self.end_chapter,
+                    self.end_verse,
+                )
+            ),
+            -1 if self.end_book is None else self.end_book.value,
+        )
@@ -1,250 +1,350 @@
 from __future__ import annotations
 
-import re
-from typing import Match
-from typing import Pattern
-
-from pythonbible.books import Book
+import os
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from pythonbible.errors import InvalidBibleParserError
+from pythonbible.grammar import ReferenceGrammar
+from pythonbible.grammar import get_reference_grammar
 from pythonbible.normalized_reference import NormalizedReference
-from pythonbible.regular_expressions import SCRIPTURE_REFERENCE_REGULAR_EXPRESSION
+from pythonbible.reference_cache import ReferenceCache
+from pythonbible.reference_cache import ReferenceCacheInfo
+from pythonbible.reference_normalizer import COLON  # noqa: F401
+from pythonbible.reference_normalizer import COMMA  # noqa: F401
+from pythonbible.reference_normalizer import DASH
+from pythonbible.reference_normalizer import PERIOD  # noqa: F401
+from pythonbible.reference_normalizer import normalize_reference_text
 from pythonbible.roman_numeral_util import convert_all_roman_numerals_to_integers
-from pythonbible.validator import is_valid_reference
+from pythonbible.scanner import scan_references
 from pythonbible.verses import get_number_of_chapters
 from pythonbible.verses import get_number_of_verses
-from pythonbible.verses import is_single_chapter_book
 
-COLON = ":"
-COMMA = ","
-DASH = "-"
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+    from concurrent.futures import Future
+
+    from pythonbible.books import Book
+
 HTML_MDASH = "&mdash;"
 HTML_NDASH = "&ndash;"
-PERIOD = "."
+
+REGULAR_EXPRESSION_PARSER = "regular_expression"
+STATE_MACHINE_PARSER = "state_machine"
+PARSERS: tuple[str, ...] = (REGULAR_EXPRESSION_PARSER, STATE_MACHINE_PARSER)
+DEFAULT_PARSER = REGULAR_EXPRESSION_PARSER
+
+DEFAULT_MAX_CACHED_REFERENCES = 1024
+
+DEFAULT_BATCH_CHUNKSIZE = 256
+_PENDING_CHUNKS_PER_WORKER = 2
+
+# Disabled until configure_reference_cache is called.
+REFERENCE_CACHE = ReferenceCache()
 
 
 def get_references(
     text: str,
-    book_groups: dict[str, tuple[Book, ...]] | None = None,
+    book_groups: Mapping[str, Iterable[Book]] | None = None,
+    *,
+    parser: str | None = None,
 ) -> list[NormalizedReference]:
     """Search the text for scripture references.
 
     Return any scripture references that are found in a list of normalized references.
 
+    Both parsers find the same references. The "regular_expression" parser matches
+    each reference with a regular expression and then normalizes the matched text. The
+    "state_machine" parser reads the chapter and verse numbers that follow each book
+    character by character instead.
+
     :param text: String that may contain zero or more scripture references
     :type text: str
     :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
                         related regular expression
-    :type book_groups: dict[str, tuple[Book, ...]] or None
+    :type book_groups: Mapping[str, Iterable[Book]] or None
+    :param parser: The parser to use ("regular_expression" or "state_machine"),
+                   defaults to DEFAULT_PARSER
+    :type parser: str or None
     :return: The list of found scripture references
     :rtype: list[NormalizedReference]
+    :raises InvalidBibleParserError: if the parser is not one of PARSERS
     """
+    parser = _get_parser(parser)
+    grammar: ReferenceGrammar = get_reference_grammar(book_groups)
+
+    if not REFERENCE_CACHE.enabled:
+        return _get_references(text, grammar, parser)
+
+    # Both parsers find the same references, so the parser isn't part of the key.
+    cache_key: tuple[str, str] = (grammar.version, text)
+    references: list[NormalizedReference] | None = REFERENCE_CACHE.get(cache_key)
+
+    if references is None:
+        references = _get_references(text, grammar, parser)
+        REFERENCE_CACHE.add(cache_key, references)
+
+    return references
+
+
+def _get_parser(parser: str | None) -> str:
+    parser = parser or DEFAULT_PARSER
+
+    if parser not in PARSERS:
+        error_message = f"{parser!r} is not a valid parser; use one of {PARSERS}."
+        raise InvalidBibleParserError(error_message)
+
+    return parser
+
+
+def _get_references(
+    text: str,
+    grammar: ReferenceGrammar,
+    parser: str,
+) -> list[NormalizedReference]:
     references: list[NormalizedReference] = []
 
     # First replace all roman numerals in the text with integers.
     clean_text: str = convert_all_roman_numerals_to_integers(text)
     clean_text = clean_text.replace(HTML_NDASH, DASH).replace(HTML_MDASH, DASH)
 
-    for reference_match in re.finditer(
-        SCRIPTURE_REFERENCE_REGULAR_EXPRESSION,
-        clean_text,
-    ):
-        references.extend(normalize_reference(reference_match[0]))
+    if parser == STATE_MACHINE_PARSER:
+        references.extend(scan_references(clean_text))
+    else:
+        for reference_match in grammar.reference_regular_expression.finditer(
+            clean_text,
+        ):
+            references.extend(normalize_reference_text(reference_match[0]))
 
-    if book_groups:
-        references.extend(_get_book_group_references(clean_text, book_groups))
+    if grammar.book_group_regular_expression:
+        references.extend(_get_book_group_references(clean_text, grammar))
 
     return references
 
 
-def normalize_reference(reference: str) -> list[NormalizedReference]:
-    """Convert a scripture reference string into a list of normalized tuple references.
+def get_references_batch(
+    texts: Iterable[str],
+    book_groups: Mapping[str, Iterable[Book]] | None = None,
+    *,
+    workers: int | None = None,
+    chunksize: int = DEFAULT_BATCH_CHUNKSIZE,
+    parser: str | None = None,
+) -> list[list[NormalizedReference]]:
+    """Search each of the texts for scripture references using a pool of processes.
 
-    :param reference: a string that is a scripture reference
-    :return: a list of tuples. each tuple is in the format (book, start_chapter,
-             start_verse, end_chapter, end_verse)
+    :param texts: Strings that may each contain zero or more scripture references
+    :type texts: Iterable[str]
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
+                        related regular expression
+    :type book_groups: Mapping[str, Iterable[Book]] or None
+    :param workers: The number of worker processes, defaults to the number of CPUs; 1
+                    searches the texts in the current process
+    :type workers: int or None
+    :param chunksize: The number of texts sent to a worker process at a time
+    :type chunksize: int
+    :param parser: The parser to use ("regular_expression" or "state_machine"),
+                   defaults to DEFAULT_PARSER
+    :type parser: str or None
+    :return: The list of found scripture references for each text, in the same order
+             as the texts
+    :rtype: list[list[NormalizedReference]]
+    :raises ValueError: if workers or chunksize is less than 1
+    :raises InvalidBibleParserError: if the parser is not one of PARSERS
     """
-    references: list[NormalizedReference] = []
-    books: list[Book] = []
-    cleaned_references: list[str] = []
-    reference_without_books: str = reference
-    start: int
-    end: int
-    book_found: bool = True
+    return list(
+        iter_references_batch(
+            texts,
+            book_groups,
+            workers=workers,
+            chunksize=chunksize,
+            parser=parser,
+        ),
+    )
+
 
-    while book_found:
-        book_found = False
+def iter_references_batch(
+    texts: Iterable[str],
+    book_groups: Mapping[str, Iterable[Book]] | None = None,
+    *,
+    workers: int | None = None,
+    chunksize: int = DEFAULT_BATCH_CHUNKSIZE,
+    parser: str | None = None,
+) -> Iterator[list[NormalizedReference]]:
+    """Yield the scripture references found in each of the texts, in order.
+
+    The texts are read lazily and sent to a pool of processes in chunks, with only a
+    few chunks per worker in flight at a time, so arbitrarily large corpora can be
+    streamed through with bounded memory.
+
+    The worker processes are given the parser (DEFAULT_PARSER of this process if it is
+    None) and the size of this process's reference cache. They don't inherit any other
+    state of this process: references already in its reference cache, caches resized
+    with configure_cache, instrumentation, and Bibles added with add_bible are not
+    available in the workers.
+
+    :param texts: Strings that may each contain zero or more scripture references
+    :type texts: Iterable[str]
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
+                        related regular expression
+    :type book_groups: Mapping[str, Iterable[Book]] or None
+    :param workers: The number of worker processes, defaults to the number of CPUs; 1
+                    searches the texts in the current process
+    :type workers: int or None
+    :param chunksize: The number of texts sent to a worker process at a time
+    :type chunksize: int
+    :param parser: The parser to use ("regular_expression" or "state_machine"),
+                   defaults to DEFAULT_PARSER
+    :type parser: str or None
+    :return: An iterator of the list of found scripture references for each text
+    :rtype: Iterator[list[NormalizedReference]]
+    :raises ValueError: if workers or chunksize is less than 1
+    :raises InvalidBibleParserError: if the parser is not one of PARSERS
+    """
+    parser = _get_parser(parser)
+    number_of_workers: int = (os.cpu_count() or 1) if workers is None else workers
+
+    if number_of_workers < 1:
+        error_message = f"workers must be at least 1, not {workers}."
+        raise ValueError(error_message)
+
+    if chunksize < 1:
+        error_message = f"chunksize must be at least 1, not {chunksize}."
+        raise ValueError(error_message)
+
+    if number_of_workers == 1:
+        return (get_references(text, book_groups, parser=parser) for text in texts)
+
+    return _iter_references_batch_in_processes(
+        texts,
+        book_groups,
+        parser,
+        number_of_workers,
+        chunksize,
+    )
 
-        for book in Book:
-            if reference_match := re.search(
-                book.regular_expression,
-                reference_without_books,
-                re.IGNORECASE,
-            ):
-                start, end = reference_match.regs[0]
 
-                if start != 0 and not books:
-                    continue
+def _iter_references_batch_in_processes(
+    texts: Iterable[str],
+    book_groups: Mapping[str, Iterable[Book]] | None,
+    parser: str,
+    workers: int,
+    chunksize: int,
+) -> Iterator[list[NormalizedReference]]:
+    # Imported here since importing it is slow and most uses never need it.
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    text_iterator: Iterator[str] = iter(texts)
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=(REFERENCE_CACHE.cache_info().max_entries,),
+    )
+    pending: deque[Future[list[list[NormalizedReference]]]] = deque()
 
-                book_found = True
+    try:
+        while chunk := list(islice(text_iterator, chunksize)):
+            pending.append(
+                executor.submit(_get_references_for_chunk, chunk, book_groups, parser),
+            )
 
-                if books:
-                    cleaned_references.append(reference_without_books[:start])
+            if len(pending) >= workers * _PENDING_CHUNKS_PER_WORKER:
+                yield from pending.popleft().result()
 
-                reference_without_books = reference_without_books[end:]
-                books.append(book)
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
 
-    cleaned_references.append(reference_without_books)
 
-    # First Book
-    first_book_references = _process_sub_references(
-        books[0],
-        cleaned_references[0].strip(),
-    )
+def _initialize_worker(max_cached_references: int) -> None:
+    # Worker processes may be started without a copy of this module's state (e.g. when
+    # they are spawned), so the reference cache is configured explicitly.
+    REFERENCE_CACHE.configure(max_cached_references)
 
-    if len(books) == 1:
-        return first_book_references
 
-    # Second Book
-    second_book_references = _process_sub_references(
-        books[1],
-        cleaned_references[1].strip(),
-    )
+def _get_references_for_chunk(
+    texts: list[str],
+    book_groups: Mapping[str, Iterable[Book]] | None,
+    parser: str,
+) -> list[list[NormalizedReference]]:
+    return [get_references(text, book_groups, parser=parser) for text in texts]
 
-    if len(first_book_references) > 1:
-        references.extend(first_book_references[:-1])
-
-    # Combine last first reference with first second reference
-    last_first_reference = first_book_references[-1]
-    first_second_reference = second_book_references[0]
-
-    references.append(
-        NormalizedReference(
-            last_first_reference.book,
-            last_first_reference.start_chapter,
-            last_first_reference.start_verse,
-            first_second_reference.end_chapter,
-            first_second_reference.end_verse,
-            first_second_reference.book,
-        ),
-    )
 
-    if len(second_book_references) > 1:
-        references.extend(second_book_references[1:])
+def configure_reference_cache(
+    max_entries: int = DEFAULT_MAX_CACHED_REFERENCES,
+) -> None:
+    """Enable (or resize) the cache of parsed scripture references.
 
-    return references
+    The cache is disabled by default. Once enabled, get_references and
+    normalize_reference return the cached references when they are given a text they
+    have already parsed (with the same book groups), and the least recently used
+    results are evicted once the cache holds more than max_entries of them.
 
+    :param max_entries: The maximum number of cached results, or 0 to disable the cache
+    :type max_entries: int
+    :raises ValueError: if max_entries is negative
+    """
+    REFERENCE_CACHE.configure(max_entries)
 
-def _process_sub_references(book: Book, reference: str) -> list[NormalizedReference]:
-    references: list[NormalizedReference] = []
-    start_chapter: int | None = None
 
-    for sub_reference in reference.split(COMMA):
-        if (not sub_reference or sub_reference in {DASH, PERIOD}) and not references:
-            references.append(NormalizedReference(book, None, None, None, None, book))
-            continue
+def get_reference_cache_info() -> ReferenceCacheInfo:
+    """Return the hits, misses, evictions, size, and hit ratio of the reference cache.
 
-        start_chapter, start_verse, end_chapter, end_verse = _process_sub_reference(
-            sub_reference[:-1] if sub_reference.endswith(DASH) else sub_reference,
-            book,
-            start_chapter,
-        )
+    :return: The statistics of the reference cache
+    :rtype: ReferenceCacheInfo
+    """
+    return REFERENCE_CACHE.cache_info()
 
-        new_reference = NormalizedReference(
-            book,
-            start_chapter,
-            start_verse,
-            end_chapter,
-            end_verse,
-            book,
-        )
 
-        if is_valid_reference(new_reference):
-            references.append(new_reference)
+def clear_reference_cache() -> None:
+    """Remove all the results from the reference cache and reset its statistics."""
+    REFERENCE_CACHE.clear()
 
-        start_chapter = end_chapter
 
-    return references
+def normalize_reference(reference: str) -> list[NormalizedReference]:
+    """Convert a scripture reference string into a list of normalized tuple references.
+
+    :param reference: a string that is a scripture reference
+    :return: a list of tuples. each tuple is in the format (book, start_chapter,
+             start_verse, end_chapter, end_verse)
+    """
+    if not REFERENCE_CACHE.enabled:
+        return normalize_reference_text(reference)
 
+    references: list[NormalizedReference] | None = REFERENCE_CACHE.get(reference)
 
-def _process_sub_reference(
-    sub_reference: str,
-    book: Book,
-    start_chapter: int | None,
-) -> tuple[int | None, int | None, int | None, int | None]:
-    start_verse: int | None = None
-    end_chapter: int | None = None
-    end_verse: int | None = None
-    no_verses: bool = False
-
-    clean_sub_reference: str = sub_reference.replace(PERIOD, COLON)
-    chapter_and_verse_range: list[str] = clean_sub_reference.split(DASH)
-    min_chapter_and_verse: list[str] = chapter_and_verse_range[0].strip().split(COLON)
-
-    if len(min_chapter_and_verse) == 1:
-        if start_chapter:
-            start_verse = int(min_chapter_and_verse[0].strip())
-        elif is_single_chapter_book(book):
-            start_chapter = 1
-            start_verse = int(min_chapter_and_verse[0].strip())
-        else:
-            start_chapter = int(min_chapter_and_verse[0].strip())
-            no_verses = True
-    elif len(min_chapter_and_verse) == 2:
-        start_chapter = int(min_chapter_and_verse[0].strip())
-        start_verse = int(min_chapter_and_verse[1].strip())
-
-    if len(chapter_and_verse_range) > 1:
-        max_chapter_and_verse = chapter_and_verse_range[1].split(COLON)
-
-        if len(max_chapter_and_verse) == 1:
-            if no_verses:
-                end_chapter = int(max_chapter_and_verse[0].strip())
-            else:
-                end_chapter = start_chapter
-                end_verse = int(max_chapter_and_verse[0].strip())
-        elif len(max_chapter_and_verse) == 2:
-            end_chapter = int(max_chapter_and_verse[0].strip())
-            end_verse = int(max_chapter_and_verse[1].strip())
-
-    end_chapter = end_chapter or start_chapter
-    end_verse = end_verse or start_verse
-
-    return start_chapter, start_verse, end_chapter, end_verse
+    if references is None:
+        references = normalize_reference_text(reference)
+        REFERENCE_CACHE.add(reference, references)
+
+    return references
 
 
 def _get_book_group_references(
     text: str,
-    book_groups: dict[str, tuple[Book, ...]],
+    grammar: ReferenceGrammar,
 ) -> list[NormalizedReference]:
     references: list[NormalizedReference] = []
-    book_group_regex: Pattern[str] = re.compile(
-        "|".join(book_groups.keys()),
-        re.IGNORECASE | re.UNICODE,
-    )
 
-    for match in re.finditer(book_group_regex, text):
-        references.extend(_process_book_group_match(match[0], book_groups))
+    if grammar.book_group_regular_expression is None:
+        return references
+
+    for match in grammar.book_group_regular_expression.finditer(text):
+        references.extend(
+            _process_book_group_match(grammar.get_book_group_books(match[0])),
+        )
 
     return references
 
 
-def _process_book_group_match(
-    text: str,
-    book_groups: dict[str, tuple[Book, ...]],
-) -> list[NormalizedReference]:
+def _process_book_group_match(books: tuple[Book, ...]) -> list[NormalizedReference]:
     references: list[NormalizedReference] = []
-    regular_expression: str
-    books: tuple[Book, ...]
-
-    for regular_expression, book_group_books in book_groups.items():
-        reference_match: Match[str] | None = re.match(
-            regular_expression,
-            text,
-            re.IGNORECASE,
-        )
 
-        if reference_match:
-            books = book_group_books
-            break
+    if not books:
+        return references
 
     start_book: Book = books[0]
     previous_book: Book = start_book
@@ -0,0 +1,191 @@
+"""Contains the ReferenceArray class, a compact columnar list of references."""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+from typing import Any
+
+from pythonbible.intervals import convert_intervals_to_references
+from pythonbible.intervals import merge_intervals
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from pythonbible.intervals import VerseInterval
+    from pythonbible.normalized_reference import NormalizedReference
+
+# Large enough for any verse ordinal.
+ORDINAL_TYPE_CODE = "I"
+
+
+class ReferenceArray:
+    """A list of references stored as two columns of verse ordinals.
+
+    Each reference is stored as the ordinals of its first and last verses in two
+    parallel arrays (the ordinals also identify the books), which takes a few bytes per
+    reference rather than a NormalizedReference object per reference. The columns
+    support the buffer protocol, so they can be wrapped in NumPy arrays without
+    copying (e.g. numpy.frombuffer(references.start_ordinals, numpy.uint32)).
+
+    References are stored as the verses they cover, so the references that come back
+    out of the array have explicit chapters and verses (e.g. "Genesis 1" comes back
+    as Genesis 1:1-31).
+
+    A ReferenceArray is an iterable of NormalizedReference, so it can be passed to
+    count_books, count_chapters, and count_verses.
+    """
+
+    __slots__ = ("_end_ordinals", "_start_ordinals")
+
+    def __init__(
+        self: ReferenceArray,
+        references: Iterable[NormalizedReference] | None = None,
+    ) -> None:
+        """Initialize a ReferenceArray with the given references.
+
+        :param references: The references to add, e.g. the result of get_references.
+        :raises InvalidChapterError: if a chapter in a reference is not valid
+        :raises InvalidVerseError: if a verse in a reference is not valid
+        """
+        self._start_ordinals: array[int] = array(ORDINAL_TYPE_CODE)
+        self._end_ordinals: array[int] = array(ORDINAL_TYPE_CODE)
+
+        if references is not None:
+            self.extend(references)
+
+    @classmethod
+    def from_intervals(
+        cls: type[ReferenceArray],
+        intervals: Iterable[VerseInterval],
+    ) -> ReferenceArray:
+        """Return a ReferenceArray of the given verse intervals.
+
+        :param intervals: The first and last verse ordinals of each reference.
+        :return: The references of the intervals.
+        """
+        reference_array = cls()
+        reference_array._set_intervals(intervals)
+        return reference_array
+
+    @property
+    def start_ordinals(self: ReferenceArray) -> array[int]:
+        """Return the column of the ordinals of the first verse of each reference."""
+        return self._start_ordinals
+
+    @property
+    def end_ordinals(self: ReferenceArray) -> array[int]:
+        """Return the column of the ordinals of the last verse of each reference."""
+        return self._end_ordinals
+
+    def __len__(self: ReferenceArray) -> int:
+        """Return the number of references."""
+        return len(self._start_ordinals)
+
+    def __iter__(self: ReferenceArray) -> Iterator[NormalizedReference]:
+        """Return an iterator of the references as NormalizedReferences."""
+        return iter(convert_intervals_to_references(self.intervals()))
+
+    def __getitem__(self: ReferenceArray, index: int) -> NormalizedReference:
+        """Return the reference at the given index as a NormalizedReference."""
+        return convert_intervals_to_references(
+            [(self._start_ordinals[index], self._end_ordinals[index])],
+        )[0]
+
+    def __eq__(self: ReferenceArray, other: object) -> bool:
+        """Return True if the other ReferenceArray has the same references in order."""
+        if not isinstance(other, ReferenceArray):
+            return NotImplemented
+
+        return (
+            self._start_ordinals == other._start_ordinals
+            and self._end_ordinals == other._end_ordinals
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self: ReferenceArray) -> str:
+        """Return a representation of the ReferenceArray with its intervals."""
+        return f"{type(self).__name__}.from_intervals({list(self.intervals())!r})"
+
+    def __reduce__(self: ReferenceArray) -> tuple[Any, ...]:
+        """Pickle the columns rather than the references."""
+        return (_build_reference_array, (self._start_ordinals, self._end_ordinals))
+
+    def append(self: ReferenceArray, reference: NormalizedReference) -> None:
+        """Add the given reference to the end of the array.
+
+        :param reference: The reference to add.
+        :raises InvalidChapterError: if a chapter in the reference is not valid
+        :raises InvalidVerseError: if a verse in the reference is not valid
+        """
+        start_ordinal: int = reference.start_ordinal
+        end_ordinal: int = reference.end_ordinal
+        self._start_ordinals.append(start_ordinal)
+        self._end_ordinals.append(end_ordinal)
+
+    def extend(self: ReferenceArray, references: Iterable[NormalizedReference]) -> None:
+        """Add the given references to the end of the array.
+
+        :param references: The references to add, e.g. the result of get_references.
+        :raises InvalidChapterError: if a chapter in a reference is not valid
+        :raises InvalidVerseError: if a verse in a reference is not valid
+        """
+        if isinstance(references, ReferenceArray):
+            self._start_ordinals.extend(references.start_ordinals)
+            self._end_ordinals.extend(references.end_ordinals)
+            return
+
+        for reference in references:
+            self.append(reference)
+
+    def intervals(self: ReferenceArray) -> Iterator[VerseInterval]:
+        """Return an iterator of the first and last verse ordinals of each reference.
+
+        :return: The verse intervals of the references, in order.
+        """
+        return zip(self._start_ordinals, self._end_ordinals, strict=True)
+
+    def sort(self: ReferenceArray) -> None:
+        """Sort the references canonically by their first and then last verse."""
+        self._set_intervals(sorted(self.intervals()))
+
+    def dedupe(self: ReferenceArray) -> None:
+        """Remove repeated references, keeping the first of each."""
+        self._set_intervals(dict.fromkeys(self.intervals()))
+
+    def merge(self: ReferenceArray) -> None:
+        """Sort the references and combine any that overlap or are adjacent."""
+        self._set_intervals(merge_intervals(self.intervals()))
+
+    def to_references(self: ReferenceArray) -> list[NormalizedReference]:
+        """Return the references as a list of NormalizedReferences.
+
+        :return: The references, in order.
+        """
+        return list(self)
+
+    def _set_intervals(
+        self: ReferenceArray,
+        intervals: Iterable[VerseInterval],
+    ) -> None:
+        start_ordinals: array[int] = array(ORDINAL_TYPE_CODE)
+        end_ordinals: array[int] = array(ORDINAL_TYPE_CODE)
+
+        for start_ordinal, end_ordinal in intervals:
+            start_ordinals.append(start_ordinal)
+            end_ordinals.append(end_ordinal)
+
+        self._start_ordinals = start_ordinals
+        self._end_ordinals = end_ordinals
+
+
+def _build_reference_array(
+    start_ordinals: array[int],
+    end_ordinals: array[int],
+) -> ReferenceArray:
+    reference_array = ReferenceArray()
+    reference_array._start_ordinals = start_ordinals  # noqa: SLF001
+    reference_array._end_ordinals = end_ordinals  # noqa: SLF001
+    return reference_array
@@ -0,0 +1,150 @@
+"""Contains the ReferenceCache class, the cache of parsed scripture references."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import RLock
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from collections.abc import Iterable
+
+    from pythonbible.normalized_reference import NormalizedReference
+
+
+class ReferenceCacheInfo(NamedTuple):
+    """Statistics about a ReferenceCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    max_entries: int
+
+    @property
+    def hit_ratio(self: ReferenceCacheInfo) -> float:
+        """Return the fraction of lookups that were hits (0.0 if there were none)."""
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ReferenceCache:
+    """A least recently used (LRU) cache of parsed scripture references.
+
+    Once the cache holds more than max_entries results, the least recently used ones
+    are evicted. A max_entries of 0 disables the cache.
+
+    Normalized references are immutable, so the cached references can be shared by
+    everyone that gets them.
+
+    The cache is safe to use from multiple threads.
+    """
+
+    def __init__(self: ReferenceCache, max_entries: int = 0) -> None:
+        """Initialize an empty ReferenceCache.
+
+        :param max_entries: The maximum number of cached results, or 0 to disable the
+                            cache.
+        """
+        self._references: OrderedDict[Hashable, tuple[NormalizedReference, ...]] = (
+            OrderedDict()
+        )
+        self._lock = RLock()
+        self._max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self: ReferenceCache) -> int:
+        """Return the number of results in the cache."""
+        return len(self._references)
+
+    @property
+    def enabled(self: ReferenceCache) -> bool:
+        """Return True if the cache holds any results (i.e. max_entries is not 0)."""
+        return self._max_entries > 0
+
+    def get(self: ReferenceCache, key: Hashable) -> list[NormalizedReference] | None:
+        """Return the cached references for the given key, if there are any.
+
+        :param key: The key of the parsed text.
+        :return: A new list of the cached references, or None if they are not cached.
+        """
+        with self._lock:
+            references = self._references.get(key)
+
+            if references is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._references.move_to_end(key)
+
+        return list(references)
+
+    def add(
+        self: ReferenceCache,
+        key: Hashable,
+        references: Iterable[NormalizedReference],
+    ) -> None:
+        """Add the given references to the cache.
+
+        Nothing is added if the cache is disabled.
+
+        :param key: The key of the parsed text.
+        :param references: The references found in the parsed text.
+        """
+        if not self.enabled:
+            return
+
+        cached_references = tuple(references)
+
+        with self._lock:
+            self._references[key] = cached_references
+            self._references.move_to_end(key)
+            self._evict()
+
+    def clear(self: ReferenceCache) -> None:
+        """Remove all the results from the cache and reset the statistics."""
+        with self._lock:
+            self._references.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def configure(self: ReferenceCache, max_entries: int) -> None:
+        """Set the maximum number of results, evicting results if it is now exceeded.
+
+        :param max_entries: The maximum number of cached results, or 0 to disable the
+                            cache.
+        :raises ValueError: if max_entries is negative
+        """
+        if max_entries < 0:
+            error_message = f"max_entries must not be negative, not {max_entries}."
+            raise ValueError(error_message)
+
+        with self._lock:
+            self._max_entries = max_entries
+            self._evict()
+
+    def cache_info(self: ReferenceCache) -> ReferenceCacheInfo:
+        """Return the statistics of the cache.
+
+        :return: The hits, misses, evictions, and entries of the cache along with its
+                 limit.
+        """
+        with self._lock:
+            return ReferenceCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._references),
+                max_entries=self._max_entries,
+            )
+
+    def _evict(self: ReferenceCache) -> None:
+        while len(self._references) > self._max_entries:
+            self._references.popitem(last=False)
+            self._evictions += 1
@@ -0,0 +1,249 @@
+"""Normalizes the text of a scripture reference, for both of the reference parsers.
+
+The regular expression parser normalizes the text of each reference it matches. The
+state machine parser builds most references from the numbers it reads, but it
+identifies books, and normalizes references that span books, the same way.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Pattern
+
+from pythonbible.books import Book
+from pythonbible.normalized_reference import NormalizedReference
+from pythonbible.validator import is_valid_reference
+from pythonbible.verses import is_single_chapter_book
+
+COLON = ":"
+COMMA = ","
+DASH = "-"
+PERIOD = "."
+
+# The number of parts of a chapter and verse (e.g. "3:16") split on the colon.
+_CHAPTER_AND_VERSE_PARTS = 2
+
+_BOOKS: tuple[Book, ...] = tuple(Book)
+_BOOK_INDICES: dict[str, int] = {book.name: index for index, book in enumerate(_BOOKS)}
+
+
+def normalize_reference_text(reference: str) -> list[NormalizedReference]:
+    """Convert a scripture reference string into a list of normalized references.
+
+    Unlike parser.normalize_reference, the result is never cached.
+
+    :param reference: a string that is a scripture reference
+    :type reference: str
+    :return: The list of normalized references
+    :rtype: list[NormalizedReference]
+    """
+    references: list[NormalizedReference] = []
+    books: list[Book] = []
+    cleaned_references: list[str] = []
+    reference_without_books: str = reference
+    start: int
+    end: int
+    book_index: int
+    book_found: bool = True
+
+    while book_found:
+        book_found = False
+        book_index = 0
+
+        while book_match := _find_book(
+            reference_without_books,
+            book_index,
+            must_start_reference=not books,
+        ):
+            book_index, start, end = book_match
+            book_found = True
+
+            if books:
+                cleaned_references.append(reference_without_books[:start])
+
+            reference_without_books = reference_without_books[end:]
+            books.append(_BOOKS[book_index])
+            book_index += 1
+
+    cleaned_references.append(reference_without_books)
+
+    # First Book
+    first_book_references = _process_sub_references(
+        books[0],
+        cleaned_references[0].strip(),
+    )
+
+    if len(books) == 1:
+        return first_book_references
+
+    # Second Book
+    second_book_references = _process_sub_references(
+        books[1],
+        cleaned_references[1].strip(),
+    )
+
+    if len(first_book_references) > 1:
+        references.extend(first_book_references[:-1])
+
+    # Combine last first reference with first second reference
+    last_first_reference = first_book_references[-1]
+    first_second_reference = second_book_references[0]
+
+    references.append(
+        NormalizedReference(
+            last_first_reference.book,
+            last_first_reference.start_chapter,
+            last_first_reference.start_verse,
+            first_second_reference.end_chapter,
+            first_second_reference.end_verse,
+            first_second_reference.book,
+        ),
+    )
+
+    if len(second_book_references) > 1:
+        references.extend(second_book_references[1:])
+
+    return references
+
+
+def match_book(text: str) -> tuple[Book, int] | None:
+    """Return the book whose name starts the text, and where the name ends.
+
+    :param text: a string that may start with the name of a book
+    :type text: str
+    :return: The book and the end of its name, or None if the text doesn't start with
+             the name of a book
+    :rtype: tuple[Book, int] or None
+    """
+    if book_match := _get_book_regular_expression(0).match(text):
+        return _BOOKS[_BOOK_INDICES[book_match.lastgroup or ""]], book_match.end()
+
+    return None
+
+
+@lru_cache()
+def _get_book_regular_expression(first_book_index: int) -> Pattern[str]:
+    return re.compile(
+        "|".join(
+            f"(?P<{book.name}>{book.regular_expression})"
+            for book in _BOOKS[first_book_index:]
+        ),
+        re.IGNORECASE,
+    )
+
+
+def _find_book(
+    text: str,
+    first_book_index: int,
+    *,
+    must_start_reference: bool,
+) -> tuple[int, int, int] | None:
+    # Equivalent to searching the text with each book's regular expression in turn
+    # (starting at first_book_index) and returning the first book found. At any given
+    # position the combined alternation reports the first book matching there, so the
+    # first book overall is the lowest one reported across the positions scanned.
+    if first_book_index >= len(_BOOKS):
+        return None
+
+    book_regular_expression = _get_book_regular_expression(first_book_index)
+
+    if must_start_reference:
+        if book_match := book_regular_expression.match(text):
+            return _BOOK_INDICES[book_match.lastgroup or ""], *book_match.span()
+
+        return None
+
+    found: tuple[int, int, int] | None = None
+    position: int = 0
+
+    while book_match := book_regular_expression.search(text, position):
+        book_index: int = _BOOK_INDICES[book_match.lastgroup or ""]
+
+        if found is None or book_index < found[0]:
+            found = book_index, *book_match.span()
+
+            if book_index == first_book_index:
+                break
+
+        position = book_match.start() + 1
+
+    return found
+
+
+def _process_sub_references(book: Book, reference: str) -> list[NormalizedReference]:
+    references: list[NormalizedReference] = []
+    start_chapter: int | None = None
+
+    for sub_reference in reference.split(COMMA):
+        if (not sub_reference or sub_reference in {DASH, PERIOD}) and not references:
+            references.append(NormalizedReference(book, None, None, None, None, book))
+            continue
+
+        start_chapter, start_verse, end_chapter, end_verse = _process_sub_reference(
+            sub_reference[:-1] if sub_reference.endswith(DASH) else sub_reference,
+            book,
+            start_chapter,
+        )
+
+        new_reference = NormalizedReference(
+            book,
+            start_chapter,
+            start_verse,
+            end_chapter,
+            end_verse,
+            book,
+        )
+
+        if is_valid_reference(new_reference):
+            references.append(new_reference)
+
+        start_chapter = end_chapter
+
+    return references
+
+
+def _process_sub_reference(
+    sub_reference: str,
+    book: Book,
+    start_chapter: int | None,
+) -> tuple[int | None, int | None, int | None, int | None]:
+    start_verse: int | None = None
+    end_chapter: int | None = None
+    end_verse: int | None = None
+    no_verses: bool = False
+
+    clean_sub_reference: str = sub_reference.replace(PERIOD, COLON)
+    chapter_and_verse_range: list[str] = clean_sub_reference.split(DASH)
+    min_chapter_and_verse: list[str] = chapter_and_verse_range[0].strip().split(COLON)
+
+    if len(min_chapter_and_verse) == 1:
+        if start_chapter:
+            start_verse = int(min_chapter_and_verse[0].strip())
+        elif is_single_chapter_book(book):
+            start_chapter = 1
+            start_verse = int(min_chapter_and_verse[0].strip())
+        else:
+            start_chapter = int(min_chapter_and_verse[0].strip())
+            no_verses = True
+    elif len(min_chapter_and_verse) == _CHAPTER_AND_VERSE_PARTS:
+        start_chapter = int(min_chapter_and_verse[0].strip())
+        start_verse = int(min_chapter_and_verse[1].strip())
+
+    if len(chapter_and_verse_range) > 1:
+        max_chapter_and_verse = chapter_and_verse_range[1].split(COLON)
+
+        if len(max_chapter_and_verse) == 1:
+            if no_verses:
+                end_chapter = int(max_chapter_and_verse[0].strip())
+            else:
+                end_chapter = start_chapter
+                end_verse = int(max_chapter_and_verse[0].strip())
+        elif len(max_chapter_and_verse) == _CHAPTER_AND_VERSE_PARTS:
+            end_chapter = int(max_chapter_and_verse[0].strip())
+            end_verse = int(max_chapter_and_verse[1].strip())
+
+    end_chapter = end_chapter or start_chapter
+    end_verse = end_verse or start_verse
+
+    return start_chapter, start_verse, end_chapter, end_verse
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from typing import Pattern
 
 from pythonbible import Book
@@ -37,7 +39,41 @@ FULL_CHAPTER_AND_VERSE: str = (
 FULL_BOOK = f"({BOOK}){SPACE}(?:{FULL_CHAPTER_AND_VERSE})?"
 CROSS_BOOK = f"({FULL_BOOK}(?:{DASH}({FULL_BOOK}))?)"
 
-SCRIPTURE_REFERENCE_REGULAR_EXPRESSION: Pattern[str] = re.compile(
-    CROSS_BOOK,
-    re.IGNORECASE | re.UNICODE,
-)
+if TYPE_CHECKING:
+    SCRIPTURE_REFERENCE_REGULAR_EXPRESSION: Pattern[str]
+
+
+@lru_cache(maxsize=1)
+def get_book_regular_expression() -> Pattern[str]:
+    """Return the compiled regular expression that matches the name of any book.
+
+    This is the BOOK part of the scripture reference regular expression, which the
+    state machine parser uses to find where references start.
+
+    :return: The compiled book regular expression
+    :rtype: Pattern[str]
+    """
+    return re.compile(BOOK, re.IGNORECASE | re.UNICODE)
+
+
+@lru_cache(maxsize=1)
+def get_scripture_reference_regular_expression() -> Pattern[str]:
+    """Return the compiled regular expression that matches scripture references.
+
+    The regular expression is compiled the first time it is needed rather than when
+    pythonbible is imported; the SCRIPTURE_REFERENCE_REGULAR_EXPRESSION module
+    attribute is the same compiled regular expression.
+
+    :return: The compiled scripture reference regular expression
+    :rtype: Pattern[str]
+    """
+    return re.compile(CROSS_BOOK, re.IGNORECASE | re.UNICODE)
+
+
+def __getattr__(name: str) -> Pattern[str]:
+    # The regular expression is compiled on first use to keep imports fast.
+    if name == "SCRIPTURE_REFERENCE_REGULAR_EXPRESSION":
+        return get_scripture_reference_regular_expression()
+
+    error_message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(error_message)
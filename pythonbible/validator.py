@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import operator
+
 from pythonbible.books import Book
+from pythonbible.errors import InvalidVerseError
 from pythonbible.normalized_reference import NormalizedReference
 from pythonbible.verses import MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER
-from pythonbible.verses import VERSE_IDS
 from pythonbible.verses import get_number_of_chapters
 from pythonbible.verses import get_number_of_verses
 from pythonbible.verses import get_verse_id
+from pythonbible.verses import get_verse_ordinal
 
 
 def is_valid_verse_id(verse_id: int) -> bool:
@@ -17,7 +20,24 @@ def is_valid_verse_id(verse_id: int) -> bool:
     :return: True if the verse_id is in the list of valid verse ids; otherwise, False
     :rtype: bool
     """
-    return verse_id in VERSE_IDS
+    # Floats that equal a verse id (e.g. 1001001.0) are valid verse ids.
+    if isinstance(verse_id, float):
+        if not float.is_integer(verse_id):
+            return False
+
+        verse_id = int(verse_id)
+
+    try:
+        verse_id = operator.index(verse_id)
+    except TypeError:
+        return False
+
+    try:
+        get_verse_ordinal(verse_id)
+    except InvalidVerseError:
+        return False
+
+    return True
 
 
 def is_valid_reference(reference: NormalizedReference) -> bool:
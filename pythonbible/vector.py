@@ -0,0 +1,228 @@
+"""Vectorized verse id functions for NumPy arrays.
+
+These functions mirror the scalar functions in :mod:`pythonbible.verses` and
+:mod:`pythonbible.validator`, but take and return NumPy integer arrays so that
+large batches of verse ids can be processed without a Python function call per
+verse id. Verse ids use the same ``BOOK_PLACE``/``CHAPTER_PLACE`` encoding.
+
+NumPy is an optional dependency (``pip install pythonbible[numpy]``).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pythonbible.errors import InvalidVerseError
+from pythonbible.verses import BOOK_PLACE
+from pythonbible.verses import CHAPTER_PLACE
+from pythonbible.verses import MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER
+from pythonbible.verses import get_all_verse_ids
+
+try:
+    import numpy as np
+except ImportError as error:  # pragma: no cover
+    error_message = (
+        "pythonbible.vector requires NumPy, which can be installed with "
+        "`pip install pythonbible[numpy]`."
+    )
+    raise ImportError(error_message) from error
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+    from numpy.typing import NDArray
+
+
+def __generate_chapter_tables() -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    # Both tables are indexed by [book number, chapter number]. Row 0 and column 0
+    # are padding so that book and chapter numbers can be used as indices directly.
+    number_of_books: int = max(
+        book.value for book in MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER
+    )
+    number_of_chapters: int = max(
+        len(chapters) for chapters in MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER.values()
+    )
+    start_ordinals = np.zeros((number_of_books + 1, number_of_chapters + 1), np.int64)
+    max_verses = np.zeros((number_of_books + 1, number_of_chapters + 1), np.int64)
+    ordinal: int = 0
+
+    for book, chapters in MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER.items():
+        for chapter, max_verse in enumerate(chapters, 1):
+            start_ordinals[book.value, chapter] = ordinal
+            max_verses[book.value, chapter] = max_verse
+            ordinal += max_verse
+
+    return start_ordinals, max_verses
+
+
+_CHAPTER_START_ORDINALS, _MAX_VERSES = __generate_chapter_tables()
+
+VERSE_ID_ARRAY: NDArray[np.int64] = np.array(get_all_verse_ids(), dtype=np.int64)
+VERSE_ID_ARRAY.flags.writeable = False
+
+
+def get_book_numbers(verse_ids: ArrayLike) -> NDArray[np.int64]:
+    """Return the book number for each of the given verse ids.
+
+    :param verse_ids: an array of verse ids
+    :type verse_ids: ArrayLike
+    :return: The book number for each verse id
+    :rtype: NDArray[np.int64]
+    """
+    return np.asarray(verse_ids, dtype=np.int64) // BOOK_PLACE
+
+
+def get_chapter_numbers(verse_ids: ArrayLike) -> NDArray[np.int64]:
+    """Return the chapter number for each of the given verse ids.
+
+    :param verse_ids: an array of verse ids
+    :type verse_ids: ArrayLike
+    :return: The chapter number for each verse id
+    :rtype: NDArray[np.int64]
+    """
+    return np.asarray(verse_ids, dtype=np.int64) % BOOK_PLACE // CHAPTER_PLACE
+
+
+def get_verse_numbers(verse_ids: ArrayLike) -> NDArray[np.int64]:
+    """Return the verse number for each of the given verse ids.
+
+    :param verse_ids: an array of verse ids
+    :type verse_ids: ArrayLike
+    :return: The verse number for each verse id
+    :rtype: NDArray[np.int64]
+    """
+    return np.asarray(verse_ids, dtype=np.int64) % CHAPTER_PLACE
+
+
+def get_book_chapter_verse(
+    verse_ids: ArrayLike,
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+    """Return the book, chapter, and verse numbers for each of the given verse ids.
+
+    :param verse_ids: an array of verse ids
+    :type verse_ids: ArrayLike
+    :return: A tuple containing the arrays of book numbers, chapter numbers, and verse
+             numbers for the given verse ids
+    :rtype: tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]
+    :raises InvalidVerseError: if any of the verse ids does not correspond to a valid
+                               verse
+    """
+    verse_id_array = np.asarray(verse_ids, dtype=np.int64)
+    _raise_for_invalid_verse_ids(verse_id_array, is_valid_verse_id(verse_id_array))
+
+    return (
+        get_book_numbers(verse_id_array),
+        get_chapter_numbers(verse_id_array),
+        get_verse_numbers(verse_id_array),
+    )
+
+
+def is_valid_verse_id(verse_ids: ArrayLike) -> NDArray[np.bool_]:
+    """Return a mask of which of the given verse ids correspond to valid verses.
+
+    :param verse_ids: an array of verse ids
+    :type verse_ids: ArrayLike
+    :return: True for each valid verse id; otherwise, False
+    :rtype: NDArray[np.bool_]
+    """
+    return _get_verse_ordinals(np.asarray(verse_ids, dtype=np.int64))[1]
+
+
+def get_verse_ordinals(verse_ids: ArrayLike) -> NDArray[np.int64]:
+    """Return the ordinal (zero-based canonical position) of each of the verse ids.
+
+    :param verse_ids: an array of verse ids
+    :type verse_ids: ArrayLike
+    :return: The ordinal for each verse id
+    :rtype: NDArray[np.int64]
+    :raises InvalidVerseError: if any of the verse ids does not correspond to a valid
+                               verse
+    """
+    verse_id_array = np.asarray(verse_ids, dtype=np.int64)
+    ordinals, is_valid = _get_verse_ordinals(verse_id_array)
+    _raise_for_invalid_verse_ids(verse_id_array, is_valid)
+
+    return ordinals
+
+
+def get_verse_ids(ordinals: ArrayLike) -> NDArray[np.int64]:
+    """Return the verse id for each of the given ordinals.
+
+    :param ordinals: an array of verse ordinals
+    :type ordinals: ArrayLike
+    :return: The verse id for each ordinal
+    :rtype: NDArray[np.int64]
+    :raises IndexError: if any of the ordinals is out of range
+    """
+    ordinal_array = np.asarray(ordinals, dtype=np.int64)
+
+    # Negative ordinals would otherwise index the verse ids from the end.
+    if (ordinal_array < 0).any():
+        error_message = f"{ordinal_array[ordinal_array < 0][0]} is not a verse ordinal."
+        raise IndexError(error_message)
+
+    return VERSE_ID_ARRAY[ordinal_array]
+
+
+def expand_verse_id_ranges(
+    start_verse_ids: ArrayLike,
+    end_verse_ids: ArrayLike,
+) -> NDArray[np.int64]:
+    """Return all the verse ids in the given inclusive ranges of verse ids.
+
+    The ranges are expanded in order and concatenated into a single array. A range
+    whose end verse comes before its start verse is empty.
+
+    :param start_verse_ids: an array of the first verse id in each range
+    :type start_verse_ids: ArrayLike
+    :param end_verse_ids: an array of the last verse id in each range
+    :type end_verse_ids: ArrayLike
+    :return: The verse ids included in the ranges
+    :rtype: NDArray[np.int64]
+    :raises InvalidVerseError: if any of the verse ids does not correspond to a valid
+                               verse
+    """
+    start_ordinals = get_verse_ordinals(start_verse_ids)
+    end_ordinals = get_verse_ordinals(end_verse_ids)
+    lengths = np.maximum(end_ordinals - start_ordinals + 1, 0)
+
+    # Each output position is its range's start ordinal plus its offset in the range.
+    range_offsets = np.cumsum(lengths) - lengths
+    positions = np.arange(lengths.sum()) - np.repeat(range_offsets, lengths)
+
+    return VERSE_ID_ARRAY[np.repeat(start_ordinals, lengths) + positions]
+
+
+def _get_verse_ordinals(
+    verse_ids: NDArray[np.int64],
+) -> tuple[NDArray[np.int64], NDArray[np.bool_]]:
+    book_numbers = get_book_numbers(verse_ids)
+    chapter_numbers = get_chapter_numbers(verse_ids)
+    verse_numbers = get_verse_numbers(verse_ids)
+
+    number_of_books, number_of_chapters = _MAX_VERSES.shape
+    is_valid = (
+        (book_numbers > 0)
+        & (book_numbers < number_of_books)
+        & (chapter_numbers > 0)
+        & (chapter_numbers < number_of_chapters)
+    )
+
+    # Look up the invalid verse ids in the padding row so that indexing is safe.
+    book_numbers = np.where(is_valid, book_numbers, 0)
+    chapter_numbers = np.where(is_valid, chapter_numbers, 0)
+    is_valid &= (verse_numbers > 0) & (
+        verse_numbers <= _MAX_VERSES[book_numbers, chapter_numbers]
+    )
+
+    ordinals = _CHAPTER_START_ORDINALS[book_numbers, chapter_numbers]
+    ordinals += verse_numbers - 1
+
+    return np.where(is_valid, ordinals, -1), is_valid
+
+
+def _raise_for_invalid_verse_ids(
+    verse_ids: NDArray[np.int64],
+    is_valid: NDArray[np.bool_],
+) -> None:
+    if not is_valid.all():
+        raise InvalidVerseError(verse_id=int(verse_ids[~is_valid].flat[0]))
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from array import array
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from pythonbible.books import Book
 from pythonbible.errors import InvalidChapterError
@@ -1446,22 +1448,132 @@ MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER: dict[Book, list[int]] = {
 BOOK_PLACE = 1000000
 CHAPTER_PLACE = 1000
 
+if TYPE_CHECKING:
+    VERSE_IDS: tuple[int, ...]
+
 
 @lru_cache()
 def __generate_verse_ids() -> tuple[int, ...]:
     return tuple(
-        int(
-            f"{str(book.value).zfill(2)}"
-            f"{str(chapter + 1).zfill(3)}"
-            f"{str(verse + 1).zfill(3)}",
-        )
+        book.value * BOOK_PLACE + chapter * CHAPTER_PLACE + verse
         for book, chapters in MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER.items()
-        for chapter, max_verse in enumerate(chapters)
-        for verse in range(max_verse)
+        for chapter, max_verse in enumerate(chapters, 1)
+        for verse in range(1, max_verse + 1)
     )
 
 
-VERSE_IDS: tuple[int, ...] = __generate_verse_ids()
+def get_all_verse_ids() -> tuple[int, ...]:
+    """Return the verse ids of every verse of the Bible in canonical order.
+
+    The index of a verse id in the tuple is its ordinal (see get_verse_ordinal). The
+    tuple is built the first time it is needed rather than when pythonbible is
+    imported; the VERSE_IDS module attribute is the same tuple.
+
+    :return: All the verse ids in canonical order
+    :rtype: tuple[int, ...]
+    """
+    return __generate_verse_ids()
+
+
+def __getattr__(name: str) -> tuple[int, ...]:
+    # VERSE_IDS is built on first use (see get_all_verse_ids) to keep imports fast.
+    if name == "VERSE_IDS":
+        return get_all_verse_ids()
+
+    error_message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(error_message)
+
+
+def __generate_chapter_start_ordinals() -> dict[int, array[int]]:
+    # For each book number, the ordinal (index into VERSE_IDS) of the first verse of
+    # each chapter, followed by the ordinal of the first verse after the book.
+    chapter_start_ordinals: dict[int, array[int]] = {}
+    ordinal: int = 0
+
+    for book, chapters in MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER.items():
+        start_ordinals: array[int] = array("I", [ordinal])
+
+        for max_verse in chapters:
+            ordinal += max_verse
+            start_ordinals.append(ordinal)
+
+        chapter_start_ordinals[book.value] = start_ordinals
+
+    return chapter_start_ordinals
+
+
+_CHAPTER_START_ORDINALS: dict[int, array[int]] = __generate_chapter_start_ordinals()
+
+
+def __generate_book_chapter_offsets() -> dict[int, int]:
+    # For each book number, the total number of chapters in the books before it, so
+    # that the chapters between any two chapters can be counted by subtraction.
+    book_chapter_offsets: dict[int, int] = {}
+    offset: int = 0
+
+    for book, chapters in MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER.items():
+        book_chapter_offsets[book.value] = offset
+        offset += len(chapters)
+
+    return book_chapter_offsets
+
+
+_BOOK_CHAPTER_OFFSETS: dict[int, int] = __generate_book_chapter_offsets()
+
+
+def __generate_ordinal_tables() -> tuple[
+    array[int],
+    array[int],
+    array[int],
+    array[int],
+]:
+    # The book number, chapter number, verse number, and chapter index (the position
+    # of the chapter among all the chapters of the Bible) of each verse, indexed by
+    # ordinal, so that a verse's metadata is a few array lookups.
+    book_numbers: array[int] = array("B")
+    chapter_numbers: array[int] = array("H")
+    verse_numbers: array[int] = array("H")
+    chapter_indexes: array[int] = array("H")
+    chapter_index: int = 0
+
+    for book, chapters in MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER.items():
+        book_numbers.extend(array("B", [book.value]) * sum(chapters))
+
+        for chapter, max_verse in enumerate(chapters, 1):
+            chapter_numbers.extend(array("H", [chapter]) * max_verse)
+            verse_numbers.extend(range(1, max_verse + 1))
+            chapter_indexes.extend(array("H", [chapter_index]) * max_verse)
+            chapter_index += 1
+
+    return book_numbers, chapter_numbers, verse_numbers, chapter_indexes
+
+
+(
+    _ORDINAL_BOOK_NUMBERS,
+    _ORDINAL_CHAPTER_NUMBERS,
+    _ORDINAL_VERSE_NUMBERS,
+    _ORDINAL_CHAPTER_INDEXES,
+) = __generate_ordinal_tables()
+
+# The ordinal of the first verse of each chapter (by chapter index), followed by the
+# number of verses, so the last ordinal of a chapter is one less than the next start.
+_CHAPTER_ORDINALS: array[int] = array(
+    "I",
+    [
+        *(
+            start_ordinal
+            for start_ordinals in _CHAPTER_START_ORDINALS.values()
+            for start_ordinal in start_ordinals[:-1]
+        ),
+        len(_ORDINAL_VERSE_NUMBERS),
+    ],
+)
+
+# Each Book by book number, to avoid calling Book() in hot loops.
+_BOOKS: tuple[Book | None, ...] = (
+    None,
+    *sorted(Book, key=lambda book: book.value),
+)
 
 
 @lru_cache()
@@ -1494,7 +1606,7 @@ def get_number_of_verses(book: Book, chapter: int) -> int:
     :raises InvalidChapterError: if the given chapter isn't a valid chapter for the
                                  given book
     """
-    # TODO - require a version parameter since verse count differs by version
+    # The standard versification (see pythonbible.versification for other versions)
     chapter_list: list[int] = MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER[book]
 
     try:
@@ -1534,7 +1646,6 @@ def get_verse_id(book: Book, chapter: int, verse: int) -> int:
     return book.value * BOOK_PLACE + chapter * CHAPTER_PLACE + verse
 
 
-@lru_cache()
 def get_book_chapter_verse(verse_id: int) -> tuple[Book, int, int]:
     """Return the Book, chapter number, and verse number for the given verse id.
 
@@ -1545,17 +1656,16 @@ def get_book_chapter_verse(verse_id: int) -> tuple[Book, int, int]:
     :rtype: tuple[Book, int, int]
     :raises InvalidVerseError: if the verse id does not correspond to a valid verse
     """
-    if verse_id not in VERSE_IDS:
-        raise InvalidVerseError(verse_id=verse_id)
+    # Floats that equal a verse id (e.g. 1001001.0) are accepted as that verse id.
+    if isinstance(verse_id, float):
+        if not float.is_integer(verse_id):
+            raise InvalidVerseError(verse_id=verse_id)
 
-    return (
-        Book(get_book_number(verse_id)),  # type: ignore[call-arg]
-        get_chapter_number(verse_id),
-        get_verse_number(verse_id),
-    )
+        verse_id = int(verse_id)
+
+    return get_book_chapter_verse_by_ordinal(get_verse_ordinal(verse_id))
 
 
-@lru_cache()
 def get_book_number(verse_id: int) -> int:
     """Return the book number for the given verse id.
 
@@ -1567,7 +1677,6 @@ def get_book_number(verse_id: int) -> int:
     return verse_id // BOOK_PLACE
 
 
-@lru_cache()
 def get_chapter_number(verse_id: int) -> int:
     """Return the chapter number for the given verse id.
 
@@ -1579,7 +1688,6 @@ def get_chapter_number(verse_id: int) -> int:
     return verse_id % BOOK_PLACE // CHAPTER_PLACE
 
 
-@lru_cache()
 def get_verse_number(verse_id: int) -> int:
     """Return the verse number for the given verse id.
 
@@ -1589,3 +1697,133 @@ def get_verse_number(verse_id: int) -> int:
     :rtype: int
     """
     return verse_id % CHAPTER_PLACE
+
+
+def get_verse_ordinal(verse_id: int) -> int:
+    """Return the ordinal (zero-based canonical position) of the given verse id.
+
+    The ordinal is the index of the verse id in VERSE_IDS, computed in constant time.
+
+    :param verse_id: a verse id
+    :type verse_id: int
+    :return: The ordinal for the given verse id
+    :rtype: int
+    :raises InvalidVerseError: if the verse id does not correspond to a valid verse
+    """
+    start_ordinals: array[int] | None = _CHAPTER_START_ORDINALS.get(
+        verse_id // BOOK_PLACE,
+    )
+    chapter: int = verse_id % BOOK_PLACE // CHAPTER_PLACE
+    verse: int = verse_id % CHAPTER_PLACE
+
+    if start_ordinals is None or not 1 <= chapter < len(start_ordinals):
+        raise InvalidVerseError(verse_id=verse_id)
+
+    ordinal: int = start_ordinals[chapter - 1] + verse - 1
+
+    if verse < 1 or ordinal >= start_ordinals[chapter]:
+        raise InvalidVerseError(verse_id=verse_id)
+
+    return ordinal
+
+
+def get_verse_id_by_ordinal(ordinal: int) -> int:
+    """Return the verse id of the verse with the given ordinal.
+
+    :param ordinal: the ordinal (zero-based canonical position) of a verse
+    :type ordinal: int
+    :return: The verse id for the given ordinal
+    :rtype: int
+    :raises InvalidVerseError: if the ordinal is not the ordinal of a verse
+    """
+    _validate_ordinal(ordinal)
+
+    return (
+        _ORDINAL_BOOK_NUMBERS[ordinal] * BOOK_PLACE
+        + _ORDINAL_CHAPTER_NUMBERS[ordinal] * CHAPTER_PLACE
+        + _ORDINAL_VERSE_NUMBERS[ordinal]
+    )
+
+
+def get_book_chapter_verse_by_ordinal(ordinal: int) -> tuple[Book, int, int]:
+    """Return the Book, chapter number, and verse number of the verse with the ordinal.
+
+    :param ordinal: the ordinal (zero-based canonical position) of a verse
+    :type ordinal: int
+    :return: A tuple containing the Book, chapter number, and verse number for the
+             given ordinal
+    :rtype: tuple[Book, int, int]
+    :raises InvalidVerseError: if the ordinal is not the ordinal of a verse
+    """
+    _validate_ordinal(ordinal)
+
+    return (
+        _BOOKS[_ORDINAL_BOOK_NUMBERS[ordinal]],  # type: ignore[return-value]
+        _ORDINAL_CHAPTER_NUMBERS[ordinal],
+        _ORDINAL_VERSE_NUMBERS[ordinal],
+    )
+
+
+def get_chapter_ordinals(ordinal: int) -> tuple[int, int]:
+    """Return the first and last ordinals of the chapter of the verse with the ordinal.
+
+    :param ordinal: the ordinal (zero-based canonical position) of a verse
+    :type ordinal: int
+    :return: The ordinals of the first and last verses of the verse's chapter
+    :rtype: tuple[int, int]
+    :raises InvalidVerseError: if the ordinal is not the ordinal of a verse
+    """
+    _validate_ordinal(ordinal)
+    chapter_index: int = _ORDINAL_CHAPTER_INDEXES[ordinal]
+
+    return _CHAPTER_ORDINALS[chapter_index], _CHAPTER_ORDINALS[chapter_index + 1] - 1
+
+
+def get_chapter_index(book: Book, chapter: int) -> int:
+    """Return the position of the given chapter among all the chapters of the Bible.
+
+    The number of chapters from one chapter to another, even in another book, is the
+    difference between their indexes plus one.
+
+    :param book: a book of the Bible
+    :type book: Book
+    :param chapter: a chapter of the given book of the Bible
+    :type chapter: int
+    :return: The zero-based index of the chapter among all the chapters of the Bible
+    :rtype: int
+    :raises InvalidChapterError: if the given chapter isn't a valid chapter for the
+                                 given book
+    """
+    book_number: int = book.value
+    number_of_chapters: int = len(_CHAPTER_START_ORDINALS[book_number]) - 1
+
+    if not 1 <= chapter <= number_of_chapters:
+        error_message = (
+            f"{chapter} is not a valid chapter number for the book of {book.title}. "
+            f"Valid chapter numbers are 1-{number_of_chapters}."
+        )
+        raise InvalidChapterError(error_message)
+
+    return _BOOK_CHAPTER_OFFSETS[book_number] + chapter - 1
+
+
+def get_chapter_index_by_ordinal(ordinal: int) -> int:
+    """Return the position of the chapter of the verse with the given ordinal.
+
+    :param ordinal: the ordinal (zero-based canonical position) of a verse
+    :type ordinal: int
+    :return: The zero-based index of the verse's chapter among all the chapters of the
+             Bible
+    :rtype: int
+    :raises InvalidVerseError: if the ordinal is not the ordinal of a verse
+    """
+    _validate_ordinal(ordinal)
+
+    return _ORDINAL_CHAPTER_INDEXES[ordinal]
+
+
+def _validate_ordinal(ordinal: int) -> None:
+    # Negative ordinals would otherwise index the tables from the end.
+    if not 0 <= ordinal < len(_ORDINAL_VERSE_NUMBERS):
+        error_message = f"{ordinal} is not a valid verse ordinal."
+        raise InvalidVerseError(error_message)
@@ -0,0 +1,640 @@
+"""Contains the versification of each version of the Bible.
+
+A versification is the way a tradition divides the books of the Bible into chapters
+and verses, e.g. the Hebrew Bible numbers Malachi 4:1-6 of most English translations
+as Malachi 3:19-24. Each Versification has its own table of verse counts and ordinal
+index (the position of each verse in its canonical order), so verse ids can be
+validated, counted, and expanded in constant time for a given version.
+
+Versifications are registered by name and only built the first time they are used.
+Every version uses the standard versification (the verse counts in
+pythonbible.verses) unless it is assigned another one with add_versification.
+VersificationMapping moves verse ids from one versification to another in bulk with a
+precomputed table of target ordinals, built from the ranges of verses that are
+numbered differently (see add_versification_mapping).
+"""
+
+from __future__ import annotations
+
+from array import array
+from threading import RLock
+from typing import TYPE_CHECKING
+from typing import Union
+
+from pythonbible.books import Book
+from pythonbible.errors import InvalidBookError
+from pythonbible.errors import InvalidChapterError
+from pythonbible.errors import InvalidVerseError
+from pythonbible.verses import BOOK_PLACE
+from pythonbible.verses import CHAPTER_PLACE
+from pythonbible.verses import MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER
+from pythonbible.versions import DEFAULT_VERSION
+from pythonbible.versions import Version
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+STANDARD_VERSIFICATION = "standard"
+
+# The number of verses in each chapter of each book, or a function that returns them
+# (e.g. by reading a file) the first time the versification is used.
+VerseCounts = Union[
+    "Mapping[Book, Sequence[int]]",
+    "Callable[[], Mapping[Book, Sequence[int]]]",
+]
+
+# A range of verses that is numbered differently in another versification: the first
+# and last verse ids of the range, and the verse id of its first verse in the other
+# versification.
+VersificationRange = tuple[int, int, int]
+
+# Marks a verse that has no counterpart in a VersificationMapping's target.
+NO_VERSE = -1
+
+
+class Versification:
+    """The chapters and verses of the books of the Bible in one versification.
+
+    The verse ids are built once, along with each chapter's first ordinal, so that
+    converting between verse ids and ordinals takes constant time.
+    """
+
+    __slots__ = ("_chapter_start_ordinals", "_name", "_verse_ids")
+
+    def __init__(
+        self: Versification,
+        name: str,
+        verse_counts: Mapping[Book, Sequence[int]],
+    ) -> None:
+        """Initialize a Versification.
+
+        :param name: The name of the versification
+        :param verse_counts: The number of verses in each chapter of each book, with
+                             the books in canonical order
+        :raises InvalidChapterError: if a chapter has no verses
+        """
+        self._name: str = name
+        # For each book number, the ordinal of the first verse of each chapter,
+        # followed by the ordinal of the first verse after the book.
+        self._chapter_start_ordinals: dict[int, array[int]] = {}
+        verse_ids: array[int] = array("I")
+
+        for book, chapters in verse_counts.items():
+            start_ordinals: array[int] = array("I", [len(verse_ids)])
+
+            for chapter, max_verse in enumerate(chapters, 1):
+                if max_verse < 1:
+                    error_message = (
+                        f"{book.title} {chapter} has no verses in the {name} "
+                        "versification."
+                    )
+                    raise InvalidChapterError(error_message)
+
+                chapter_id: int = book.value * BOOK_PLACE + chapter * CHAPTER_PLACE
+                verse_ids.extend(range(chapter_id + 1, chapter_id + max_verse + 1))
+                start_ordinals.append(len(verse_ids))
+
+            self._chapter_start_ordinals[book.value] = start_ordinals
+
+        self._verse_ids: tuple[int, ...] = tuple(verse_ids)
+
+    def __repr__(self: Versification) -> str:
+        """Return the representation of the versification."""
+        return f"Versification({self._name!r})"
+
+    def __len__(self: Versification) -> int:
+        """Return the number of verses in the versification."""
+        return len(self._verse_ids)
+
+    def __contains__(self: Versification, verse_id: object) -> bool:
+        """Return True if the verse id is a verse of the versification."""
+        return isinstance(verse_id, int) and self.is_valid_verse_id(verse_id)
+
+    @property
+    def name(self: Versification) -> str:
+        """Return the name of the versification."""
+        return self._name
+
+    @property
+    def books(self: Versification) -> tuple[Book, ...]:
+        """Return the books of the versification in canonical order."""
+        return tuple(
+            Book(book_number)  # type: ignore[call-arg]
+            for book_number in self._chapter_start_ordinals
+        )
+
+    def get_number_of_chapters(self: Versification, book: Book) -> int:
+        """Return the number of chapters in the given book.
+
+        :param book: a book of the Bible
+        :return: the number of chapters in the book
+        :raises InvalidBookError: if the book is not in the versification
+        """
+        return len(self._get_chapter_start_ordinals(book)) - 1
+
+    def get_number_of_verses(self: Versification, book: Book, chapter: int) -> int:
+        """Return the number of verses in the given book and chapter.
+
+        :param book: a book of the Bible
+        :param chapter: a chapter of the book
+        :return: the number of verses in the book and chapter
+        :raises InvalidBookError: if the book is not in the versification
+        :raises InvalidChapterError: if the chapter is not a chapter of the book
+        """
+        start_ordinals: array[int] = self._get_chapter_start_ordinals(book)
+
+        if not 1 <= chapter < len(start_ordinals):
+            error_message = (
+                f"{chapter} is not a valid chapter number for the book of "
+                f"{book.title} in the {self._name} versification. Valid chapter "
+                f"numbers are 1-{len(start_ordinals) - 1}."
+            )
+            raise InvalidChapterError(error_message)
+
+        return start_ordinals[chapter] - start_ordinals[chapter - 1]
+
+    def get_verse_id(self: Versification, book: Book, chapter: int, verse: int) -> int:
+        """Return the verse id for the given book, chapter number, and verse number.
+
+        :param book: a book of the Bible
+        :param chapter: a chapter number of the book
+        :param verse: a verse number of the chapter
+        :return: the verse id
+        :raises InvalidBookError: if the book is not in the versification
+        :raises InvalidChapterError: if the chapter is not a chapter of the book
+        :raises InvalidVerseError: if the verse is not a verse of the chapter
+        """
+        max_verse_number: int = self.get_number_of_verses(book, chapter)
+
+        if not 1 <= verse <= max_verse_number:
+            error_message = (
+                f"{book.title} {chapter}:{verse} is not a valid verse in the "
+                f"{self._name} versification. Valid verses for that book and "
+                f"chapter are 1-{max_verse_number}"
+            )
+            raise InvalidVerseError(error_message)
+
+        return book.value * BOOK_PLACE + chapter * CHAPTER_PLACE + verse
+
+    def get_all_verse_ids(self: Versification) -> tuple[int, ...]:
+        """Return the verse ids of every verse in canonical order.
+
+        :return: All the verse ids, indexed by ordinal
+        """
+        return self._verse_ids
+
+    def get_verse_ids(
+        self: Versification,
+        start_verse_id: int,
+        end_verse_id: int,
+    ) -> tuple[int, ...]:
+        """Return the verse ids from the start verse id to the end verse id.
+
+        :param start_verse_id: the verse id of the first verse
+        :param end_verse_id: the verse id of the last verse
+        :return: The verse ids of the range, in canonical order
+        :raises InvalidVerseError: if either verse id is not a verse of the
+                                   versification
+        """
+        return self._verse_ids[
+            self.get_verse_ordinal(start_verse_id) : self.get_verse_ordinal(
+                end_verse_id,
+            )
+            + 1
+        ]
+
+    def is_valid_verse_id(self: Versification, verse_id: int) -> bool:
+        """Return True if the verse id is a verse of the versification.
+
+        :param verse_id: a verse id
+        :return: True if the verse id is valid, otherwise False
+        """
+        return self._find_verse_ordinal(verse_id) is not None
+
+    def get_verse_ordinal(self: Versification, verse_id: int) -> int:
+        """Return the ordinal (zero-based canonical position) of the verse id.
+
+        :param verse_id: a verse id
+        :return: The ordinal of the verse id in the versification
+        :raises InvalidVerseError: if the verse id is not a verse of the versification
+        """
+        ordinal: int | None = self._find_verse_ordinal(verse_id)
+
+        if ordinal is None:
+            error_message = (
+                f"{verse_id} is not a valid verse in the {self._name} versification."
+            )
+            raise InvalidVerseError(error_message)
+
+        return ordinal
+
+    def get_verse_id_by_ordinal(self: Versification, ordinal: int) -> int:
+        """Return the verse id of the verse with the given ordinal.
+
+        :param ordinal: the ordinal of a verse in the versification
+        :return: The verse id for the ordinal
+        :raises InvalidVerseError: if the ordinal is not the ordinal of a verse
+        """
+        if not 0 <= ordinal < len(self._verse_ids):
+            error_message = (
+                f"{ordinal} is not a valid verse ordinal in the {self._name} "
+                "versification."
+            )
+            raise InvalidVerseError(error_message)
+
+        return self._verse_ids[ordinal]
+
+    def _get_chapter_start_ordinals(self: Versification, book: Book) -> array[int]:
+        start_ordinals: array[int] | None = self._chapter_start_ordinals.get(book.value)
+
+        if start_ordinals is None:
+            error_message = (
+                f"The book of {book.title} is not in the {self._name} versification."
+            )
+            raise InvalidBookError(error_message)
+
+        return start_ordinals
+
+    def _find_verse_ordinal(self: Versification, verse_id: int) -> int | None:
+        start_ordinals: array[int] | None = self._chapter_start_ordinals.get(
+            verse_id // BOOK_PLACE,
+        )
+        chapter: int = verse_id % BOOK_PLACE // CHAPTER_PLACE
+        verse: int = verse_id % CHAPTER_PLACE
+
+        if start_ordinals is None or not 1 <= chapter < len(start_ordinals):
+            return None
+
+        ordinal: int = start_ordinals[chapter - 1] + verse - 1
+
+        if verse < 1 or ordinal >= start_ordinals[chapter]:
+            return None
+
+        return ordinal
+
+
+class VersificationMapping:
+    """A precomputed table that maps the verses of one versification to another.
+
+    The table has the target ordinal of each source ordinal (NO_VERSE if the verse has
+    no counterpart in the target), so mapping a verse takes two array lookups.
+    """
+
+    __slots__ = ("_source", "_target", "_target_ordinals")
+
+    def __init__(
+        self: VersificationMapping,
+        source: Versification,
+        target: Versification,
+        target_ordinals: array[int],
+    ) -> None:
+        """Initialize a VersificationMapping.
+
+        :param source: The versification of the verse ids to map
+        :param target: The versification to map them to
+        :param target_ordinals: The target ordinal of each source ordinal (or
+                                NO_VERSE), an array("i") as long as the source
+        :raises ValueError: if there isn't one target ordinal per source verse
+        """
+        if len(target_ordinals) != len(source):
+            error_message = (
+                f"A mapping from the {source.name} versification needs "
+                f"{len(source)} target ordinals, not {len(target_ordinals)}."
+            )
+            raise ValueError(error_message)
+
+        self._source: Versification = source
+        self._target: Versification = target
+        self._target_ordinals: array[int] = target_ordinals
+
+    def __repr__(self: VersificationMapping) -> str:
+        """Return the representation of the mapping."""
+        return f"VersificationMapping({self._source.name!r}, {self._target.name!r})"
+
+    @property
+    def source(self: VersificationMapping) -> Versification:
+        """Return the versification the verse ids are mapped from."""
+        return self._source
+
+    @property
+    def target(self: VersificationMapping) -> Versification:
+        """Return the versification the verse ids are mapped to."""
+        return self._target
+
+    @property
+    def target_ordinals(self: VersificationMapping) -> array[int]:
+        """Return the target ordinal of each source ordinal (or NO_VERSE).
+
+        The returned array is shared with the mapping, so it should not be modified.
+        """
+        return self._target_ordinals
+
+    def invert(self: VersificationMapping) -> VersificationMapping:
+        """Return the mapping from the target versification back to the source.
+
+        :return: The inverse mapping
+        """
+        source_ordinals: array[int] = array("i", [NO_VERSE]) * len(self._target)
+
+        for ordinal, target_ordinal in enumerate(self._target_ordinals):
+            if target_ordinal != NO_VERSE:
+                source_ordinals[target_ordinal] = ordinal
+
+        return VersificationMapping(self._target, self._source, source_ordinals)
+
+    def map_verse_id(self: VersificationMapping, verse_id: int) -> int | None:
+        """Return the target verse id of the given source verse id.
+
+        :param verse_id: a verse id in the source versification
+        :return: The verse id in the target versification, or None if the verse has
+                 no counterpart in the target
+        :raises InvalidVerseError: if the verse id is not a verse of the source
+        """
+        target_ordinal: int = self._target_ordinals[
+            self._source.get_verse_ordinal(verse_id)
+        ]
+        return (
+            None
+            if target_ordinal == NO_VERSE
+            else self._target.get_all_verse_ids()[target_ordinal]
+        )
+
+    def map_verse_ids(
+        self: VersificationMapping,
+        verse_ids: Iterable[int],
+    ) -> list[int]:
+        """Return the target verse ids of the given source verse ids, in order.
+
+        Verses that have no counterpart in the target are left out.
+
+        :param verse_ids: verse ids in the source versification
+        :return: The verse ids in the target versification
+        :raises InvalidVerseError: if a verse id is not a verse of the source
+        """
+        get_verse_ordinal: Callable[[int], int] = self._source.get_verse_ordinal
+        target_ordinals: array[int] = self._target_ordinals
+        target_verse_ids: tuple[int, ...] = self._target.get_all_verse_ids()
+        mapped_verse_ids: list[int] = []
+
+        for verse_id in verse_ids:
+            target_ordinal: int = target_ordinals[get_verse_ordinal(verse_id)]
+
+            if target_ordinal != NO_VERSE:
+                mapped_verse_ids.append(target_verse_ids[target_ordinal])
+
+        return mapped_verse_ids
+
+
+# The registered versifications (or the functions that load their verse counts), the
+# versification of each version that doesn't use the standard one, and the ranges of
+# each registered mapping, by source and target name.
+_VERSE_COUNTS: dict[str, VerseCounts] = {
+    STANDARD_VERSIFICATION: MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER,
+}
+_VERSION_VERSIFICATIONS: dict[Version, str] = {}
+_MAPPING_RANGES: dict[tuple[str, str], tuple[VersificationRange, ...]] = {}
+
+# The versifications and mappings that have been built.
+_VERSIFICATIONS: dict[str, Versification] = {}
+_MAPPINGS: dict[tuple[str, str], VersificationMapping] = {}
+_LOCK = RLock()
+
+
+def add_versification(
+    name: str,
+    verse_counts: VerseCounts,
+    versions: Iterable[Version] = (),
+) -> None:
+    """Register a versification and use it for the given versions.
+
+    The versification is built the first time it is used, so verse_counts can be a
+    function that loads the verse counts (e.g. from a file) when they are needed.
+    Registering a versification with the name of an existing one replaces it.
+
+    :param name: The name of the versification
+    :type name: str
+    :param verse_counts: The number of verses in each chapter of each book in
+                         canonical order, or a function that returns them
+    :type verse_counts: Mapping[Book, Sequence[int]] | Callable[[], Mapping[Book,
+                        Sequence[int]]]
+    :param versions: The versions that use the versification
+    :type versions: Iterable[Version]
+    :raises ValueError: if the name is the name of the standard versification
+    """
+    if name == STANDARD_VERSIFICATION:
+        error_message = f"The {name} versification can't be replaced."
+        raise ValueError(error_message)
+
+    with _LOCK:
+        _VERSE_COUNTS[name] = verse_counts
+        _VERSIFICATIONS.pop(name, None)
+        _clear_mappings(name)
+
+        for version in versions:
+            _VERSION_VERSIFICATIONS[version] = name
+
+
+def add_versification_mapping(
+    source: str,
+    target: str,
+    ranges: Iterable[VersificationRange],
+) -> None:
+    """Register the ranges of verses that are numbered differently in two versions.
+
+    The ranges are given from the source to the target versification, and are also
+    used (inverted) to map from the target to the source.
+
+    :param source: The name of the versification of the ranges' verse ids
+    :type source: str
+    :param target: The name of the versification the ranges are mapped to
+    :type target: str
+    :param ranges: The first and last source verse ids of each range, and the target
+                   verse id of its first verse
+    :type ranges: Iterable[tuple[int, int, int]]
+    :raises ValueError: if either versification has not been registered
+    """
+    for name in (source, target):
+        _validate_name(name)
+
+    with _LOCK:
+        _MAPPING_RANGES[source, target] = tuple(ranges)
+        _MAPPING_RANGES.pop((target, source), None)
+        _clear_mappings(source)
+        _clear_mappings(target)
+
+
+def get_versification(version: Version | str = DEFAULT_VERSION) -> Versification:
+    """Return the versification of the given version, building it on first use.
+
+    :param version: A version of the Bible, or the name of a versification
+    :type version: Version | str
+    :return: The versification
+    :rtype: Versification
+    :raises ValueError: if the name is not the name of a registered versification
+    """
+    name: str = _get_name(version)
+    versification: Versification | None = _VERSIFICATIONS.get(name)
+
+    if versification is not None:
+        return versification
+
+    _validate_name(name)
+
+    with _LOCK:
+        versification = _VERSIFICATIONS.get(name)
+
+        if versification is None:
+            verse_counts: VerseCounts = _VERSE_COUNTS[name]
+            versification = Versification(
+                name,
+                verse_counts() if callable(verse_counts) else verse_counts,
+            )
+            _VERSIFICATIONS[name] = versification
+
+        return versification
+
+
+def get_versification_mapping(
+    source: Version | str,
+    target: Version | str,
+) -> VersificationMapping:
+    """Return the mapping between the versifications of two versions.
+
+    Mappings are built the first time they are used. Versifications that have no
+    registered mapping ranges map each verse to the verse with the same verse id.
+
+    :param source: The version (or name of the versification) of the verse ids
+    :type source: Version | str
+    :param target: The version (or name of the versification) to map them to
+    :type target: Version | str
+    :return: The mapping from the source to the target versification
+    :rtype: VersificationMapping
+    :raises ValueError: if a name is not the name of a registered versification
+    """
+    key: tuple[str, str] = (_get_name(source), _get_name(target))
+    mapping: VersificationMapping | None = _MAPPINGS.get(key)
+
+    if mapping is not None:
+        return mapping
+
+    with _LOCK:
+        mapping = _MAPPINGS.get(key)
+
+        if mapping is not None:
+            return mapping
+
+        source_versification: Versification = get_versification(key[0])
+        target_versification: Versification = get_versification(key[1])
+        inverse_key: tuple[str, str] = (key[1], key[0])
+
+        if inverse_key in _MAPPING_RANGES:
+            mapping = get_versification_mapping(*inverse_key).invert()
+        else:
+            mapping = VersificationMapping(
+                source_versification,
+                target_versification,
+                _build_target_ordinals(
+                    source_versification,
+                    target_versification,
+                    _MAPPING_RANGES.get(key, ()),
+                ),
+            )
+
+        _MAPPINGS[key] = mapping
+        return mapping
+
+
+def map_verse_ids(
+    verse_ids: Iterable[int],
+    source: Version | str,
+    target: Version | str,
+) -> list[int]:
+    """Return the verse ids of one version numbered as in another version.
+
+    Verses that have no counterpart in the target version are left out.
+
+    :param verse_ids: verse ids in the versification of the source version
+    :type verse_ids: Iterable[int]
+    :param source: The version (or name of the versification) of the verse ids
+    :type source: Version | str
+    :param target: The version (or name of the versification) to map them to
+    :type target: Version | str
+    :return: The verse ids in the versification of the target version
+    :rtype: list[int]
+    :raises InvalidVerseError: if a verse id is not a verse of the source version
+    :raises ValueError: if a name is not the name of a registered versification
+    """
+    return get_versification_mapping(source, target).map_verse_ids(verse_ids)
+
+
+def _get_name(version: Version | str) -> str:
+    if isinstance(version, Version):
+        return _VERSION_VERSIFICATIONS.get(version, STANDARD_VERSIFICATION)
+
+    return version
+
+
+def _validate_name(name: str) -> None:
+    if name not in _VERSE_COUNTS:
+        error_message = f"{name!r} is not a registered versification."
+        raise ValueError(error_message)
+
+
+def _clear_mappings(name: str) -> None:
+    for key in [key for key in _MAPPINGS if name in key]:
+        del _MAPPINGS[key]
+
+
+def _build_target_ordinals(
+    source: Versification,
+    target: Versification,
+    ranges: Iterable[VersificationRange],
+) -> array[int]:
+    # Verses that are not in any of the ranges keep their verse id, if it is a verse of
+    # the target and not the target of one of the ranges.
+    target_ordinals: array[int] = array("i", [NO_VERSE]) * len(source)
+
+    for ordinal, verse_id in enumerate(source.get_all_verse_ids()):
+        if verse_id in target:
+            target_ordinals[ordinal] = target.get_verse_ordinal(verse_id)
+
+    is_mapped: bytearray = bytearray(len(source))
+    is_target: bytearray = bytearray(len(target))
+
+    for start_verse_id, end_verse_id, target_verse_id in ranges:
+        start_ordinal: int = source.get_verse_ordinal(start_verse_id)
+        end_ordinal: int = source.get_verse_ordinal(end_verse_id)
+        target_start_ordinal: int = target.get_verse_ordinal(target_verse_id)
+        target_end_ordinal: int = target_start_ordinal + end_ordinal - start_ordinal
+
+        if end_ordinal < start_ordinal or target_end_ordinal >= len(target):
+            error_message = (
+                f"The verses {start_verse_id}-{end_verse_id} can't be mapped to "
+                f"{target_verse_id} in the {target.name} versification."
+            )
+            raise InvalidVerseError(error_message)
+
+        target_ordinals[start_ordinal : end_ordinal + 1] = array(
+            "i",
+            range(target_start_ordinal, target_end_ordinal + 1),
+        )
+        is_mapped[start_ordinal : end_ordinal + 1] = b"\x01" * (
+            end_ordinal - start_ordinal + 1
+        )
+        is_target[target_start_ordinal : target_end_ordinal + 1] = b"\x01" * (
+            target_end_ordinal - target_start_ordinal + 1
+        )
+
+    # A verse that keeps its verse id can't also map onto the target of a range.
+    for ordinal, target_ordinal in enumerate(target_ordinals):
+        if (
+            target_ordinal != NO_VERSE
+            and is_target[target_ordinal]
+            and not is_mapped[ordinal]
+        ):
+            target_ordinals[ordinal] = NO_VERSE
+
+    return target_ordinals
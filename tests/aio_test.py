@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pythonbible as bible
+import pythonbible.bible as bible_module
+from pythonbible import aio
+from pythonbible.bible.bible_cache import BibleCache
+from tests.conftest import build_bible
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def test_aget_bible_coalesces_concurrent_loads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Given a Bible that takes a while to load
+    loaded_bible = build_bible(version=bible.Version.MESSAGE)
+    load_count = 0
+    lock = threading.Lock()
+
+    def _slow_get_bible(version: bible.Version, bible_type: str) -> bible.Bible:
+        nonlocal load_count
+
+        with lock:
+            load_count += 1
+
+        time.sleep(0.05)
+        bible_module.BIBLES.add(version, bible_type, loaded_bible)
+        return loaded_bible
+
+    monkeypatch.setattr(bible_module, "BIBLES", BibleCache())
+    monkeypatch.setattr(bible_module, "get_bible", _slow_get_bible)
+
+    # When requesting the Bible several times concurrently
+    async def _get_bibles() -> list[bible.Bible]:
+        return await asyncio.gather(
+            *(aio.aget_bible(bible.Version.MESSAGE, "plain_text") for _ in range(5)),
+        )
+
+    bibles = asyncio.run(_get_bibles())
+
+    # Then the Bible is only loaded once and every request gets it
+    assert load_count == 1
+    assert all(version_bible is loaded_bible for version_bible in bibles)
+    assert not aio._PENDING_BIBLE_LOADS  # noqa: SLF001
+
+
+def test_aget_verse_text() -> None:
+    # Given a Bible that has been added for a version
+    version = bible.Version.MESSAGE
+    bible.add_bible(version, "plain_text_readers", build_bible(version=version))
+
+    try:
+        # When getting the text of a verse asynchronously
+        verse_text = asyncio.run(aio.aget_verse_text(1001001, version))
+
+        # Then the text of the verse is returned
+        assert verse_text == "In the beginning God created the heavens and the earth."
+    finally:
+        bible_module.BIBLES.pop(version, None)
+        bible.get_verse_text.cache_clear()
+
+
+def test_aget_verse_text_reads_in_the_executor(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Given a verse text function that records the thread it runs in
+    threads: list[int] = []
+
+    def get_verse_text(verse_id: int, version: bible.Version) -> str:  # noqa: ARG001
+        threads.append(threading.get_ident())
+        return ""
+
+    monkeypatch.setattr(aio, "get_verse_text", get_verse_text)
+
+    # When getting the text of a verse asynchronously
+    asyncio.run(aio.aget_verse_text(1001001))
+
+    # Then the text is read outside the event loop's thread
+    assert threads
+    assert threads[0] != threading.get_ident()
+
+
+def test_aformat_scripture_text() -> None:
+    # Given a Bible that has been added for a version
+    version = bible.Version.MESSAGE
+    bible.add_bible(version, "plain_text", build_bible(version=version))
+
+    try:
+        # When formatting scripture text asynchronously
+        text = asyncio.run(
+            aio.aformat_scripture_text([1001001], version=version, format_type="text"),
+        )
+
+        # Then the text is the same as the blocking version
+        assert text == bible.format_scripture_text(
+            [1001001],
+            version=version,
+            format_type="text",
+        )
+    finally:
+        bible_module.BIBLES.pop(version, None)
+
+
+def test_aget_references() -> None:
+    # Given a text with scripture references
+    text = "Genesis 1:1-3 and John 3:16"
+
+    # When searching for references asynchronously with each parser
+    references = asyncio.run(aio.aget_references(text))
+    state_machine_references = asyncio.run(
+        aio.aget_references(text, parser="state_machine"),
+    )
+
+    # Then the references are the same as the blocking version
+    assert references == bible.get_references(text)
+    assert state_machine_references == references
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+import pythonbible as bible
+from benchmarks import corpus
+from benchmarks.__main__ import main
+from benchmarks.runner import Benchmark
+from benchmarks.runner import BenchmarkResult
+from benchmarks.runner import compare_results
+from benchmarks.runner import find_missing_results
+from benchmarks.runner import load_results
+from benchmarks.runner import run_benchmarks
+from benchmarks.runner import save_results
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def test_generated_references_are_found() -> None:
+    # Given references generated from the books and their abbreviations
+    rng = random.Random(corpus.DEFAULT_SEED)
+    reference_texts = corpus.generate_references(rng, 500)
+
+    # When parsing each of them
+    # Then each one is found
+    for reference_text in reference_texts:
+        assert bible.get_references(reference_text), reference_text
+
+
+def test_corpus_is_reproducible() -> None:
+    # Given two corpora generated from the same seed
+    # When comparing them
+    # Then they are the same
+    assert corpus.generate_corpus(1, 2, 100) == corpus.generate_corpus(1, 2, 100)
+
+
+def test_save_and_load_results(tmp_path: Path) -> None:
+    # Given the results of a quick benchmark, filtered by name
+    benchmarks = [
+        Benchmark("sum", "example", lambda: sum(range(100)), 100),
+        Benchmark("max", "example", lambda: max(range(100)), 100),
+    ]
+    results = run_benchmarks(benchmarks, pattern="^sum$", repeat=2, min_time=0.001)
+
+    # When saving and loading them
+    path = save_results(results, tmp_path / "results.json")
+    loaded_results = load_results(path)
+
+    # Then the throughput of the benchmark that ran is loaded
+    assert list(loaded_results) == ["sum"]
+    assert loaded_results["sum"] == results[0].operations_per_second
+
+
+def test_compare_finds_regressions() -> None:
+    # Given a run where one benchmark is much slower than in the baseline
+    baseline = {"fast": 1_000.0, "slow": 1_000.0}
+    current = {"fast": 950.0, "slow": 500.0, "new": 10.0}
+
+    # When comparing the runs
+    comparisons = compare_results(baseline, current, threshold=0.1)
+
+    # Then only the slower benchmark is a regression
+    assert [comparison.name for comparison in comparisons] == ["fast", "slow"]
+    assert [comparison.is_regression for comparison in comparisons] == [False, True]
+    assert comparisons[1].change == -0.5
+
+
+def test_find_missing_results() -> None:
+    # Given a run that is missing one of the baseline's benchmarks and has a new one
+    baseline = {"kept": 1_000.0, "removed": 1_000.0}
+    current = {"kept": 1_000.0, "new": 10.0}
+
+    # When finding the missing benchmarks
+    # Then only the benchmark that is in the baseline but not the current run is found
+    assert find_missing_results(baseline, current) == ["removed"]
+
+
+def test_compare_command_fails_on_regression(tmp_path: Path) -> None:
+    # Given results files where a benchmark takes twice as long as in the baseline
+    baseline_path = save_results(
+        [BenchmarkResult("sum", "example", 100, 10, (0.001,))],
+        tmp_path / "baseline.json",
+    )
+    current_path = save_results(
+        [BenchmarkResult("sum", "example", 100, 10, (0.002,))],
+        tmp_path / "current.json",
+    )
+
+    # When comparing them
+    # Then the comparison fails, unless the threshold allows the drop
+    assert main(["compare", str(baseline_path), str(current_path)]) == 1
+    assert main(["compare", str(baseline_path), str(baseline_path)]) == 0
+    assert (
+        main(
+            [
+                "compare",
+                str(baseline_path),
+                str(current_path),
+                "--threshold",
+                "0.6",
+            ],
+        )
+        == 0
+    )
+
+
+def test_compare_command_fails_on_missing_benchmark(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # Given results files where a benchmark of the baseline is missing
+    baseline_path = save_results(
+        [
+            BenchmarkResult("sum", "example", 100, 10, (0.001,)),
+            BenchmarkResult("max", "example", 100, 10, (0.001,)),
+        ],
+        tmp_path / "baseline.json",
+    )
+    current_path = save_results(
+        [BenchmarkResult("sum", "example", 100, 10, (0.001,))],
+        tmp_path / "current.json",
+    )
+
+    # When comparing them
+    status = main(["compare", str(baseline_path), str(current_path)])
+
+    # Then the comparison fails and reports the missing benchmark
+    assert status == 1
+    output = capsys.readouterr()
+    assert "max" in output.out
+    assert "MISSING" in output.out
+    assert "1 benchmark(s) are missing" in output.err
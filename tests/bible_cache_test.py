@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import pythonbible as bible
+from pythonbible.bible.bible_cache import BibleCache
+from tests.conftest import build_bible
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_get_hit_and_miss() -> None:
+    # Given a cache with one Bible
+    cache = BibleCache()
+    version_bible = build_bible()
+    cache.add(bible.Version.AMERICAN_STANDARD, "html", version_bible)
+
+    # When getting that Bible and one that is not in the cache
+    hit = cache.lookup(bible.Version.AMERICAN_STANDARD, "html")
+    miss = cache.lookup(bible.Version.AMERICAN_STANDARD, "plain_text")
+
+    # Then the hit and miss are returned and counted
+    assert hit is version_bible
+    assert miss is None
+    assert cache.cache_info().hits == 1
+    assert cache.cache_info().misses == 1
+
+
+def test_least_recently_used_bible_is_evicted() -> None:
+    # Given a cache limited to two Bibles that holds two Bibles
+    cache = BibleCache(max_entries=2)
+    cache.add(bible.Version.AMERICAN_STANDARD, "html", build_bible())
+    cache.add(bible.Version.AMERICAN_STANDARD, "plain_text", build_bible())
+
+    # When the first Bible is used and then a third Bible is added
+    cache.lookup(bible.Version.AMERICAN_STANDARD, "html")
+    cache.add(bible.Version.KING_JAMES, "html", build_bible())
+
+    # Then the least recently used Bible is evicted
+    assert cache.lookup(bible.Version.AMERICAN_STANDARD, "plain_text") is None
+    assert cache.lookup(bible.Version.AMERICAN_STANDARD, "html") is not None
+    assert cache.lookup(bible.Version.KING_JAMES, "html") is not None
+    assert cache.cache_info().evictions == 1
+    assert cache.cache_info().entries == 2
+
+
+def test_evicted_bibles_can_still_be_used(
+    tmp_path: Path,
+) -> None:
+    # Given a cache limited to one Bible that holds a compiled Bible
+    cache = BibleCache(max_entries=1)
+    compiled_bible = bible.load_compiled_bible(
+        bible.compile_bible(build_bible(), tmp_path / "asv.pybible"),
+    )
+    cache.add(bible.Version.AMERICAN_STANDARD, "html", compiled_bible)
+
+    # When another Bible is added, evicting the compiled Bible
+    cache.add(bible.Version.KING_JAMES, "html", build_bible())
+
+    # Then the evicted Bible can still be used by the caller that holds it
+    assert cache.lookup(bible.Version.AMERICAN_STANDARD, "html") is None
+    assert compiled_bible.get_scripture(1001001) == build_bible().get_scripture(1001001)
+    compiled_bible.close()
+
+
+def test_mapping_interface() -> None:
+    # Given a cache used like the dictionary of Bibles by version it replaced
+    cache = BibleCache()
+    version_bible = build_bible()
+    cache[bible.Version.AMERICAN_STANDARD] = {"html": version_bible}
+
+    # When reading it by version
+    # Then the Bibles are returned keyed by Bible type
+    assert cache[bible.Version.AMERICAN_STANDARD] == {"html": version_bible}
+    assert cache.get(bible.Version.AMERICAN_STANDARD) == {"html": version_bible}
+    assert cache.get(bible.Version.KING_JAMES) is None
+    assert list(cache) == [bible.Version.AMERICAN_STANDARD]
+
+    del cache[bible.Version.AMERICAN_STANDARD]
+
+    with pytest.raises(KeyError):
+        cache[bible.Version.AMERICAN_STANDARD]
+
+
+def test_memory_size_budget() -> None:
+    # Given a cache with a memory budget that fits only one of the Bibles
+    small_bible = build_bible({1001001: "a" * 1_000})
+    cache = BibleCache(max_memory_size=small_bible.get_memory_size() * 3 // 2)
+    cache.add(bible.Version.AMERICAN_STANDARD, "html", small_bible)
+
+    # When another Bible of the same size is added
+    cache.add(bible.Version.KING_JAMES, "html", build_bible({1001001: "b" * 1_000}))
+
+    # Then the first Bible is evicted to stay within the budget
+    assert bible.Version.AMERICAN_STANDARD not in cache
+    assert bible.Version.KING_JAMES in cache
+    assert cache.cache_info().memory_size == small_bible.get_memory_size()
+
+
+def test_pinned_bibles_are_not_evicted() -> None:
+    # Given a cache limited to one Bible that holds a pinned Bible
+    cache = BibleCache(max_entries=1)
+    pinned_bible = build_bible()
+    cache.add(bible.Version.MESSAGE, "html", pinned_bible, pinned=True)
+
+    # When other Bibles are added
+    cache.add(bible.Version.AMERICAN_STANDARD, "html", build_bible())
+    cache.add(bible.Version.KING_JAMES, "html", build_bible())
+
+    # Then the pinned Bible is kept, and only the evictable Bibles are evicted
+    assert cache.lookup(bible.Version.MESSAGE, "html") is pinned_bible
+    assert cache.lookup(bible.Version.AMERICAN_STANDARD, "html") is None
+    assert cache.lookup(bible.Version.KING_JAMES, "html") is not None
+
+
+def test_configure_evicts_bibles() -> None:
+    # Given a cache without limits that holds three Bibles
+    cache = BibleCache()
+
+    for bible_type in ("html", "plain_text", "html_readers"):
+        cache.add(bible.Version.AMERICAN_STANDARD, bible_type, build_bible())
+
+    # When the cache is limited to one Bible
+    cache.configure(max_entries=1)
+
+    # Then only the most recently added Bible is kept
+    assert len(cache) == 1
+    assert cache.lookup(bible.Version.AMERICAN_STANDARD, "html_readers") is not None
+
+
+@pytest.mark.parametrize("default", [None, {}])
+def test_pop(
+    default: dict[str, bible.Bible] | None,
+) -> None:
+    # Given a cache with two Bibles for a version
+    cache = BibleCache()
+    cache.add(bible.Version.AMERICAN_STANDARD, "html", build_bible())
+    cache.add(bible.Version.AMERICAN_STANDARD, "plain_text", build_bible())
+
+    # When popping the version twice
+    removed = cache.pop(bible.Version.AMERICAN_STANDARD, default)
+    removed_again = cache.pop(bible.Version.AMERICAN_STANDARD, default)
+
+    # Then both Bibles are removed the first time and the default is returned after
+    assert removed is not None
+    assert set(removed) == {"html", "plain_text"}
+    assert removed_again is default
+    assert len(cache) == 0
+
+
+def test_get_bible_cache_info() -> None:
+    # Given a Bible added with add_bible
+    version = bible.Version.MESSAGE
+    bible.add_bible(version, "cache-test", build_bible())
+    hits = bible.get_bible_cache_info().hits
+
+    try:
+        # When getting that Bible
+        bible.get_bible(version, "cache-test")
+
+        # Then the cache hit is counted
+        assert bible.get_bible_cache_info().hits == hits + 1
+    finally:
+        bible.bible.BIBLES.pop(version, None)
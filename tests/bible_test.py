@@ -67,7 +67,6 @@ def test_get_bible_bad_type() -> None:
         bible.get_bible(bible.Version.AMERICAN_STANDARD, "bad_type")
 
 
-@pytest.mark.xfail(reason=BIBLE_DEACTIVATED_MSG, strict=True)
 def test_add_bible() -> None:
     # Given a Bible instance
     version = bible.Version.MESSAGE
@@ -162,3 +161,38 @@ def test_get_bible_with_missing_version_files_raises_missing_verse_file_error()
     # MissingVerseFileError
     with pytest.raises(pythonbible.errors.MissingVerseFileError):
         bible.get_bible(DummyVersion, "plain_text")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "  plain text verse \n",
+        "\u00a0 non-breaking spaces\u2003",
+        "</p>\n<p><sup>1</sup> paragraph</p>\n<p>",
+        "<sup>1</sup> unbalanced “quotes”",
+        "</p><p>",
+        "   ",
+    ],
+)
+@pytest.mark.parametrize("is_html", [True, False])
+def test_iter_scripture_bytes_matches_get_scripture(
+    content: str,
+    is_html: bool,  # noqa: FBT001
+) -> None:
+    # Given a Bible with one verse
+    bible_instance = bible.Bible(
+        bible.Version.MESSAGE,
+        content,
+        {1001001: 0},
+        {1001001: len(content)},
+        {bible.Book.GENESIS: {1: 1}},
+        {},
+        {},
+        is_html=is_html,
+    )
+
+    # When getting the scripture for the verse as bytes
+    chunks = bible_instance.iter_scripture_bytes(1001001)
+
+    # Then the bytes are the encoded scripture text
+    assert b"".join(chunks) == bible_instance.get_scripture(1001001).encode("utf-8")
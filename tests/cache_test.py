@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import pythonbible as bible
+from pythonbible import formatter
+from pythonbible import verses
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def number_of_verses_cache() -> Iterator[None]:
+    yield
+    bible.configure_cache("verses.get_number_of_verses", 128)
+
+
+def test_get_cache_info_lists_every_cache() -> None:
+    # Given a call that uses one of the caches
+    bible.clear_caches(["verses.get_verse_id"])
+    bible.get_verse_id(bible.Book.JOHN, 3, 16)
+    bible.get_verse_id(bible.Book.JOHN, 3, 16)
+
+    # When getting the cache statistics
+    cache_info = bible.get_cache_info()
+
+    # Then every cache is listed with its hits, misses, and sizes
+    assert "formatter.get_verse_text" in cache_info
+    assert "bible.clean_html" in cache_info
+    assert cache_info["verses.get_verse_id"] == bible.CacheInfo(1, 1, 128, 1)
+    assert cache_info["verses.get_verse_id"].hit_ratio == 0.5
+
+
+@pytest.mark.usefixtures("number_of_verses_cache")
+def test_configure_cache_replaces_the_cache_everywhere() -> None:
+    # Given a cache with the default size
+    # When setting its maximum size
+    bible.configure_cache("verses.get_number_of_verses", 4)
+
+    # Then every module uses the resized cache
+    assert bible.get_cache_info()["verses.get_number_of_verses"].maxsize == 4
+    assert bible.get_number_of_verses is verses.get_number_of_verses
+    assert formatter.get_number_of_verses is verses.get_number_of_verses
+    assert bible.get_number_of_verses(bible.Book.JOHN, 3) == 36
+
+
+@pytest.mark.usefixtures("number_of_verses_cache")
+def test_warm_caches_fills_up_to_the_maximum_size() -> None:
+    # Given an empty cache with room for fewer results than it can be warmed with
+    bible.configure_cache("verses.get_number_of_verses", 10)
+
+    # When warming it
+    bible.warm_caches(["verses.get_number_of_verses"])
+
+    # Then it is filled without evicting any results
+    cache_info = bible.get_cache_info()["verses.get_number_of_verses"]
+    assert cache_info.currsize == 10
+    assert cache_info.misses == 10
+
+
+def test_clear_caches() -> None:
+    # Given caches that have been warmed
+    bible.warm_caches()
+
+    # When clearing them
+    bible.clear_caches()
+
+    # Then they are empty
+    assert all(
+        cache_info.currsize == 0 for cache_info in bible.get_cache_info().values()
+    )
+
+
+def test_unknown_cache_name() -> None:
+    # Given a name that is not one of the caches
+    # When configuring it
+    # Then a ValueError is raised
+    with pytest.raises(ValueError, match="not one of the pythonbible caches"):
+        bible.configure_cache("verses.unknown", 10)
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+import pytest
+
+import pythonbible as bible
+import pythonbible.bible as bible_module
+from pythonbible.bible.bible_cache import BibleCache
+from tests.conftest import build_bible
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+HTML_VERSES: dict[int, str] = {
+    1001001: "<sup>1</sup> In the beginning God created the heavens and the earth.",
+    1001002: (
+        "<sup>2</sup> And the earth was waste and void; “darkness” was upon the face "
+        "of the deep."
+    ),
+    1001003: "<sup>3</sup> And God said, Let there be light: and there was light.",
+    1002001: "<sup>1</sup> Thus the heavens and the earth were finished—all of them.",
+}
+
+
+@pytest.fixture
+def html_bible() -> bible.Bible:
+    return build_bible(
+        HTML_VERSES,
+        is_html=True,
+        short_titles={bible.Book.GENESIS: "Genesis"},
+        long_titles={bible.Book.GENESIS: "The First Book of Moses, called Genesis"},
+    )
+
+
+@pytest.fixture
+def compiled_bible(
+    html_bible: bible.Bible,
+    tmp_path: Path,
+) -> Iterator[bible.CompiledBible]:
+    compiled = bible.load_compiled_bible(
+        bible.compile_bible(html_bible, tmp_path / "html.pybible"),
+    )
+    yield compiled
+    compiled.close()
+
+
+@pytest.mark.parametrize(
+    ("start_verse_id", "end_verse_id"),
+    [
+        (1001001, None),
+        (1001002, 1001002),
+        (1001001, 1001003),
+        (1001003, 1002001),
+        (1001001, 1002001),
+    ],
+)
+def test_compiled_bible_get_scripture(
+    html_bible: bible.Bible,
+    compiled_bible: bible.CompiledBible,
+    start_verse_id: int,
+    end_verse_id: int | None,
+) -> None:
+    # Given a Bible and the compiled version of that Bible
+    # When getting scripture from both
+    # Then the compiled Bible returns the same text
+    assert compiled_bible.get_scripture(
+        start_verse_id,
+        end_verse_id,
+    ) == html_bible.get_scripture(start_verse_id, end_verse_id)
+
+
+def test_compiled_bible_metadata(
+    html_bible: bible.Bible,
+    compiled_bible: bible.CompiledBible,
+) -> None:
+    # Given a Bible and the compiled version of that Bible
+    # When comparing their attributes
+    # Then the compiled Bible has the same metadata and (lazily built) indices
+    assert compiled_bible.version == html_bible.version
+    assert compiled_bible.is_html is True
+    assert compiled_bible.max_verses == html_bible.max_verses
+    assert compiled_bible.short_titles == html_bible.short_titles
+    assert compiled_bible.long_titles == html_bible.long_titles
+    assert compiled_bible.scripture_content == html_bible.scripture_content
+    assert compiled_bible.verse_start_indices == html_bible.verse_start_indices
+    assert compiled_bible.verse_end_indices == html_bible.verse_end_indices
+
+
+def test_compiled_bible_missing_verse(compiled_bible: bible.CompiledBible) -> None:
+    # Given a compiled Bible that does not include Genesis 2:2
+    # When getting the scripture for that verse
+    # Then a VersionMissingVerseError is raised
+    with pytest.raises(bible.VersionMissingVerseError):
+        compiled_bible.get_scripture(1002002)
+
+
+def test_compiled_bible_invalid_verse(compiled_bible: bible.CompiledBible) -> None:
+    # Given a compiled Bible
+    # When getting the scripture for an invalid verse id
+    # Then an InvalidVerseError is raised
+    with pytest.raises(bible.InvalidVerseError):
+        compiled_bible.get_scripture(1001001, 99999999)
+
+
+@pytest.mark.parametrize(
+    "file_content",
+    [b"", b"\x00", b"not a compiled bible file at all, just some text"],
+)
+def test_load_compiled_bible_invalid_file(tmp_path: Path, file_content: bytes) -> None:
+    # Given a file that is not a compiled Bible file
+    path = tmp_path / "invalid.pybible"
+    path.write_bytes(file_content)
+
+    # When loading the file
+    # Then an InvalidCompiledBibleError is raised
+    with pytest.raises(bible.InvalidCompiledBibleError):
+        bible.load_compiled_bible(path)
+
+
+def test_load_compiled_bible_invalid_metadata(
+    html_bible: bible.Bible,
+    tmp_path: Path,
+) -> None:
+    # Given a compiled Bible file whose metadata is missing the version
+    path = bible.compile_bible(html_bible, tmp_path / "invalid_metadata.pybible")
+    path.write_bytes(path.read_bytes().replace(b'"version"', b'"versiom"', 1))
+
+    # When loading the file
+    # Then an InvalidCompiledBibleError is raised
+    with pytest.raises(bible.InvalidCompiledBibleError, match="invalid metadata"):
+        bible.load_compiled_bible(path)
+
+
+def test_load_compiled_bible_truncated_file(
+    html_bible: bible.Bible,
+    tmp_path: Path,
+) -> None:
+    # Given a compiled Bible file that has been truncated
+    path = bible.compile_bible(html_bible, tmp_path / "truncated.pybible")
+    path.write_bytes(path.read_bytes()[:-10])
+
+    # When loading the file
+    # Then an InvalidCompiledBibleError is raised
+    with pytest.raises(bible.InvalidCompiledBibleError):
+        bible.load_compiled_bible(path)
+
+
+def test_get_bible_loads_installed_compiled_bible(
+    html_bible: bible.Bible,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Given a compiled Bible file installed for a version that is not loaded
+    version = bible.Version.AMERICAN_STANDARD
+    (tmp_path / version.value.lower()).mkdir()
+    monkeypatch.setattr(bible_module, "CURRENT_FOLDER", tmp_path)
+    monkeypatch.setattr(bible_module, "BIBLES", BibleCache())
+    bible.compile_bible(html_bible, bible_module.get_compiled_bible_path(version, "x"))
+
+    # When getting the Bible for that version and type
+    compiled = bible.get_bible(version, "x")
+
+    # Then the compiled Bible is loaded and registered
+    assert isinstance(compiled, bible.CompiledBible)
+    assert bible.get_bible(version, "x") is compiled
+    assert compiled.get_scripture(1001001) == html_bible.get_scripture(1001001)
+    compiled.close()
+
+
+@pytest.mark.parametrize(
+    ("start_verse_id", "end_verse_id"),
+    [(1001001, None), (1001002, 1001003), (1001003, 1002001)],
+)
+def test_iter_scripture_bytes(
+    html_bible: bible.Bible,
+    compiled_bible: bible.CompiledBible,
+    start_verse_id: int,
+    end_verse_id: int | None,
+) -> None:
+    # Given a Bible and the compiled version of that Bible
+    expected = html_bible.get_scripture(start_verse_id, end_verse_id).encode("utf-8")
+
+    # When getting the scripture content as bytes from both
+    # Then both match the encoded scripture text
+    for version_bible in (html_bible, compiled_bible):
+        chunks = version_bible.iter_scripture_bytes(start_verse_id, end_verse_id)
+        assert b"".join(chunks) == expected
+
+
+def test_get_scripture_offsets_are_views_of_the_content(
+    compiled_bible: bible.CompiledBible,
+) -> None:
+    # Given a compiled Bible
+    # When getting the offsets of a range of verses
+    start, end = compiled_bible.get_scripture_offsets(1001002, 1001003)
+
+    # Then the offsets slice the verses out of the content buffer without copying
+    view = compiled_bible.content_buffer[start:end]
+    assert isinstance(view, memoryview)
+    assert str(view, "utf-8").startswith("<p><sup>2</sup>")
+    assert str(view, "utf-8").endswith("there was light.</p>")
+    view.release()
+
+
+def test_write_scripture(
+    html_bible: bible.Bible,
+    compiled_bible: bible.CompiledBible,
+) -> None:
+    # Given a Bible, the compiled version of that Bible, and binary streams
+    html_stream = io.BytesIO()
+    compiled_stream = io.BytesIO()
+
+    # When writing a range of verses to the streams
+    number_of_bytes = compiled_bible.write_scripture(compiled_stream, 1001001, 1002001)
+    html_bible.write_scripture(html_stream, 1001001, 1002001)
+
+    # Then the streams contain the encoded scripture text
+    expected = html_bible.get_scripture(1001001, 1002001).encode("utf-8")
+    assert compiled_stream.getvalue() == expected
+    assert html_stream.getvalue() == expected
+    assert number_of_bytes == len(expected)
@@ -1,11 +1,59 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
 import pythonbible as bible
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 BIBLE_DEACTIVATED_MSG = "The .bible module has been deactivated."
 
+GENESIS_1_1 = "In the beginning God created the heavens and the earth."
+
+
+def build_bible(
+    verses: Mapping[int, str] | None = None,
+    version: bible.Version = bible.Version.AMERICAN_STANDARD,
+    *,
+    is_html: bool = False,
+    short_titles: dict[bible.Book, str] | None = None,
+    long_titles: dict[bible.Book, str] | None = None,
+) -> bible.Bible:
+    # Builds a Bible from the text of each verse by verse id, in canonical order (by
+    # default, only Genesis 1:1). HTML verses are wrapped in a paragraph tag, and plain
+    # text verses are separated by a space. The maximum verse of each chapter is the
+    # last verse given for that chapter.
+    separator: str = "" if is_html else " "
+    pieces: list[str] = []
+    length: int = 0
+    verse_start_indices: dict[int, int] = {}
+    verse_end_indices: dict[int, int] = {}
+    max_verses: dict[bible.Book, dict[int, int]] = {}
+
+    for verse_id, verse_text in (verses or {1001001: GENESIS_1_1}).items():
+        text: str = f"<p>{verse_text}</p>" if is_html else verse_text
+        verse_start_indices[verse_id] = length
+        verse_end_indices[verse_id] = length + len(text)
+        pieces.append(text)
+        length += len(text) + len(separator)
+
+        book, chapter, verse = bible.get_book_chapter_verse(verse_id)
+        max_verses.setdefault(book, {})[chapter] = verse
+
+    return bible.Bible(
+        version,
+        separator.join(pieces),
+        verse_start_indices,
+        verse_end_indices,
+        max_verses,
+        short_titles or {},
+        long_titles or {},
+        is_html=is_html,
+    )
+
 
 @pytest.fixture
 def verse_id() -> int:
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pythonbible as bible
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 def test_count_books_single_book() -> None:
     # Given a list of references
@@ -131,6 +136,41 @@ def test_count_chapters_multiple_references() -> None:
     assert number_of_chapters == 50 + 28 + 16 + 24 + 21 + 28  # 167 total
 
 
+def test_count_chapters_whole_bible() -> None:
+    # Given a reference that spans every book of the Bible
+    reference = bible.NormalizedReference(
+        bible.Book.GENESIS,
+        end_book=list(bible.Book)[-1],
+    )
+
+    # When we get the count of chapters in the reference
+    number_of_chapters: int = bible.count_chapters([reference])
+
+    # Then the count is the sum of the chapters of every book
+    assert number_of_chapters == sum(
+        bible.get_number_of_chapters(book) for book in bible.Book
+    )
+
+
+def test_count_chapters_and_verses_batch() -> None:
+    # Given a large batch of references, streamed from a generator
+    references: list[bible.NormalizedReference] = bible.get_references(
+        "Genesis 50:1 - Exodus 2:3, Romans 8:28, Psalms",
+    )
+
+    def _generate_references() -> Iterator[bible.NormalizedReference]:
+        for _ in range(10_000):
+            yield from references
+
+    # When we count the chapters and verses in the batch
+    number_of_chapters: int = bible.count_chapters(_generate_references())
+    number_of_verses: int = bible.count_verses(_generate_references())
+
+    # Then the counts are the counts of the references times the size of the batch
+    assert number_of_chapters == bible.count_chapters(references) * 10_000
+    assert number_of_verses == bible.count_verses(references) * 10_000
+
+
 def test_count_chapters_string() -> None:
     # Given a string containing one or more Scripture references
     reference: str = "Genesis, Matthew - Acts"
@@ -201,6 +241,17 @@ def test_count_verses_multiple_references() -> None:
     assert number_of_verses == 1 + 1 + (3 + 1)
 
 
+def test_count_verses_invalid_verse() -> None:
+    # Given a reference that ends past the last verse of its chapter
+    reference = bible.NormalizedReference(bible.Book.GENESIS, 1, 1, 1, 40)
+
+    # When we get the count of verses in the reference
+    number_of_verses: int = bible.count_verses(reference)  # type: ignore[arg-type]
+
+    # Then the verses are counted from the verse numbers
+    assert number_of_verses == 40
+
+
 def test_count_verses_string() -> None:
     # Given a string containing one or more Scripture references
     reference: str = "Genesis 1:1; John 3:16; Romans 15:5-7,13"
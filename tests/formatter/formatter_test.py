@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import time
 
 import pytest
@@ -21,6 +22,17 @@ def test_format_scripture_references(
     assert reference == formatted_reference
 
 
+def test_format_scripture_references_overlapping() -> None:
+    # Given a list of normalized references that overlap each other
+    references = bible.get_references("Genesis 1:5-10, Genesis 1:1-6, Exodus 2")
+
+    # When we format them into a reference string
+    reference: str = bible.format_scripture_references(references)
+
+    # Then the overlapping references are merged.
+    assert reference == "Genesis 1:1-10;Exodus 2:1-25"
+
+
 def test_format_scripture_references_null() -> None:
     # Given a null references object
     # When we attempt to format it into a reference string
@@ -326,3 +338,101 @@ def test_multi_chapter_book_reference_contains_whole_book() -> None:
 
     # Then the resulting reference string does not include chapter and verse numbers
     assert reference_string == "Genesis"
+
+
+@pytest.mark.parametrize("format_type", ["html", "text"])
+def test_write_scripture_bytes(format_type: str) -> None:
+    # Given a Bible for a version in both formats
+    version = bible.Version.MESSAGE
+    content = "<p><sup>1</sup> In the beginning…</p><p><sup>2</sup> Waste and void.</p>"
+
+    for bible_type in ("html", "plain_text"):
+        bible.add_bible(
+            version,
+            bible_type,
+            bible.Bible(
+                version,
+                content,
+                {1001001: 0, 1001002: 36, 2001001: 36},
+                {1001001: 36, 1001002: len(content), 2001001: len(content)},
+                {bible.Book.GENESIS: {1: 2}, bible.Book.EXODUS: {1: 1}},
+                {},
+                {},
+                is_html=bible_type == "html",
+            ),
+        )
+
+    try:
+        # When writing the scripture text for verses in two books to a binary stream
+        verse_ids = [2001001, 1001001, 1001002]
+        stream = io.BytesIO()
+        number_of_bytes = bible.write_scripture_bytes(
+            verse_ids,
+            stream,
+            version=version,
+            format_type=format_type,
+        )
+
+        # Then the stream has the encoded formatted scripture text
+        expected = bible.format_scripture_text(
+            verse_ids,
+            version=version,
+            format_type=format_type,
+        ).encode("utf-8")
+        assert stream.getvalue() == expected
+        assert number_of_bytes == len(expected)
+    finally:
+        pythonbible.bible.BIBLES.pop(version, None)
+
+
+def test_iter_and_write_scripture_text() -> None:
+    # Given a Bible with verses in two books
+    version = bible.Version.MESSAGE
+    content = "Genesis one one. Genesis one two. Exodus one one."
+    bible.add_bible(
+        version,
+        "plain_text",
+        bible.Bible(
+            version,
+            content,
+            {1001001: 0, 1001002: 16, 2001001: 33},
+            {1001001: 16, 1001002: 33, 2001001: len(content)},
+            {bible.Book.GENESIS: {1: 2}, bible.Book.EXODUS: {1: 1}},
+            {},
+            {},
+        ),
+    )
+
+    try:
+        # When iterating over and writing the formatted scripture text
+        verse_ids = (2001001, 1001002, 1001001)
+        chunks = list(
+            bible.iter_scripture_text(verse_ids, version=version, format_type="text"),
+        )
+        stream = io.StringIO()
+        number_of_characters = bible.write_scripture_text(
+            iter(verse_ids),
+            stream,
+            version=version,
+            format_type="text",
+        )
+
+        # Then the titles, chapters, and paragraphs are separate chunks in order,
+        # and the written text matches format_scripture_text
+        assert chunks == [
+            "Genesis\n\n",
+            "Chapter 1\n\n",
+            "Genesis one one. Genesis one two.\n",
+            "\n\nExodus\n\n",
+            "Chapter 1\n\n",
+            "Exodus one one.\n",
+        ]
+        expected = bible.format_scripture_text(
+            list(verse_ids),
+            version=version,
+            format_type="text",
+        )
+        assert stream.getvalue() == expected == "".join(chunks)
+        assert number_of_characters == len(expected)
+    finally:
+        pythonbible.bible.BIBLES.pop(version, None)
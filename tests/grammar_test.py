@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pickle
+
+import pythonbible as bible
+from pythonbible.grammar import get_reference_grammar
+
+
+def test_get_reference_grammar_is_memoized() -> None:
+    # Given two equal custom book group dictionaries
+    book_groups = {"Torah": [bible.Book.GENESIS, bible.Book.EXODUS]}
+    equal_book_groups = {"Torah": (bible.Book.GENESIS, bible.Book.EXODUS)}
+
+    # When getting the reference grammar for each of them
+    grammar = get_reference_grammar(book_groups)
+    equal_grammar = get_reference_grammar(equal_book_groups)
+
+    # Then the grammar is only compiled once
+    assert grammar is equal_grammar
+    assert grammar.book_group_regular_expression is not None
+
+
+def test_get_reference_grammar_version() -> None:
+    # Given the default grammar and grammars with book groups
+    grammar = get_reference_grammar()
+    book_group_grammar = get_reference_grammar(bible.BOOK_GROUPS)
+    other_book_group_grammar = get_reference_grammar({"Torah": [bible.Book.GENESIS]})
+
+    # When comparing their versions
+    # Then each distinct grammar has its own version, and the grammar without book
+    # groups doesn't search for book groups
+    versions = {
+        grammar.version,
+        book_group_grammar.version,
+        other_book_group_grammar.version,
+    }
+    assert len(versions) == 3
+    assert grammar.book_group_regular_expression is None
+    assert grammar.reference_regular_expression is (
+        book_group_grammar.reference_regular_expression
+    )
+
+
+def test_get_reference_grammar_for_changed_default_book_groups() -> None:
+    # Given the default book groups and a copy with one more book group
+    book_groups = {**bible.BOOK_GROUPS, "Torah": (bible.Book.GENESIS,)}
+
+    # When getting the reference grammar for each of them
+    grammar = get_reference_grammar(bible.BOOK_GROUPS)
+    changed_grammar = get_reference_grammar(book_groups)
+
+    # Then the changed book groups get their own grammar
+    assert grammar is get_reference_grammar(dict(bible.BOOK_GROUPS))
+    assert changed_grammar.version != grammar.version
+    assert changed_grammar.get_book_group_books("Torah") == (bible.Book.GENESIS,)
+
+
+def test_get_book_group_books() -> None:
+    # Given the grammar for the default book groups
+    grammar = get_reference_grammar(bible.BOOK_GROUPS)
+
+    # When getting the books of book group mentions
+    # Then the books of the first matching book group are returned
+    gospels = bible.BookGroup.NEW_TESTAMENT_GOSPELS.books
+    assert grammar.get_book_group_books("Gospels") == gospels
+    assert grammar.get_book_group_books("not a book group") == ()
+
+
+def test_reference_grammar_can_be_pickled() -> None:
+    # Given a reference grammar
+    grammar = get_reference_grammar(bible.BOOK_GROUPS)
+
+    # When pickling and unpickling it
+    unpickled_grammar = pickle.loads(pickle.dumps(grammar))  # noqa: S301
+
+    # Then it is equal to the original grammar
+    assert unpickled_grammar == grammar
+
+
+def test_get_references_with_custom_book_groups() -> None:
+    # Given a text that mentions a custom book group
+    text = "Read the Torah."
+    book_groups = {"Torah": list(bible.BookGroup.OLD_TESTAMENT_LAW.books)}
+
+    # When searching for references with the custom book groups
+    references = bible.get_references(text, book_groups)
+
+    # Then the books of the book group are returned as one reference
+    assert references == [
+        bible.NormalizedReference(
+            bible.Book.GENESIS,
+            1,
+            1,
+            34,
+            12,
+            bible.Book.DEUTERONOMY,
+        ),
+    ]
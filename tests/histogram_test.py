@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+import pythonbible as bible
+
+
+def test_verse_histogram_counts_references() -> None:
+    # Given overlapping references
+    references = bible.get_references("John 3:16-18, John 3:17, Romans 8:28")
+
+    # When counting them in a histogram
+    histogram = bible.VerseHistogram(references)
+
+    # Then each verse is counted once for each reference that includes it
+    assert histogram.get_count(43003016) == 1
+    assert histogram.get_count(43003017) == 2
+    assert histogram.get_count(43003019) == 0
+    assert histogram.get_count(45008028) == 1
+    assert sum(histogram.counts) == bible.count_verses(references)
+
+
+def test_verse_histogram_most_common() -> None:
+    # Given a histogram of references
+    histogram = bible.VerseHistogram()
+    histogram.add(bible.get_references("Genesis 1:1-3"), count=2)
+    histogram.add(bible.get_references("Genesis 1:2, Genesis 1:3"))
+    histogram.add(bible.get_references("Genesis 1:3"))
+
+    # When getting the most common verses
+    top_verses = histogram.most_common(2)
+
+    # Then the verses with the highest counts are returned, most common first
+    assert top_verses == [(1001003, 4), (1001002, 3)]
+    assert histogram.most_common() == [(1001003, 4), (1001002, 3), (1001001, 2)]
+
+
+def test_verse_histogram_merge() -> None:
+    # Given histograms built separately (e.g. by different workers)
+    first = bible.VerseHistogram(bible.get_references("Psalm 23"))
+    second = pickle.loads(  # noqa: S301
+        pickle.dumps(bible.VerseHistogram(bible.get_references("Psalm 23:1"))),
+    )
+
+    # When merging them
+    merged = first + second
+    first += second
+
+    # Then the counts are combined
+    assert merged == first
+    assert merged.get_count(19023001) == 2
+    assert merged.get_count(19023002) == 1
+
+
+def test_verse_histogram_rollups() -> None:
+    # Given a histogram of references in several books and chapters
+    histogram = bible.VerseHistogram(
+        bible.get_references("Genesis 1:1-3, Genesis 2:1, Matthew 1:1, Revelation"),
+    )
+
+    # When rolling the counts up by book, chapter, and book group
+    book_counts = histogram.get_book_counts()
+    chapter_counts = histogram.get_chapter_counts(bible.Book.GENESIS)
+    book_group_counts = histogram.get_book_group_counts(
+        [bible.BookGroup.OLD_TESTAMENT, bible.BookGroup.NEW_TESTAMENT_GOSPELS],
+    )
+
+    # Then the verse counts are totaled for each of them
+    revelation_verses = bible.count_verses(bible.get_references("Revelation"))
+    assert book_counts == {
+        bible.Book.GENESIS: 4,
+        bible.Book.MATTHEW: 1,
+        bible.Book.REVELATION: revelation_verses,
+    }
+    assert chapter_counts == {(bible.Book.GENESIS, 1): 3, (bible.Book.GENESIS, 2): 1}
+    assert book_group_counts == {
+        bible.BookGroup.OLD_TESTAMENT: 4,
+        bible.BookGroup.NEW_TESTAMENT_GOSPELS: 1,
+    }
+
+
+def test_verse_histogram_invalid_verse() -> None:
+    # Given an empty histogram
+    histogram = bible.VerseHistogram()
+
+    # When getting the count of an invalid verse
+    # Then an InvalidVerseError is raised
+    with pytest.raises(bible.InvalidVerseError):
+        histogram.get_count(1001099)
+
+
+@pytest.mark.parametrize(
+    "interval",
+    [(-1, -1), (0, len(bible.verses.VERSE_IDS)), (10, 9)],
+)
+def test_verse_histogram_invalid_interval(interval: tuple[int, int]) -> None:
+    # Given an empty histogram
+    histogram = bible.VerseHistogram()
+
+    # When adding an out of range or reversed interval
+    # Then an InvalidVerseError is raised and no verse is counted
+    with pytest.raises(bible.InvalidVerseError, match="is not a valid verse interval"):
+        histogram.add_interval(interval)
+
+    with pytest.raises(bible.InvalidVerseError, match="is not a valid verse interval"):
+        histogram.add_intervals([interval])
+
+    assert histogram == bible.VerseHistogram()
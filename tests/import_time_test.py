@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from pythonbible import regular_expressions
+from pythonbible import verses
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+
+def test_import_does_not_build_lazy_tables() -> None:
+    # Given a fresh Python process
+    code = """
+import sys
+
+import pythonbible
+from pythonbible import regular_expressions
+from pythonbible import verses
+
+print(getattr(verses, "__generate_verse_ids").cache_info().currsize)
+regex = regular_expressions.get_scripture_reference_regular_expression
+print(regex.cache_info().currsize)
+print("concurrent.futures.process" in sys.modules)
+"""
+
+    # When importing pythonbible
+    result = _run_python(code)
+
+    # Then the verse ids and the scripture reference regular expression are not built
+    # and the process pool machinery is not imported
+    assert result.stdout.split() == ["0", "0", "False"]
+
+
+def test_lazy_tables_are_available_as_module_attributes() -> None:
+    # Given the lazily built module attributes
+    # When accessing them
+    # Then they are the same objects returned by their accessor functions
+    assert verses.VERSE_IDS is verses.get_all_verse_ids()
+    assert (
+        regular_expressions.SCRIPTURE_REFERENCE_REGULAR_EXPRESSION
+        is regular_expressions.get_scripture_reference_regular_expression()
+    )
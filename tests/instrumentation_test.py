@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pytest
+
+import pythonbible as bible
+from pythonbible import reference_normalizer
+from pythonbible.instrumentation import INSTRUMENTATION
+
+
+def test_instrumentation_is_disabled_by_default() -> None:
+    # Given instrumentation that has not been enabled
+    # When parsing a text
+    bible.get_references("John 3:16")
+
+    # Then nothing is instrumented or recorded
+    assert not INSTRUMENTATION.enabled
+    assert not hasattr(reference_normalizer.normalize_reference_text, "__wrapped__")
+
+
+def test_instrument_records_each_stage() -> None:
+    # Given a text with a roman numeral, references, and a book group
+    text = "Psalm cxix 105, John 3:16, and the Gospels"
+
+    # When parsing and formatting it while instrumented
+    with bible.instrument():
+        references = bible.get_references(text, bible.BOOK_GROUPS)
+        bible.format_scripture_references(references)
+
+    # Then each stage that ran is recorded, with nested stages excluded from self time
+    statistics = bible.get_instrumentation_statistics()
+    assert statistics["parser.get_references"].calls == 1
+    assert statistics["parser.convert_roman_numerals"].calls == 1
+    assert statistics["parser.normalize_reference"].calls == 2
+    assert statistics["parser.book_groups"].calls == 1
+    assert statistics["formatter.format_scripture_references"].calls == 1
+    assert (
+        statistics["parser.get_references"].self_time
+        < statistics["parser.get_references"].total_time
+    )
+
+
+def test_instrument_restores_the_original_functions() -> None:
+    # Given the original functions of some stages
+    normalize_reference = reference_normalizer.normalize_reference_text
+    convert = bible.convert_references_to_verse_ids
+
+    # When instrumenting only the converter stage and then leaving the with block
+    with bible.instrument(["converter.references_to_verse_ids"]):
+        assert bible.convert_references_to_verse_ids is not convert
+        assert reference_normalizer.normalize_reference_text is normalize_reference
+
+    # Then the original functions are put back
+    assert bible.convert_references_to_verse_ids is convert
+    assert not INSTRUMENTATION.enabled
+
+
+def test_hooks_are_called_for_each_call() -> None:
+    # Given a hook that collects the stages it is called with
+    stages: list[str] = []
+
+    def hook(stage: str, elapsed: float, allocated_blocks: int) -> None:  # noqa: ARG001
+        stages.append(stage)
+
+    INSTRUMENTATION.add_hook(hook)
+
+    # When normalizing a reference while instrumented
+    try:
+        with bible.instrument(["parser.normalize_reference"]):
+            bible.normalize_reference("Romans 8:28")
+    finally:
+        INSTRUMENTATION.remove_hook(hook)
+
+    # Then the hook is called once for the instrumented stage
+    assert stages == ["parser.normalize_reference"]
+
+
+def test_enable_rejects_unknown_stages() -> None:
+    # Given an unknown stage name
+    # When enabling instrumentation for it
+    # Then a ValueError is raised and nothing is instrumented
+    with pytest.raises(ValueError, match="not an instrumentation stage"):
+        bible.enable_instrumentation(["parser.unknown"])
+
+    assert not INSTRUMENTATION.enabled
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import pytest
+
+import pythonbible as bible
+from pythonbible import intervals
+
+
+def _get_intervals(text: str) -> list[tuple[int, int]]:
+    return intervals.convert_references_to_intervals(bible.get_references(text))
+
+
+def test_convert_reference_to_interval() -> None:
+    # Given a reference that covers an entire book
+    reference = bible.NormalizedReference(bible.Book.GENESIS)
+
+    # When converting it to an interval
+    interval = intervals.convert_reference_to_interval(reference)
+
+    # Then the interval covers the ordinals of all of the verses in the book
+    assert interval == (0, bible.get_verse_ordinal(1050026))
+
+
+def test_convert_references_to_intervals_round_trip() -> None:
+    # Given references that are out of order, overlapping, and adjacent
+    references = bible.get_references("Romans 3:1-5, Genesis 1:1-3, Genesis 1:2-10")
+    references.extend(bible.get_references("Romans 3:6-8"))
+
+    # When sorting them
+    sorted_references = intervals.sort_references(references)
+
+    # Then they are in canonical order with the overlapping/adjacent ones merged
+    assert sorted_references == [
+        bible.NormalizedReference(bible.Book.GENESIS, 1, 1, 1, 10, bible.Book.GENESIS),
+        bible.NormalizedReference(bible.Book.ROMANS, 3, 1, 3, 8, bible.Book.ROMANS),
+    ]
+
+
+def test_sort_references_whole_bible() -> None:
+    # Given references to the first and last verses of the Bible and everything
+    # in between
+    references = bible.get_references("Genesis 1:1 - Revelation 22:21, Acts 2")
+
+    # When sorting them
+    sorted_references = intervals.sort_references(references)
+
+    # Then they collapse into a single reference
+    assert sorted_references == [
+        bible.NormalizedReference(
+            bible.Book.GENESIS,
+            1,
+            1,
+            22,
+            21,
+            bible.Book.REVELATION,
+        ),
+    ]
+
+
+def test_merge_intervals() -> None:
+    assert intervals.merge_intervals([(10, 12), (0, 3), (4, 5), (2, 2), (7, 8)]) == [
+        (0, 5),
+        (7, 8),
+        (10, 12),
+    ]
+
+
+def test_union_intervals() -> None:
+    assert intervals.union_intervals([(0, 3)], [(8, 9), (2, 5)], []) == [
+        (0, 5),
+        (8, 9),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("first", "second", "expected"),
+    [
+        ([(0, 10)], [(2, 3), (5, 12)], [(2, 3), (5, 10)]),
+        ([(0, 2), (4, 6)], [(3, 3)], []),
+        ([(0, 2), (4, 6)], [(0, 6)], [(0, 2), (4, 6)]),
+        ([], [(0, 6)], []),
+    ],
+)
+def test_intersect_intervals(
+    first: list[tuple[int, int]],
+    second: list[tuple[int, int]],
+    expected: list[tuple[int, int]],
+) -> None:
+    assert intervals.intersect_intervals(first, second) == expected
+    assert intervals.intersect_intervals(second, first) == expected
+
+
+@pytest.mark.parametrize(
+    ("first", "second", "expected"),
+    [
+        ([(0, 10)], [(2, 3), (5, 6)], [(0, 1), (4, 4), (7, 10)]),
+        ([(0, 10)], [(0, 10)], []),
+        ([(0, 2), (5, 8)], [(1, 6)], [(0, 0), (7, 8)]),
+        ([(3, 4)], [(0, 1), (8, 9)], [(3, 4)]),
+        ([(0, 4), (6, 9)], [], [(0, 4), (6, 9)]),
+    ],
+)
+def test_subtract_intervals(
+    first: list[tuple[int, int]],
+    second: list[tuple[int, int]],
+    expected: list[tuple[int, int]],
+) -> None:
+    assert intervals.subtract_intervals(first, second) == expected
+
+
+def test_subtract_intervals_references() -> None:
+    # Given a chapter and a few of the verses within it
+    chapter = _get_intervals("John 3")
+    verses = _get_intervals("John 3:16-18")
+
+    # When subtracting the verses from the chapter
+    difference = intervals.subtract_intervals(chapter, verses)
+
+    # Then the rest of the chapter remains
+    assert intervals.convert_intervals_to_references(difference) == [
+        bible.NormalizedReference(bible.Book.JOHN, 3, 1, 3, 15, bible.Book.JOHN),
+        bible.NormalizedReference(bible.Book.JOHN, 3, 19, 3, 36, bible.Book.JOHN),
+    ]
+
+
+def test_do_intervals_contain() -> None:
+    # Given the intervals for a couple of passages
+    passages = _get_intervals("Psalm 23, John 3:1-21")
+
+    # Then the intervals contain the verses within those passages only
+    assert intervals.do_intervals_contain(passages, _get_intervals("John 3:16")[0])
+    assert intervals.do_intervals_contain(passages, _get_intervals("Psalm 23:1-6")[0])
+    assert not intervals.do_intervals_contain(passages, _get_intervals("John 3")[0])
+    assert not intervals.do_intervals_contain(passages, _get_intervals("Gen 1:1")[0])
+
+
+def test_get_number_of_verses_in_intervals() -> None:
+    assert intervals.get_number_of_verses_in_intervals(_get_intervals("John 3")) == 36
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import dataclasses
+import pickle
+
+import pytest
+
+import pythonbible as bible
+
+
+def test_normalized_reference_is_immutable() -> None:
+    # Given a normalized reference
+    reference = bible.NormalizedReference(bible.Book.JOHN, 3, 16, 3, 16)
+
+    # When changing one of its fields
+    # Then a FrozenInstanceError is raised
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        reference.start_verse = 17  # type: ignore[misc]
+
+    assert not hasattr(reference, "__dict__")
+
+
+def test_normalized_reference_is_hashable() -> None:
+    # Given equal references from parsing the same text twice
+    references = bible.get_references("John 3:16, Romans 8:28")
+    same_references = bible.get_references("John 3:16, Romans 8:28")
+
+    # When using them in a set and as dictionary keys
+    unique_references = set(references + same_references)
+    counts = dict.fromkeys(references, 0)
+
+    # Then equal references are the same set member and dictionary key
+    assert unique_references == set(references)
+    assert len(counts) == len(references)
+
+
+def test_normalized_reference_ordinals() -> None:
+    # Given a reference that covers an entire book
+    reference = bible.NormalizedReference(bible.Book.GENESIS)
+
+    # When getting its ordinals
+    # Then they are the ordinals of the first and last verses of the book
+    assert reference.start_ordinal == 0
+    assert reference.end_ordinal == bible.get_verse_ordinal(1050026)
+
+
+def test_normalized_references_are_ordered_canonically() -> None:
+    # Given references that are out of order, including two that cover the same verse
+    references = [
+        bible.NormalizedReference(bible.Book.ROMANS, 8, 28, 8, 28),
+        bible.NormalizedReference(bible.Book.GENESIS, 1, 1, 1, 1, bible.Book.GENESIS),
+        bible.NormalizedReference(bible.Book.GENESIS, 1, 1, 1, 1),
+        bible.NormalizedReference(bible.Book.GENESIS, 1, None, 2, None),
+    ]
+
+    # When sorting them
+    sorted_references = sorted(references)
+
+    # Then they are sorted by their first and last verses, then by their fields
+    assert sorted_references == [
+        references[2],
+        references[1],
+        references[3],
+        references[0],
+    ]
+    assert references[2] < references[1] <= references[1]
+
+
+def test_invalid_normalized_references_are_ordered_by_their_fields(
+    invalid_reference: bible.NormalizedReference,
+) -> None:
+    # Given a valid reference and a reference to a chapter that doesn't exist
+    reference = bible.NormalizedReference(bible.Book.EXODUS, 1, 1, 1, 1)
+
+    # When sorting them
+    sorted_references = sorted([reference, invalid_reference])
+
+    # Then they are sorted by their fields
+    assert sorted_references == [invalid_reference, reference]
+
+
+def test_normalized_reference_pickle_round_trip() -> None:
+    # Given a reference whose ordinals have been computed
+    reference = bible.NormalizedReference(bible.Book.JOHN, 3, 16, 3, 18)
+    start_ordinal = reference.start_ordinal
+
+    # When pickling and unpickling it
+    unpickled_reference = pickle.loads(pickle.dumps(reference))  # noqa: S301
+
+    # Then the unpickled reference is equal and has the same ordinals
+    assert unpickled_reference == reference
+    assert unpickled_reference.start_ordinal == start_ordinal
+
+
+def test_normalized_reference_fields_exclude_the_ordinals() -> None:
+    # Given a reference whose ordinals have been computed
+    reference = bible.NormalizedReference(bible.Book.JOHN, 3, 16, 3, 18)
+    assert reference.end_ordinal
+
+    # When converting it to a tuple and a dictionary
+    # Then only the fields of the reference are included
+    assert [field.name for field in dataclasses.fields(reference)] == [
+        "book",
+        "start_chapter",
+        "start_verse",
+        "end_chapter",
+        "end_verse",
+        "end_book",
+    ]
+    assert dataclasses.astuple(reference) == (bible.Book.JOHN, 3, 16, 3, 18, None)
+    assert dataclasses.asdict(reference)["end_verse"] == 18
+    assert len(dataclasses.asdict(reference)) == 6
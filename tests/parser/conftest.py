@@ -3,6 +3,17 @@ from __future__ import annotations
 import pytest
 
 import pythonbible as bible
+from pythonbible import parser as parser_module
+
+
+@pytest.fixture(autouse=True, params=parser_module.PARSERS)
+def default_parser(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+) -> str:
+    # Run every parser test with each of the parsers.
+    monkeypatch.setattr(parser_module, "DEFAULT_PARSER", request.param)
+    return request.param
 
 
 @pytest.fixture
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+import pytest
+
 import pythonbible as bible
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 def test_get_references(text_with_reference: str) -> None:
     # Given a text string with at least one scripture reference
@@ -334,3 +341,114 @@ def test_book_abbreviations() -> None:
 
             if book != book.SONG_OF_SONGS:
                 assert expected == actual_period
+
+
+def test_cross_book_reference_to_numbered_book() -> None:
+    # Given a reference that spans from a book into a numbered book
+    reference_string = "Genesis 1 - 1 John 2"
+
+    # When parsing that reference
+    references = bible.get_references(reference_string)
+
+    # Then the end book is the numbered book rather than the unnumbered one
+    assert references == [
+        bible.NormalizedReference(
+            bible.Book.GENESIS,
+            1,
+            None,
+            2,
+            None,
+            bible.Book.JOHN_1,
+        ),
+    ]
+
+
+def test_get_references_parsers_find_the_same_references(
+    text_with_reference_complex: str,
+    roman_numeral_references: str,
+) -> None:
+    # Given texts with simple, compound, cross book, and roman numeral references
+    texts = [
+        text_with_reference_complex,
+        roman_numeral_references,
+        "Genesis 1:1-5 - Exodus 2, Jude 3, Gen. 2, Ps 1, 3-4:2 and 1 John",
+    ]
+
+    for text in texts:
+        # When parsing them with each of the parsers
+        references = bible.get_references(text, parser="regular_expression")
+        state_machine_references = bible.get_references(text, parser="state_machine")
+
+        # Then both parsers find the same references
+        assert state_machine_references == references
+
+
+def test_get_references_invalid_parser() -> None:
+    # Given a parser name that is not valid
+    # When parsing a text with that parser
+    # Then an InvalidBibleParserError is raised
+    with pytest.raises(bible.InvalidBibleParserError, match="not a valid parser"):
+        bible.get_references("Genesis 1:1", parser="recursive_descent")
+
+
+@pytest.mark.parametrize("parser", ["regular_expression", "state_machine"])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_get_references_batch(workers: int, parser: str) -> None:
+    # Given a list of texts, some with scripture references
+    texts = [
+        "Genesis 1:1-3 and Exodus 2",
+        "no references here",
+        "Psalm 23 and John 3:16",
+        "the Old Testament",
+        "Romans 8:28",
+    ] * 5
+    book_groups = {"Old Testament": bible.BookGroup.OLD_TESTAMENT.books}
+
+    # When parsing the texts in a batch (in small chunks)
+    references = bible.get_references_batch(
+        texts,
+        book_groups,
+        workers=workers,
+        chunksize=2,
+        parser=parser,
+    )
+
+    # Then the references of each text are returned in the same order as the texts
+    assert references == [
+        bible.get_references(text, book_groups, parser=parser) for text in texts
+    ]
+
+
+def test_iter_references_batch_is_lazy() -> None:
+    # Given a generator of texts
+    def _generate_texts() -> Iterator[str]:
+        yield "Genesis 1:1"
+        error_message = "the texts should be read lazily"
+        raise AssertionError(error_message)
+
+    # When iterating over the batch results in the current process
+    references = bible.iter_references_batch(_generate_texts(), workers=1)
+
+    # Then the first result is returned before the rest of the texts are read
+    assert next(references) == bible.get_references("Genesis 1:1")
+
+
+@pytest.mark.parametrize(("workers", "chunksize"), [(-1, 1), (0, 1), (1, 0)])
+def test_get_references_batch_invalid_arguments(workers: int, chunksize: int) -> None:
+    # Given an invalid number of workers or chunk size
+    # When parsing a batch of texts
+    # Then a ValueError is raised
+    with pytest.raises(ValueError, match="must be at least 1"):
+        bible.get_references_batch(
+            ["Genesis 1:1"],
+            workers=workers,
+            chunksize=chunksize,
+        )
+
+
+def test_iter_references_batch_invalid_parser() -> None:
+    # Given a parser name that is not valid
+    # When iterating over a batch parsed with that parser
+    # Then an InvalidBibleParserError is raised before any text is parsed
+    with pytest.raises(bible.InvalidBibleParserError, match="not a valid parser"):
+        bible.iter_references_batch(["Genesis 1:1"], parser="recursive_descent")
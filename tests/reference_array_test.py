@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import pickle
+
+import pythonbible as bible
+
+
+def test_reference_array_round_trip() -> None:
+    # Given references with explicit chapters and verses
+    references = bible.get_references("John 3:16-18, Genesis 1:1 - Exodus 2:3")
+
+    # When storing them in a ReferenceArray and converting them back
+    reference_array = bible.ReferenceArray(references)
+
+    # Then the same references come back, in order
+    assert len(reference_array) == len(references)
+    assert reference_array.to_references() == references
+    assert reference_array[1] == references[1]
+
+
+def test_reference_array_stores_covered_verses() -> None:
+    # Given a reference to an entire chapter
+    reference = bible.NormalizedReference(bible.Book.GENESIS, 1, None, 1, None)
+
+    # When appending it to a ReferenceArray
+    reference_array = bible.ReferenceArray()
+    reference_array.append(reference)
+
+    # Then the reference comes back with explicit verses
+    assert list(reference_array) == [
+        bible.NormalizedReference(bible.Book.GENESIS, 1, 1, 1, 31, bible.Book.GENESIS),
+    ]
+    assert list(reference_array.start_ordinals) == [0]
+    assert list(reference_array.end_ordinals) == [30]
+
+
+def test_reference_array_sort_dedupe_and_merge() -> None:
+    # Given a ReferenceArray with references that are out of order, repeated,
+    # overlapping, and adjacent
+    reference_array = bible.ReferenceArray.from_intervals(
+        [(10, 20), (0, 5), (10, 20), (6, 8), (15, 30)],
+    )
+
+    # When deduping, sorting, and merging copies of it
+    deduped = bible.ReferenceArray(reference_array)
+    deduped.dedupe()
+    sorted_array = bible.ReferenceArray(deduped)
+    sorted_array.sort()
+    merged = bible.ReferenceArray(reference_array)
+    merged.merge()
+
+    # Then the references are deduped, sorted, and merged
+    assert list(deduped.intervals()) == [(10, 20), (0, 5), (6, 8), (15, 30)]
+    assert list(sorted_array.intervals()) == [(0, 5), (6, 8), (10, 20), (15, 30)]
+    assert list(merged.intervals()) == [(0, 8), (10, 30)]
+
+
+def test_reference_array_counts() -> None:
+    # Given references that span chapters and books
+    references = bible.get_references(
+        "Genesis 1:1 - Exodus 2:3, Romans 8:28-9:2, Jude 3",
+    )
+
+    # When counting the books, chapters, and verses in a ReferenceArray of them
+    reference_array = bible.ReferenceArray(references)
+
+    # Then the counts are the same as for the list of references
+    assert bible.count_books(reference_array) == bible.count_books(references)
+    assert bible.count_chapters(reference_array) == bible.count_chapters(references)
+    assert bible.count_verses(reference_array) == bible.count_verses(references)
+
+
+def test_reference_array_pickle_round_trip() -> None:
+    # Given a ReferenceArray
+    reference_array = bible.ReferenceArray(bible.get_references("Romans 8:28"))
+
+    # When pickling and unpickling it
+    unpickled_array = pickle.loads(pickle.dumps(reference_array))  # noqa: S301
+
+    # Then the unpickled array is equal
+    assert unpickled_array == reference_array
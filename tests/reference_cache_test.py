@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import pythonbible as bible
+from pythonbible.reference_cache import ReferenceCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def reference_cache() -> Iterator[None]:
+    bible.configure_reference_cache(2)
+    bible.clear_reference_cache()
+    yield
+    bible.configure_reference_cache(0)
+    bible.clear_reference_cache()
+
+
+def _get_reference() -> bible.NormalizedReference:
+    return bible.NormalizedReference(bible.Book.JOHN, 3, 16, 3, 16, bible.Book.JOHN)
+
+
+def test_cache_is_disabled_by_default() -> None:
+    # Given a new cache
+    cache = ReferenceCache()
+
+    # When adding references to it
+    cache.add("John 3:16", [_get_reference()])
+
+    # Then nothing is cached
+    assert not cache.enabled
+    assert cache.get("John 3:16") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_references_are_evicted() -> None:
+    # Given a cache limited to two results that holds two results
+    cache = ReferenceCache(max_entries=2)
+    cache.add("John 3:16", [_get_reference()])
+    cache.add("Romans 8:28", [])
+
+    # When the first result is used and then a third result is added
+    cache.get("John 3:16")
+    cache.add("Genesis 1:1", [])
+
+    # Then the least recently used result is evicted
+    assert cache.get("Romans 8:28") is None
+    assert cache.get("John 3:16") == [_get_reference()]
+    assert cache.cache_info().evictions == 1
+
+
+def test_cached_references_are_not_shared_lists() -> None:
+    # Given a cache that holds a reference
+    cache = ReferenceCache(max_entries=1)
+    cache.add("John 3:16", [_get_reference()])
+
+    # When changing the returned list of references
+    cached_references = cache.get("John 3:16")
+    assert cached_references is not None
+    cached_references.append(_get_reference())
+
+    # Then the cached references are unchanged
+    assert cache.get("John 3:16") == [_get_reference()]
+
+
+def test_configure_rejects_negative_size() -> None:
+    # Given a cache
+    cache = ReferenceCache()
+
+    # When setting a negative size
+    # Then a ValueError is raised
+    with pytest.raises(ValueError, match="must not be negative"):
+        cache.configure(-1)
+
+
+@pytest.mark.usefixtures("reference_cache")
+def test_get_references_uses_the_cache() -> None:
+    # Given a text that is parsed several times
+    text = "For God so loved the world (John 3:16)."
+
+    # When getting its references with the cache enabled
+    references = [bible.get_references(text) for _ in range(4)]
+
+    # Then the text is only parsed once, and the hit ratio reflects the cache hits
+    info = bible.get_reference_cache_info()
+    assert info.misses == 1
+    assert info.hits == 3
+    assert info.hit_ratio == 0.75
+    assert all(reference == [_get_reference()] for reference in references)
+
+
+@pytest.mark.usefixtures("reference_cache")
+def test_get_references_cache_depends_on_book_groups() -> None:
+    # Given a text with a book group
+    text = "the Gospels"
+
+    # When getting its references with and without book groups
+    without_book_groups = bible.get_references(text)
+    with_book_groups = bible.get_references(text, bible.BOOK_GROUPS)
+
+    # Then the results are cached separately
+    assert without_book_groups == []
+    assert with_book_groups != []
+    assert bible.get_reference_cache_info().misses == 2
+
+
+@pytest.mark.usefixtures("reference_cache")
+def test_normalize_reference_uses_the_cache() -> None:
+    # Given a reference that is normalized twice
+    # When normalizing it with the cache enabled
+    first = bible.normalize_reference("John 3:16")
+    second = bible.normalize_reference("John 3:16")
+
+    # Then the second result comes from the cache
+    assert second == first == [_get_reference()]
+    assert bible.get_reference_cache_info().hits == 1
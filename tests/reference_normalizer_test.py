@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pythonbible as bible
+from pythonbible import parser
+from pythonbible import reference_normalizer
+from pythonbible.reference_normalizer import match_book
+from pythonbible.reference_normalizer import normalize_reference_text
+
+
+def test_match_book() -> None:
+    # Given a text that starts with an abbreviated book name
+    text = "1 Cor. 13:4-7"
+
+    # When matching the book at the start of the text
+    book_match = match_book(text)
+
+    # Then the book and the end of its name are returned
+    assert book_match == (bible.Book.CORINTHIANS_1, len("1 Cor."))
+
+
+def test_match_book_not_at_start() -> None:
+    # Given a text that doesn't start with a book name
+    # When matching the book at the start of the text
+    # Then no book is returned
+    assert match_book("See John 3:16") is None
+
+
+def test_normalize_reference_text_spans_books() -> None:
+    # Given a reference that spans two books
+    reference = "Genesis 50 - Exodus 2"
+
+    # When normalizing it
+    references = normalize_reference_text(reference)
+
+    # Then it is one reference from the first book to the second
+    assert references == [
+        bible.NormalizedReference(
+            bible.Book.GENESIS,
+            50,
+            None,
+            2,
+            None,
+            bible.Book.EXODUS,
+        ),
+    ]
+
+
+def test_separators_are_importable_from_the_parser() -> None:
+    # Given the separators that used to be defined in the parser module
+    # When importing them from the parser module
+    # Then they are the separators of the reference normalizer
+    assert (parser.COLON, parser.COMMA, parser.DASH, parser.PERIOD) == (
+        reference_normalizer.COLON,
+        reference_normalizer.COMMA,
+        reference_normalizer.DASH,
+        reference_normalizer.PERIOD,
+    )
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import pythonbible as bible
+from tests.conftest import build_bible
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+VERSES: dict[int, str] = {
+    1001001: "In the beginning God created the heaven and the earth.",
+    1001003: "And God said, Let there be light: and there was light.",
+    43001001: "In the beginning was the Word, and the Word was with God.",
+    43003016: "For God so loved the world, that he gave his only begotten Son.",
+    45008028: "And we know that all things work together for good.",
+}
+
+
+@pytest.fixture(scope="module")
+def search_index() -> bible.SearchIndex:
+    return bible.build_search_index(build_bible(VERSES, bible.Version.KING_JAMES))
+
+
+def test_search_term(search_index: bible.SearchIndex) -> None:
+    # Given a search index
+    # When searching for a word with a different case
+    verse_ids = search_index.search_term("GOD")
+
+    # Then the verses that contain the word are returned in canonical order
+    assert verse_ids == [1001001, 1001003, 43001001, 43003016]
+    assert search_index.search_term("Jesus") == []
+    assert "god" in search_index
+
+
+def test_search_term_in_books_and_book_groups(search_index: bible.SearchIndex) -> None:
+    # Given a search index
+    # When searching for a word in only some books and book groups
+    in_genesis = search_index.search_term("God", books=[bible.Book.GENESIS])
+    in_gospels = search_index.search_term(
+        "God",
+        book_groups=[bible.BookGroup.NEW_TESTAMENT_GOSPELS],
+    )
+
+    # Then only the verses in those books are returned
+    assert in_genesis == [1001001, 1001003]
+    assert in_gospels == [43001001, 43003016]
+
+
+def test_search_phrase(search_index: bible.SearchIndex) -> None:
+    # Given a search index
+    # When searching for phrases
+    # Then only the verses with the words next to each other in order are returned
+    assert search_index.search_phrase("in the beginning") == [1001001, 43001001]
+    assert search_index.search_phrase("the Word, and") == [43001001]
+    assert search_index.search_phrase("beginning the") == []
+    assert search_index.search_phrase("God so loved") == [43003016]
+
+
+def test_search_prefix(search_index: bible.SearchIndex) -> None:
+    # Given a search index
+    # When searching for words that start with a prefix
+    verse_ids = search_index.search_prefix("wor")
+
+    # Then the verses with any word that starts with the prefix are returned
+    assert verse_ids == [43001001, 43003016, 45008028]
+    assert search_index.search_prefix("wor", books=[bible.Book.ROMANS]) == [45008028]
+
+
+def test_html_tags_are_not_indexed() -> None:
+    # Given a search index of an HTML Bible
+    search_index = bible.build_search_index(
+        build_bible(VERSES, bible.Version.KING_JAMES, is_html=True),
+    )
+
+    # When searching for a tag name and a phrase
+    # Then the tags are ignored
+    assert search_index.search_term("p") == []
+    assert search_index.search_phrase("the earth") == [1001001]
+
+
+def test_save_and_load_round_trip(
+    search_index: bible.SearchIndex,
+    tmp_path: Path,
+) -> None:
+    # Given a search index saved to a file
+    path = search_index.save(tmp_path / "plain_text.pyindex")
+
+    # When loading it
+    loaded_search_index = bible.load_search_index(path)
+
+    # Then it has the same version, words, and search results
+    assert loaded_search_index.version == bible.Version.KING_JAMES
+    assert len(loaded_search_index) == len(search_index)
+    assert loaded_search_index.search_phrase("in the beginning") == [1001001, 43001001]
+    assert loaded_search_index.search_prefix("be") == search_index.search_prefix("be")
+
+
+def test_load_invalid_search_index(tmp_path: Path) -> None:
+    # Given a file that is not a search index file
+    path = tmp_path / "plain_text.pyindex"
+    path.write_bytes(b"not a search index file")
+
+    # When loading it
+    # Then an InvalidSearchIndexError is raised
+    with pytest.raises(bible.InvalidSearchIndexError):
+        bible.load_search_index(path)
@@ -24,6 +24,14 @@ def test_is_valid_verse_id_string(verse_id: int) -> None:
     assert not bible.is_valid_verse_id(str(verse_id))  # type: ignore[arg-type]
 
 
+def test_is_valid_verse_id_float() -> None:
+    # Given a verse id that is a float
+    # When we test to see if it is valid
+    # Then the result is True, since it equals a valid verse id
+    assert bible.is_valid_verse_id(1001001.0)  # type: ignore[arg-type]
+    assert not bible.is_valid_verse_id(1001001.5)  # type: ignore[arg-type]
+
+
 def test_is_valid_verse_id_invalid(invalid_verse_id: int) -> None:
     # Given an invalid verse id
     # When we test to see if it is valid
@@ -31,6 +39,17 @@ def test_is_valid_verse_id_invalid(invalid_verse_id: int) -> None:
     assert not bible.is_valid_verse_id(invalid_verse_id)
 
 
+def test_is_valid_verse_id_matches_verse_ids() -> None:
+    # Given every verse id along with the ids just before and after each one
+    valid_verse_ids = set(bible.verses.VERSE_IDS)
+
+    for verse_id in bible.verses.VERSE_IDS:
+        for candidate in (verse_id - 1, verse_id, verse_id + 1):
+            # When we test to see if it is valid
+            # Then the result is True only for the known verse ids
+            assert bible.is_valid_verse_id(candidate) == (candidate in valid_verse_ids)
+
+
 def test_is_valid_reference(reference: bible.NormalizedReference) -> None:
     # Given a valid normalized reference tuple
     # When we test to see if it is valid
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import pytest
+
+import pythonbible as bible
+
+np = pytest.importorskip("numpy")
+vector = pytest.importorskip("pythonbible.vector")
+
+VERSE_IDS = list(bible.verses.VERSE_IDS)
+
+
+def test_get_book_chapter_verse() -> None:
+    # Given all of the verse ids
+    # When getting the book, chapter, and verse numbers for all of them at once
+    books, chapters, verses = vector.get_book_chapter_verse(VERSE_IDS)
+
+    # Then the results match the scalar function
+    for index, verse_id in enumerate(VERSE_IDS):
+        book, chapter, verse = bible.get_book_chapter_verse(verse_id)
+        assert (books[index], chapters[index], verses[index]) == (
+            book.value,
+            chapter,
+            verse,
+        )
+
+
+def test_get_book_chapter_verse_invalid(invalid_verse_id: int) -> None:
+    # Given a list of verse ids that includes an invalid verse id
+    # When getting the book, chapter, and verse numbers
+    # Then an error is raised for the invalid verse id.
+    with pytest.raises(bible.InvalidVerseError, match=str(invalid_verse_id)):
+        vector.get_book_chapter_verse([1001001, invalid_verse_id])
+
+
+def test_is_valid_verse_id() -> None:
+    # Given every verse id along with the ids just before and after each one
+    verse_ids = np.array(VERSE_IDS)
+    candidates = np.concatenate([verse_ids - 1, verse_ids, verse_ids + 1, [0, -1]])
+
+    # When validating all of them at once
+    mask = vector.is_valid_verse_id(candidates)
+
+    # Then the mask matches the scalar function
+    assert mask.tolist() == [bible.is_valid_verse_id(int(x)) for x in candidates]
+
+
+def test_scalar_is_valid_verse_id_numpy_integer() -> None:
+    # Given a verse id that is a NumPy integer
+    # When validating it with the scalar function
+    # Then the result is the same as for the int verse id
+    assert bible.is_valid_verse_id(np.int64(1001001))
+    assert not bible.is_valid_verse_id(np.int64(1001000))
+
+
+def test_get_verse_ordinals() -> None:
+    # Given all of the verse ids
+    # When getting their ordinals and converting the ordinals back to verse ids
+    ordinals = vector.get_verse_ordinals(VERSE_IDS)
+
+    # Then the ordinals are the positions of the verse ids and they round trip
+    assert ordinals.tolist() == list(range(len(VERSE_IDS)))
+    assert vector.get_verse_ids(ordinals).tolist() == VERSE_IDS
+
+
+@pytest.mark.parametrize("ordinal", [-1, len(VERSE_IDS)])
+def test_get_verse_ids_out_of_range(ordinal: int) -> None:
+    # Given an ordinal outside the Bible
+    # When getting its verse id
+    # Then an IndexError is raised rather than wrapping around
+    with pytest.raises(IndexError):
+        vector.get_verse_ids([0, ordinal])
+
+
+def test_get_verse_ordinals_invalid(invalid_verse_id: int) -> None:
+    with pytest.raises(bible.InvalidVerseError):
+        vector.get_verse_ordinals([invalid_verse_id])
+
+
+def test_expand_verse_id_ranges() -> None:
+    # Given some ranges of verse ids, including one that crosses books and one that
+    # is empty
+    references = bible.get_references("Genesis 1:30-2:2, Malachi 4:5 - Matthew 1:2")
+    starts = [1001030, 39004005, 1001002]
+    ends = [1002002, 40001002, 1001001]
+
+    # When expanding the ranges
+    verse_ids = vector.expand_verse_id_ranges(starts, ends)
+
+    # Then the verse ids match the scalar conversion
+    assert verse_ids.tolist() == bible.convert_references_to_verse_ids(references)
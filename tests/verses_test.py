@@ -87,6 +87,18 @@ def test_get_book_chapter_verse(
     assert actual_verse == verse
 
 
+def test_get_book_chapter_verse_float() -> None:
+    # Given a verse id that is a float
+    # When getting the book, chapter, and verse
+    # Then they are the book, chapter, and verse of the verse id it equals
+    verse_id = 1001001.0
+    book_chapter_verse = bible.get_book_chapter_verse(verse_id)  # type: ignore[arg-type]
+    assert book_chapter_verse == (bible.Book.GENESIS, 1, 1)
+
+    with pytest.raises(bible.InvalidVerseError):
+        bible.get_book_chapter_verse(1001001.5)  # type: ignore[arg-type]
+
+
 def test_get_book_chapter_verse_invalid(invalid_verse_id: int) -> None:
     # Given an invalid verse id
     # When attempting to get the book, chapter, and verse
@@ -120,3 +132,85 @@ def test_get_verse(verse_id: int) -> None:
 
     # Then the resulting verse number matching the expected verse number (1)
     assert verse_number == 1
+
+
+def test_get_verse_ordinal() -> None:
+    # Given the list of all verse ids
+    # When getting the ordinal for each verse id
+    # Then the ordinal is the index of the verse id in the list
+    for ordinal, verse_id in enumerate(bible.verses.VERSE_IDS):
+        assert bible.get_verse_ordinal(verse_id) == ordinal
+
+
+@pytest.mark.parametrize("verse_id", [0, 1000001, 1001000, 1001032, 1051001, 73001001])
+def test_get_verse_ordinal_invalid(verse_id: int) -> None:
+    # Given an invalid verse id
+    # When attempting to get the ordinal for that verse id
+    # Then an error is raised.
+    with pytest.raises(bible.InvalidVerseError):
+        bible.get_verse_ordinal(verse_id)
+
+
+def test_ordinal_tables() -> None:
+    # Given the list of all verse ids
+    # When getting the verse id and the book, chapter, and verse for each ordinal
+    # Then they match the verse id at that ordinal
+    for ordinal, verse_id in enumerate(bible.verses.VERSE_IDS):
+        assert bible.get_verse_id_by_ordinal(ordinal) == verse_id
+        assert bible.get_book_chapter_verse_by_ordinal(
+            ordinal,
+        ) == bible.get_book_chapter_verse(verse_id)
+
+
+def test_get_chapter_ordinals() -> None:
+    # Given the ordinal of a verse in the middle of a chapter
+    ordinal: int = bible.get_verse_ordinal(bible.get_verse_id(bible.Book.JOHN, 3, 16))
+
+    # When getting the ordinals of its chapter
+    start_ordinal, end_ordinal = bible.get_chapter_ordinals(ordinal)
+
+    # Then they are the ordinals of the first and last verses of the chapter
+    assert bible.get_verse_id_by_ordinal(start_ordinal) == 43003001
+    assert bible.get_verse_id_by_ordinal(end_ordinal) == 43003036
+
+
+def test_get_chapter_index() -> None:
+    # Given the first and last chapters of the Bible and the first chapter of Exodus
+    # When getting their chapter indexes
+    # Then they are their positions among all the chapters of the Bible
+    assert bible.get_chapter_index(bible.Book.GENESIS, 1) == 0
+    assert bible.get_chapter_index(bible.Book.EXODUS, 1) == 50
+    assert bible.get_chapter_index(bible.Book.REVELATION, 22) == 1188
+
+
+@pytest.mark.parametrize("chapter", [0, 51])
+def test_get_chapter_index_invalid(chapter: int) -> None:
+    # Given a chapter that isn't in the book of Genesis
+    # When attempting to get its chapter index
+    # Then an error is raised
+    with pytest.raises(bible.InvalidChapterError, match="not a valid chapter number"):
+        bible.get_chapter_index(bible.Book.GENESIS, chapter)
+
+
+def test_get_chapter_index_by_ordinal() -> None:
+    # Given the ordinal of a verse
+    ordinal: int = bible.get_verse_ordinal(bible.get_verse_id(bible.Book.JOHN, 3, 16))
+
+    # When getting the chapter index of its chapter
+    # Then it is the chapter index of the verse's book and chapter
+    assert bible.get_chapter_index_by_ordinal(ordinal) == bible.get_chapter_index(
+        bible.Book.JOHN,
+        3,
+    )
+
+
+@pytest.mark.parametrize("ordinal", [-1, len(bible.verses.VERSE_IDS)])
+def test_get_verse_id_by_ordinal_invalid(ordinal: int) -> None:
+    # Given an ordinal outside the Bible
+    # When attempting to get the verse for that ordinal
+    # Then an error is raised.
+    with pytest.raises(bible.InvalidVerseError, match="is not a valid verse ordinal"):
+        bible.get_verse_id_by_ordinal(ordinal)
+
+    with pytest.raises(bible.InvalidVerseError, match="is not a valid verse ordinal"):
+        bible.get_chapter_index_by_ordinal(ordinal)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+import pythonbible as bible
+from pythonbible import versification
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# The Hebrew numbering of Joel and Malachi, which differs from the standard one.
+HEBREW_VERSE_COUNTS = {
+    **bible.verses.MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER,
+    bible.Book.JOEL: [20, 27, 5, 21],
+    bible.Book.MALACHI: [14, 17, 24],
+}
+HEBREW_RANGES = [
+    (29002028, 29002032, 29003001),
+    (29003001, 29003021, 29004001),
+    (39004001, 39004006, 39003019),
+]
+
+
+@pytest.fixture
+def hebrew() -> Iterator[None]:
+    registries: tuple[dict[Any, Any], ...] = (
+        versification._VERSE_COUNTS,  # noqa: SLF001
+        versification._VERSION_VERSIFICATIONS,  # noqa: SLF001
+        versification._MAPPING_RANGES,  # noqa: SLF001
+        versification._VERSIFICATIONS,  # noqa: SLF001
+        versification._MAPPINGS,  # noqa: SLF001
+    )
+    saved = [registry.copy() for registry in registries]
+    bible.add_versification(
+        "hebrew",
+        lambda: HEBREW_VERSE_COUNTS,
+        [bible.Version.MASORETIC_TEXT],
+    )
+    bible.add_versification_mapping("standard", "hebrew", HEBREW_RANGES)
+
+    yield
+
+    for registry, contents in zip(registries, saved, strict=True):
+        registry.clear()
+        registry.update(contents)
+
+
+def test_standard_versification() -> None:
+    # Given a version that has not been assigned a versification
+    # When getting its versification
+    standard = bible.get_versification(bible.Version.KING_JAMES)
+
+    # Then it has the standard verse ids and ordinals
+    assert standard is bible.get_versification()
+    assert standard.get_all_verse_ids() == bible.verses.get_all_verse_ids()
+    assert standard.get_verse_ordinal(43003016) == bible.get_verse_ordinal(43003016)
+    assert standard.get_number_of_verses(bible.Book.JOHN, 3) == 36
+
+
+@pytest.mark.usefixtures("hebrew")
+def test_versification_is_built_lazily_per_version() -> None:
+    # Given a registered versification that has not been used
+    assert "hebrew" not in versification._VERSIFICATIONS  # noqa: SLF001
+
+    # When getting the versification of a version that uses it
+    hebrew = bible.get_versification(bible.Version.MASORETIC_TEXT)
+
+    # Then it is built with its own chapters, verses, and ordinals
+    assert hebrew.name == "hebrew"
+    assert hebrew.get_number_of_chapters(bible.Book.MALACHI) == 3
+    assert hebrew.get_number_of_verses(bible.Book.MALACHI, 3) == 24
+    assert 39003024 in hebrew
+    assert 39004001 not in hebrew
+    assert hebrew.get_verse_id_by_ordinal(hebrew.get_verse_ordinal(29004021)) == (
+        29004021
+    )
+
+    with pytest.raises(bible.InvalidChapterError):
+        hebrew.get_number_of_verses(bible.Book.MALACHI, 4)
+
+
+@pytest.mark.usefixtures("hebrew")
+def test_map_verse_ids_between_versifications() -> None:
+    # Given verses that are numbered differently in the Hebrew versification
+    verse_ids = [29002027, 29002028, 29003001, 39003018, 39004006]
+
+    # When mapping them to the Hebrew versification and back
+    hebrew_verse_ids = bible.map_verse_ids(
+        verse_ids,
+        bible.Version.KING_JAMES,
+        bible.Version.MASORETIC_TEXT,
+    )
+    standard_verse_ids = bible.map_verse_ids(
+        hebrew_verse_ids,
+        bible.Version.MASORETIC_TEXT,
+        bible.Version.KING_JAMES,
+    )
+
+    # Then the verses are renumbered and mapped back to the original verse ids
+    assert hebrew_verse_ids == [29002027, 29003001, 29004001, 39003018, 39003024]
+    assert standard_verse_ids == verse_ids
+
+
+@pytest.mark.usefixtures("hebrew")
+def test_converter_uses_the_versification_of_the_version() -> None:
+    # Given a reference to the last chapter of Malachi in the Hebrew versification
+    reference = bible.NormalizedReference(bible.Book.MALACHI, 3, 1, 3, None)
+
+    # When converting it to verse ids and back for a version that uses it
+    verse_ids = bible.convert_reference_to_verse_ids(
+        reference,
+        bible.Version.MASORETIC_TEXT,
+    )
+    references = bible.convert_verse_ids_to_references(
+        list(verse_ids),
+        bible.Version.MASORETIC_TEXT,
+    )
+
+    # Then the chapter has its Hebrew number of verses
+    assert len(verse_ids) == 24
+    assert references == [
+        bible.NormalizedReference(bible.Book.MALACHI, 3, 1, 3, 24, bible.Book.MALACHI),
+    ]
+
+
+def test_unknown_versification() -> None:
+    # Given a name that is not a registered versification
+    # When getting the versification
+    # Then a ValueError is raised
+    with pytest.raises(ValueError, match="not a registered versification"):
+        bible.get_versification("unknown")